@@ -1,16 +1,75 @@
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import Depends, Header, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 import models
 from database import get_db
 
 
-def get_current_user(
-    x_user_id: int = Header(..., alias="X-User-Id"),
-    db: Session = Depends(get_db),
-) -> models.User:
+class PrincipalCache:
+    """
+    Bounded LRU of validated principals with a per-entry TTL.
+
+    Only column values are cached; each hit is merged into the request's
+    session without a query, so callers still receive a session-bound User.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user: models.User) -> None:
+        values = {column.key: getattr(user, column.key) for column in models.User.__table__.columns}
+        with self._lock:
+            self._entries[user.id] = (time.monotonic() + self.ttl, values)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+principal_cache = PrincipalCache()
+
+
+def _authenticate(x_user_id: int, db: Session) -> models.User:
+    cached = principal_cache.get(x_user_id)
+    if cached is not None:
+        user = models.User(**cached)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
     user = (
         db.query(models.User)
         .filter(models.User.id == x_user_id, models.User.owner_id == x_user_id)
@@ -18,20 +77,23 @@ def get_current_user(
     )
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication")
+    principal_cache.put(user)
     return user
 
 
+def get_current_user(
+    x_user_id: Optional[int] = Header(None, alias="X-User-Id"),
+    db: Session = Depends(get_db),
+) -> models.User:
+    if x_user_id is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authentication required")
+    return _authenticate(x_user_id, db)
+
+
 def get_optional_user(
     x_user_id: Optional[int] = Header(None, alias="X-User-Id"),
     db: Session = Depends(get_db),
 ) -> Optional[models.User]:
     if x_user_id is None:
         return None
-    user = (
-        db.query(models.User)
-        .filter(models.User.id == x_user_id, models.User.owner_id == x_user_id)
-        .first()
-    )
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication")
-    return user
\ No newline at end of file
+    return _authenticate(x_user_id, db)
@@ -0,0 +1,50 @@
+"""
+Importing a meeting transcript: one ``POST /notes/`` per note versus ``POST /notes/bulk``.
+
+The single-request path is timed on ``--sample`` notes and extrapolated to
+``--rows``; the bulk path imports all ``--rows`` notes in one request.
+
+    python -m benchmarks.bulk_import --rows 10000
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from benchmarks.common import seed_tenant, use_database
+from main import app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--sample", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = use_database(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        owner_id = seed_tenant(engine, meetings=1, attendees=1)
+        headers = {"X-User-Id": str(owner_id)}
+        with TestClient(app) as client:
+            meeting_id = client.get("/meetings/", headers=headers).json()[0]["id"]
+            notes = [{"content": f"Transcript line {index}", "meeting_id": meeting_id} for index in range(args.rows)]
+
+            started = time.perf_counter()
+            for note in notes[: args.sample]:
+                client.post("/notes/", json=note, headers=headers).raise_for_status()
+            single_rate = args.sample / (time.perf_counter() - started)
+
+            started = time.perf_counter()
+            client.post("/notes/bulk", json=notes, headers=headers).raise_for_status()
+            bulk_elapsed = time.perf_counter() - started
+
+    bulk_rate = args.rows / bulk_elapsed
+    print(f"single POST /notes/: {single_rate:,.0f} notes/s ({args.rows / single_rate:.1f} s for {args.rows:,} rows, extrapolated)")
+    print(f"POST /notes/bulk:    {bulk_rate:,.0f} notes/s ({bulk_elapsed:.2f} s for {args.rows:,} rows)")
+    print(f"speedup: {bulk_rate / single_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Shared helpers for the standalone benchmarks in this package.
+
+Run benchmarks from the repository root, e.g. ``python -m benchmarks.concurrency``.
+"""
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, Sequence
+
+import uvicorn
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+import database
+import models
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def use_database(url: str, profile: str = database.DATABASE_PROFILE) -> Engine:
+    """
+    Point the application at ``url`` and create the schema there.
+    """
+    engine = database.create_engine_for_profile(url, profile)
+    models.Base.metadata.create_all(bind=engine)
+    database.engine = engine
+    database.SessionLocal = sessionmaker(bind=engine, **database.SESSION_OPTIONS)
+    return engine
+
+
+def add_statement_latency(engine: Engine, seconds: float) -> None:
+    """
+    Sleep before every statement to emulate a database reached over the network.
+    """
+    if seconds <= 0:
+        return
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        time.sleep(seconds)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def seed_tenant(
+        engine: Engine,
+        meetings: int = 100,
+        attendees: int = 10,
+        notes_per_meeting: int = 0,
+        tasks_per_meeting: int = 0,
+) -> int:
+    """
+    Insert a synthetic tenant with bulk statements and return the owner's user id.
+    """
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        owner_id = conn.execute(
+            insert(models.User).values(name="Benchmark Owner", email=f"owner-{time.time_ns()}@example.com")
+        ).inserted_primary_key[0]
+        conn.execute(models.User.__table__.update().where(models.User.id == owner_id).values(owner_id=owner_id))
+        user_rows = [
+            {"name": f"Attendee {index}", "email": f"attendee-{owner_id}-{index}@example.com", "owner_id": owner_id}
+            for index in range(attendees)
+        ]
+        if user_rows:
+            conn.execute(insert(models.User), user_rows)
+        attendee_ids = [
+            row[0]
+            for row in conn.execute(
+                models.User.__table__.select()
+                .with_only_columns(models.User.id)
+                .where(models.User.owner_id == owner_id, models.User.id != owner_id)
+            )
+        ]
+        meeting_rows = [
+            {
+                "title": f"Meeting {index}",
+                "description": "Synthetic benchmark meeting",
+                "scheduled_time": now + timedelta(hours=index),
+                "created_at": now,
+                "owner_id": owner_id,
+            }
+            for index in range(meetings)
+        ]
+        if meeting_rows:
+            conn.execute(insert(models.Meeting), meeting_rows)
+        meeting_ids = [
+            row[0]
+            for row in conn.execute(
+                models.Meeting.__table__.select()
+                .with_only_columns(models.Meeting.id)
+                .where(models.Meeting.owner_id == owner_id)
+            )
+        ]
+        if meeting_ids and attendee_ids:
+            conn.execute(
+                insert(models.meeting_users),
+                [{"meeting_id": meeting_id, "user_id": user_id} for meeting_id in meeting_ids for user_id in attendee_ids],
+            )
+        if notes_per_meeting:
+            conn.execute(
+                insert(models.Note),
+                [
+                    {"content": f"Note {index} for meeting {meeting_id}", "meeting_id": meeting_id,
+                     "created_at": now, "owner_id": owner_id}
+                    for meeting_id in meeting_ids
+                    for index in range(notes_per_meeting)
+                ],
+            )
+        if tasks_per_meeting:
+            conn.execute(
+                insert(models.Task),
+                [
+                    {"title": f"Task {index}", "description": "Synthetic task", "status": "pending",
+                     "due_meeting_id": meeting_id, "created_at": now, "owner_id": owner_id}
+                    for meeting_id in meeting_ids
+                    for index in range(tasks_per_meeting)
+                ],
+            )
+        models.repair_meeting_counters(conn, owner_id)
+    return owner_id
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def serve(app, port: int = 0) -> Iterator[str]:
+    """
+    Run ``app`` on a local uvicorn server in a background thread and yield its base URL.
+    """
+    port = port or free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
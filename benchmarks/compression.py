@@ -0,0 +1,105 @@
+"""
+Bytes on the wire, time to first byte and total time of large responses over
+a local uvicorn server, per ``Accept-Encoding`` and with list arrays sent
+whole versus in chunks of ``pagination.JSON_CHUNK_ROWS`` rows:
+
+- ``GET /meetings/`` for a tenant of ``--meetings`` meetings with
+  ``--attendees`` attendees each
+- ``GET /meetings/{id}`` for a meeting with ``--notes`` notes of
+  ``--note-length`` characters
+
+The tool result cache stays warm, so timings cover encoding, compression
+and transfer rather than the queries.
+
+    python -m benchmarks.compression --meetings 5000 --attendees 10
+"""
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+from sqlalchemy import insert
+
+import models
+import pagination
+from benchmarks.common import percentile, seed_tenant, serve, use_database
+from main import app
+
+ENCODINGS = ("identity", "gzip", "deflate")
+
+
+def fetch(client: httpx.Client, path: str, headers: dict):
+    """
+    Return (bytes on the wire, seconds to the first body byte, total seconds).
+    """
+    started = time.perf_counter()
+    first_byte = None
+    size = 0
+    with client.stream("GET", path, headers=headers) as response:
+        response.raise_for_status()
+        for chunk in response.iter_raw():
+            if first_byte is None:
+                first_byte = time.perf_counter() - started
+            size += len(chunk)
+    return size, first_byte, time.perf_counter() - started
+
+
+def measure(client: httpx.Client, label: str, path: str, headers: dict, requests: int) -> None:
+    for encoding in ENCODINGS:
+        request_headers = {**headers, "Accept-Encoding": encoding}
+        fetch(client, path, request_headers)
+        samples = [fetch(client, path, request_headers) for _ in range(requests)]
+        first_bytes = [sample[1] for sample in samples]
+        totals = [sample[2] for sample in samples]
+        print(
+            f"{label:<34} {encoding:<9} {samples[-1][0] / 1024:9.0f} KiB  "
+            f"TTFB p50 {percentile(first_bytes, 50) * 1000:7.1f} ms  "
+            f"total p50 {percentile(totals, 50) * 1000:7.1f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=5000)
+    parser.add_argument("--attendees", type=int, default=10)
+    parser.add_argument("--notes", type=int, default=200)
+    parser.add_argument("--note-length", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = use_database(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        owner_id = seed_tenant(engine, meetings=args.meetings, attendees=args.attendees)
+        with engine.begin() as conn:
+            meeting_id = conn.execute(
+                models.Meeting.__table__.select()
+                .with_only_columns(models.Meeting.id)
+                .where(models.Meeting.owner_id == owner_id)
+                .limit(1)
+            ).scalar()
+            words = "decision follow-up owner deadline budget review "
+            conn.execute(
+                insert(models.Note),
+                [
+                    {"content": (f"{index} " + words * args.note_length)[:args.note_length], "meeting_id": meeting_id,
+                     "created_at": datetime.utcnow(), "owner_id": owner_id}
+                    for index in range(args.notes)
+                ],
+            )
+            models.repair_meeting_counters(conn, owner_id)
+        headers = {"X-User-Id": str(owner_id)}
+
+        chunk_rows = pagination.JSON_CHUNK_ROWS
+        with serve(app) as base_url, httpx.Client(base_url=base_url, timeout=None) as client:
+            pagination.JSON_CHUNK_ROWS = sys.maxsize
+            measure(client, "GET /meetings/ (whole)", "/meetings/", headers, args.requests)
+            pagination.JSON_CHUNK_ROWS = chunk_rows
+            measure(client, f"GET /meetings/ ({chunk_rows}-row chunks)", "/meetings/", headers, args.requests)
+            measure(client, "GET /meetings/{id}", f"/meetings/{meeting_id}", headers, args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Throughput of the API under many parallel clients on a single uvicorn worker.
+
+Each statement is delayed by ``--latency-ms`` to emulate a networked database;
+handlers that block the event loop serialize on that delay, handlers running in
+the threadpool overlap it.
+
+    python -m benchmarks.concurrency --clients 100 --requests 10 --latency-ms 5
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.common import add_statement_latency, percentile, seed_tenant, serve, use_database
+from main import app
+
+
+async def _client(base_url: str, headers: dict, path: str, requests: int, latencies: list) -> None:
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=120) as client:
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+
+async def _run(base_url: str, headers: dict, path: str, clients: int, requests: int) -> list:
+    latencies: list = []
+    await asyncio.gather(*(_client(base_url, headers, path, requests, latencies) for _ in range(clients)))
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=10, help="Requests per client.")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--path", default="/meetings/?limit=20")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = use_database(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        owner_id = seed_tenant(engine, meetings=200, attendees=5)
+        add_statement_latency(engine, args.latency_ms / 1000)
+        headers = {"X-User-Id": str(owner_id)}
+        with serve(app) as base_url:
+            started = time.perf_counter()
+            latencies = asyncio.run(_run(base_url, headers, args.path, args.clients, args.requests))
+            elapsed = time.perf_counter() - started
+
+    total = len(latencies)
+    print(f"GET {args.path} clients={args.clients} requests={total} latency/statement={args.latency_ms}ms")
+    print(f"throughput: {total / elapsed:.1f} req/s")
+    print(f"p50: {percentile(latencies, 50) * 1000:.1f} ms  p99: {percentile(latencies, 99) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
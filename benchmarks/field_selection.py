@@ -0,0 +1,54 @@
+"""
+Response size and latency of ``GET /meetings/`` on a large tenant with the
+full schema versus sparse ``fields=`` projections. The tool result cache is
+cleared before every request so each one queries and serializes.
+
+    python -m benchmarks.field_selection --meetings 10000
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from benchmarks.common import percentile, seed_tenant, use_database
+from main import app
+from service_mesh import result_cache
+
+VARIANTS = {
+    "full schema": None,
+    "fields=title,scheduled_time,tasks_count": "title,scheduled_time,tasks_count",
+    "fields=title,attendees": "title,attendees",
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=10_000)
+    parser.add_argument("--attendees", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = use_database(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        owner_id = seed_tenant(engine, meetings=args.meetings, attendees=args.attendees)
+        headers = {"X-User-Id": str(owner_id)}
+        with TestClient(app) as client:
+            for label, fields in VARIANTS.items():
+                params = {"fields": fields} if fields else {}
+                samples = []
+                for _ in range(args.requests):
+                    result_cache.clear()
+                    started = time.perf_counter()
+                    response = client.get("/meetings/", params=params, headers=headers)
+                    response.raise_for_status()
+                    samples.append(time.perf_counter() - started)
+                print(
+                    f"{label:<40} {len(response.content) / 1024:8.0f} KiB"
+                    f"  p50 {percentile(samples, 50) * 1000:7.1f} ms  p95 {percentile(samples, 95) * 1000:7.1f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
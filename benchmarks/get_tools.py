@@ -0,0 +1,47 @@
+"""
+Cost of ``ServiceMesh.get_tools`` per call: walking every service with ``dir()``
+and ``getattr`` (the previous implementation) versus binding the precompiled
+tool registry.
+
+    python -m benchmarks.get_tools --calls 2000
+"""
+import argparse
+import timeit
+
+import services  # noqa: F401  registers the service classes
+from service_mesh import _SERVICE_REGISTRY, ServiceMesh, ServiceTool
+
+
+def introspecting_get_tools(mesh: ServiceMesh):
+    tools = []
+    for service_cls in _SERVICE_REGISTRY:
+        service = mesh.get_service(service_cls)
+        for attr_name in dir(service):
+            attr = getattr(service, attr_name)
+            if callable(attr) and getattr(attr, "_is_service_tool", False):
+                tools.append(
+                    ServiceTool(
+                        name=f"{service_cls.service_name}.{attr._tool_name}",
+                        description=attr._tool_description,
+                        callable=attr,
+                    )
+                )
+    return tools
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    # A fresh mesh per call mirrors a per-request, per-user mesh.
+    introspecting = timeit.timeit(lambda: introspecting_get_tools(ServiceMesh(user=None, db=None)), number=args.calls)
+    registry = timeit.timeit(lambda: ServiceMesh(user=None, db=None).get_tools(), number=args.calls)
+
+    print(f"introspection: {introspecting / args.calls * 1e6:.1f} us/call")
+    print(f"registry:      {registry / args.calls * 1e6:.1f} us/call")
+    print(f"speedup:       {introspecting / registry:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+Replay a weighted request mix against a synthetic tenant, in-process and over
+a local uvicorn server, and report per endpoint p50/p95/p99 latency, database
+queries per request and memory allocated per request (tracemalloc peak,
+in-process only). Results are compared with a baseline file and any
+regression exits with status 1: more queries per request, or p50 latency or
+allocations grown past ``--tolerance``. p95/p99 are reported but not gated,
+being too noisy on shared machines.
+
+A mix is a JSON lines file with one endpoint per line:
+
+    {"name": "get meeting", "method": "GET", "path": "/meetings/{meeting_id}", "weight": 20}
+    {"name": "create note", "method": "POST", "path": "/notes/",
+     "json": {"content": "Replayed note", "meeting_id": "{meeting_id}"}, "weight": 10}
+
+``{meeting_id}``, ``{note_id}``, ``{task_id}`` and ``{user_id}`` are replaced
+by a random row of the tenant per request, ``{owner_id}`` by the tenant's
+owner and ``{today}`` by the current date. Requests are drawn from a seeded
+random generator, so a run with the same arguments replays the same requests.
+
+    python -m benchmarks.harness
+    python -m benchmarks.harness --update-baseline
+    python -m benchmarks.harness --meetings 10000 --requests 5000 --baseline none
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+
+import models
+from auth import principal_cache
+from benchmarks.common import percentile, seed_tenant, serve, use_database
+from main import app
+from service_mesh import result_cache
+
+BENCHMARKS_DIR = Path(__file__).parent
+DEFAULT_MIX = BENCHMARKS_DIR / "mixes" / "default.jsonl"
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+MODES = ("inprocess", "uvicorn")
+# Latency regressions must exceed both the relative tolerance and this many
+# milliseconds, so fast endpoints do not fail on scheduler noise.
+LATENCY_SLACK_MS = 2.0
+# Queries per request are deterministic for a given mix and tenant; this only
+# absorbs expiring principal cache entries.
+QUERY_SLACK = 0.1
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+Row = Dict[str, Any]
+Results = Dict[str, Dict[str, Row]]
+
+
+def load_mix(path: Path) -> List[Row]:
+    with open(path) as mix:
+        entries = [json.loads(line) for line in mix if line.strip()]
+    for entry in entries:
+        entry.setdefault("name", f"{entry['method']} {entry['path']}")
+        entry.setdefault("weight", 1)
+    return entries
+
+
+def tenant_rows(engine, owner_id: int) -> Dict[str, List[Any]]:
+    """
+    Ids of the tenant's rows, per placeholder.
+    """
+    def ids(model):
+        with engine.connect() as conn:
+            return list(conn.execute(select(model.id).where(model.owner_id == owner_id)).scalars())
+
+    return {
+        "owner_id": [owner_id],
+        "user_id": ids(models.User),
+        "meeting_id": ids(models.Meeting),
+        "note_id": ids(models.Note),
+        "task_id": ids(models.Task),
+        "today": [date.today().isoformat()],
+    }
+
+
+def render(value: Any, rows: Dict[str, List[Any]], rng: random.Random) -> Any:
+    """
+    Fill the placeholders of a path or JSON body. A string that is a single
+    placeholder becomes the value itself, so ids stay integers in bodies.
+    """
+    if isinstance(value, dict):
+        return {key: render(item, rows, rng) for key, item in value.items()}
+    if isinstance(value, list):
+        return [render(item, rows, rng) for item in value]
+    if not isinstance(value, str):
+        return value
+    whole = _PLACEHOLDER.fullmatch(value)
+    if whole:
+        return rng.choice(rows[whole.group(1)])
+    return _PLACEHOLDER.sub(lambda match: str(rng.choice(rows[match.group(1)])), value)
+
+
+def plan(mix: List[Row], rows: Dict[str, List[Any]], count: int, seed: int) -> List[Tuple[Row, str, Any]]:
+    """
+    Draw ``count`` requests from the mix by weight: (entry, path, body).
+    """
+    rng = random.Random(seed)
+    entries = rng.choices(mix, weights=[entry["weight"] for entry in mix], k=count)
+    return [(entry, render(entry["path"], rows, rng), render(entry.get("json"), rows, rng)) for entry in entries]
+
+
+@contextmanager
+def count_queries(engine) -> Iterator[List[int]]:
+    counter = [0]
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter[0] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def send(client, headers: Dict[str, str], entry: Row, path: str, body: Any) -> None:
+    response = client.request(entry["method"], path, json=body, headers=headers)
+    if response.status_code >= 400:
+        raise SystemExit(f"{entry['name']}: {entry['method']} {path} returned {response.status_code}: {response.text}")
+
+
+def replay(client, headers, requests, engine) -> Dict[str, Dict[str, List[float]]]:
+    samples = defaultdict(lambda: {"seconds": [], "queries": []})
+    with count_queries(engine) as counter:
+        for entry, path, body in requests:
+            queries = counter[0]
+            started = time.perf_counter()
+            send(client, headers, entry, path, body)
+            samples[entry["name"]]["seconds"].append(time.perf_counter() - started)
+            samples[entry["name"]]["queries"].append(counter[0] - queries)
+    return samples
+
+
+def allocations(client, headers, mix, rows, samples: int, seed: int) -> Dict[str, float]:
+    """
+    Mean tracemalloc peak, in KiB, of ``samples`` requests per mix entry.
+    """
+    rng = random.Random(seed)
+    peaks = {}
+    tracemalloc.start()
+    try:
+        for entry in mix:
+            sizes = []
+            for _ in range(samples):
+                path, body = render(entry["path"], rows, rng), render(entry.get("json"), rows, rng)
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                send(client, headers, entry, path, body)
+                sizes.append(tracemalloc.get_traced_memory()[1] - current)
+            peaks[entry["name"]] = sum(sizes) / len(sizes) / 1024
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def run_mode(mode: str, args, mix: List[Row]) -> Dict[str, Row]:
+    """
+    Seed a fresh tenant and replay the mix against it in ``mode``.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = use_database(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        owner_id = seed_tenant(
+            engine,
+            meetings=args.meetings,
+            attendees=args.attendees,
+            notes_per_meeting=args.notes,
+            tasks_per_meeting=args.tasks,
+        )
+        rows = tenant_rows(engine, owner_id)
+        headers = {"X-User-Id": str(owner_id)}
+        requests = plan(mix, rows, args.requests, args.seed)
+        result_cache.clear()
+        principal_cache.clear()
+
+        peaks: Dict[str, float] = {}
+        if mode == "inprocess":
+            with TestClient(app) as client:
+                samples = replay(client, headers, requests, engine)
+                if args.alloc_samples:
+                    peaks = allocations(client, headers, mix, rows, args.alloc_samples, args.seed)
+        else:
+            with serve(app) as base_url, httpx.Client(base_url=base_url, timeout=None) as client:
+                samples = replay(client, headers, requests, engine)
+        engine.dispose()
+
+    summary = {}
+    for name, sample in samples.items():
+        seconds = sample["seconds"]
+        summary[name] = {
+            "requests": len(seconds),
+            "p50_ms": round(percentile(seconds, 50) * 1000, 3),
+            "p95_ms": round(percentile(seconds, 95) * 1000, 3),
+            "p99_ms": round(percentile(seconds, 99) * 1000, 3),
+            "queries": round(sum(sample["queries"]) / len(seconds), 3),
+            "alloc_kib": round(peaks[name], 1) if name in peaks else None,
+        }
+    return summary
+
+
+def report(results: Results) -> None:
+    for mode, endpoints in results.items():
+        print(f"\n{mode}")
+        for name, row in sorted(endpoints.items()):
+            alloc = f"{row['alloc_kib']:9.1f} KiB" if row["alloc_kib"] is not None else ""
+            print(
+                f"  {name:<24} n={row['requests']:<5} p50 {row['p50_ms']:8.2f}  p95 {row['p95_ms']:8.2f}  "
+                f"p99 {row['p99_ms']:8.2f} ms  queries {row['queries']:6.2f}  {alloc}"
+            )
+
+
+def regressions(results: Results, baseline: Results, tolerance: float) -> List[str]:
+    """
+    Endpoints whose p50 latency, queries per request or allocations grew past
+    the baseline.
+    """
+    found = []
+    for mode, endpoints in results.items():
+        for name, row in endpoints.items():
+            base = baseline.get(mode, {}).get(name)
+            if base is None:
+                continue
+            if row["p50_ms"] > base["p50_ms"] * (1 + tolerance) and row["p50_ms"] - base["p50_ms"] > LATENCY_SLACK_MS:
+                found.append(f"{mode} {name}: p50 {row['p50_ms']:.2f} ms, baseline {base['p50_ms']:.2f} ms")
+            if row["queries"] > base["queries"] + QUERY_SLACK:
+                found.append(f"{mode} {name}: {row['queries']:.2f} queries per request, baseline {base['queries']:.2f}")
+            if (
+                row["alloc_kib"] is not None and base.get("alloc_kib") is not None
+                and row["alloc_kib"] > base["alloc_kib"] * (1 + tolerance)
+            ):
+                found.append(f"{mode} {name}: {row['alloc_kib']:.1f} KiB allocated, baseline {base['alloc_kib']:.1f} KiB")
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mix", type=Path, default=DEFAULT_MIX)
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated subset of: " + ", ".join(MODES))
+    parser.add_argument("--meetings", type=int, default=1000)
+    parser.add_argument("--attendees", type=int, default=10)
+    parser.add_argument("--notes", type=int, default=3, help="Notes per meeting.")
+    parser.add_argument("--tasks", type=int, default=3, help="Tasks per meeting.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests replayed per mode.")
+    parser.add_argument("--alloc-samples", type=int, default=5, help="Requests per endpoint traced for allocations.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help='Baseline file, or "none" to skip the check.')
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="Allowed relative growth of p50 latency and allocations.")
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+    mix = load_mix(args.mix)
+    settings = {
+        "mix": args.mix.name,
+        "meetings": args.meetings,
+        "attendees": args.attendees,
+        "notes": args.notes,
+        "tasks": args.tasks,
+        "requests": args.requests,
+        "alloc_samples": args.alloc_samples,
+        "seed": args.seed,
+    }
+
+    results = {mode: run_mode(mode, args, mix) for mode in modes}
+    report(results)
+
+    if args.baseline == "none":
+        return
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps({"settings": settings, "results": results}, indent=2) + "\n")
+        print(f"\nbaseline written to {baseline_path}")
+        return
+    if not baseline_path.exists():
+        sys.exit(f"\nno baseline at {baseline_path}; run with --update-baseline to create it")
+    baseline = json.loads(baseline_path.read_text())
+    if baseline["settings"] != settings:
+        sys.exit(f"\nbaseline {baseline_path} was recorded with {baseline['settings']}, not {settings}")
+    found = regressions(results, baseline["results"], args.tolerance)
+    if found:
+        print(f"\n{len(found)} regression(s) against {baseline_path}:")
+        for regression in found:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"\nno regressions against {baseline_path}")
+
+
+if __name__ == "__main__":
+    main()
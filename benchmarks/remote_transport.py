@@ -0,0 +1,99 @@
+"""
+Per-call overhead of ``tasks.get_task`` through the local transport versus
+``RemoteServiceTransport`` talking to a uvicorn server, called sequentially
+and from ``--threads`` concurrent callers whose calls are coalesced.
+
+    python -m benchmarks.remote_transport --calls 500 --threads 8
+"""
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import database
+import models
+from benchmarks.common import percentile, seed_tenant, serve, use_database
+from main import app
+from remote_transport import RemoteServiceTransport
+from service_mesh import CompositeServiceTransport, LocalServiceTransport, ServiceMesh
+from services import TaskService
+
+
+def time_calls(make_mesh, owner_id, task_id, calls):
+    samples = []
+    with database.SessionLocal() as db:
+        mesh = make_mesh(db.get(models.User, owner_id), db)
+        service = mesh.get_service(TaskService)
+        for _ in range(calls):
+            started = time.perf_counter()
+            service.get_task(task_id)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def report(label, samples, elapsed):
+    print(
+        f"{label:<18} p50 {percentile(samples, 50) * 1e6:7.0f} us  p99 {percentile(samples, 99) * 1e6:7.0f} us"
+        f"  {len(samples) / elapsed:8.0f} calls/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = use_database(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        owner_id = seed_tenant(engine, meetings=1, attendees=1, tasks_per_meeting=1)
+        with database.SessionLocal() as db:
+            task_id = db.query(models.Task.id).filter(models.Task.owner_id == owner_id).scalar()
+
+        def local_mesh(user, db):
+            return ServiceMesh(user=user, db=db)
+
+        started = time.perf_counter()
+        local = time_calls(local_mesh, owner_id, task_id, args.calls)
+        report("local", local, time.perf_counter() - started)
+
+        with serve(app) as base_url:
+            transport = RemoteServiceTransport(base_url, services=[TaskService])
+
+            def remote_mesh(user, db):
+                return ServiceMesh(
+                    user=user,
+                    db=db,
+                    transport=CompositeServiceTransport([transport, LocalServiceTransport()]),
+                )
+
+            time_calls(remote_mesh, owner_id, task_id, 20)
+            started = time.perf_counter()
+            remote = time_calls(remote_mesh, owner_id, task_id, args.calls)
+            report("remote", remote, time.perf_counter() - started)
+
+            before = transport.stats()
+            samples = []
+            per_thread = args.calls // args.threads
+
+            def worker():
+                samples.extend(time_calls(remote_mesh, owner_id, task_id, per_thread))
+
+            threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            report(f"remote x{args.threads}", samples, time.perf_counter() - started)
+            after = transport.stats()
+            transport.close()
+
+    calls = after["calls"] - before["calls"]
+    round_trips = after["round_trips"] - before["round_trips"]
+    print(f"coalescing: {calls} calls in {round_trips} round trips ({calls / round_trips:.1f} calls/round trip)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Fixed per-request cost of the API on a trivial endpoint, ``GET /notes/{id}``,
+served in-process (no sockets) so dependency resolution, mesh construction
+and serialization dominate.
+
+    python -m benchmarks.request_overhead --requests 3000
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from benchmarks.common import percentile, seed_tenant, use_database
+from main import app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = use_database(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        owner_id = seed_tenant(engine, meetings=1, attendees=1, notes_per_meeting=1)
+        headers = {"X-User-Id": str(owner_id)}
+        with TestClient(app) as client:
+            note_id = client.get("/notes/", headers=headers).json()[0]["id"]
+            path = f"/notes/{note_id}"
+            for _ in range(args.warmup):
+                client.get(path, headers=headers).raise_for_status()
+            samples = []
+            started = time.perf_counter()
+            for _ in range(args.requests):
+                request_started = time.perf_counter()
+                client.get(path, headers=headers).raise_for_status()
+                samples.append(time.perf_counter() - request_started)
+            elapsed = time.perf_counter() - started
+
+    print(f"GET /notes/{{id}} requests={args.requests}")
+    print(f"throughput: {args.requests / elapsed:,.0f} req/s")
+    print(f"p50: {percentile(samples, 50) * 1e6:.0f} us  p99: {percentile(samples, 99) * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
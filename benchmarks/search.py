@@ -0,0 +1,91 @@
+"""
+Latency of ``GET /search/`` over a tenant with ``--notes`` notes whose words
+follow a Zipf-like distribution, for rare, mid-frequency, two-word and
+common-word queries.
+
+    python -m benchmarks.search --notes 1000000
+"""
+import argparse
+import itertools
+import random
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+import models
+from benchmarks.common import percentile, seed_tenant, use_database
+from main import app
+
+VOCABULARY_SIZE = 20_000
+WORDS_PER_NOTE = 12
+CHUNK = 50_000
+
+
+def word(rank: int) -> str:
+    return f"term{rank}"
+
+
+def seed_notes(engine, owner_id: int, meeting_ids, notes: int, rng: random.Random) -> None:
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(VOCABULARY_SIZE)))
+    ranks = range(VOCABULARY_SIZE)
+    now = datetime.utcnow()
+    for start in range(0, notes, CHUNK):
+        rows = [
+            {
+                "content": " ".join(word(rank) for rank in rng.choices(ranks, cum_weights=cum_weights, k=WORDS_PER_NOTE)),
+                "meeting_id": meeting_ids[index % len(meeting_ids)],
+                "created_at": now,
+                "owner_id": owner_id,
+            }
+            for index in range(start, min(start + CHUNK, notes))
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(models.Note), rows)
+    with engine.begin() as conn:
+        models.repair_meeting_counters(conn, owner_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--notes", type=int, default=1_000_000)
+    parser.add_argument("--meetings", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=50, help="Timed requests per query.")
+    args = parser.parse_args()
+
+    queries = {
+        "rare word": word(15_000),
+        "mid-frequency word": word(500),
+        "two words": f"{word(40)} {word(900)}",
+        "common word": word(0),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = use_database(f"sqlite:///{Path(tmp) / 'bench.db'}", "production")
+        owner_id = seed_tenant(engine, meetings=args.meetings, attendees=1)
+        with engine.connect() as conn:
+            meeting_ids = [row[0] for row in conn.execute(models.Meeting.__table__.select().with_only_columns(models.Meeting.id))]
+        started = time.perf_counter()
+        seed_notes(engine, owner_id, meeting_ids, args.notes, random.Random(42))
+        print(f"indexed {args.notes:,} notes in {time.perf_counter() - started:.0f} s")
+
+        headers = {"X-User-Id": str(owner_id)}
+        with TestClient(app) as client:
+            for label, q in queries.items():
+                client.get("/search/", params={"q": q}, headers=headers).raise_for_status()
+                samples = []
+                for _ in range(args.queries):
+                    request_started = time.perf_counter()
+                    response = client.get("/search/", params={"q": q}, headers=headers)
+                    response.raise_for_status()
+                    samples.append(time.perf_counter() - request_started)
+                print(
+                    f"{label:<20} q={q!r:<22} p50 {percentile(samples, 50) * 1000:6.1f} ms"
+                    f"  p95 {percentile(samples, 95) * 1000:6.1f} ms  results={len(response.json())}"
+                )
+
+
+if __name__ == "__main__":
+    main()
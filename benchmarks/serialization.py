@@ -0,0 +1,82 @@
+"""
+Serialization cost of ``GET /meetings/`` for a tenant of ``--meetings``
+meetings with ``--attendees`` attendees each: end to end through the API
+(tool result cache cleared per request), and per stage in-process for the
+``response_model`` path (ORM entities validated with ``from_attributes`` and
+dumped through the standard library encoder) versus the row path (column
+tuples encoded with orjson).
+
+    python -m benchmarks.serialization --meetings 5000 --attendees 10
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import orjson
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+import database
+import models
+import schemas
+from benchmarks.common import percentile, seed_tenant, use_database
+from main import app
+from service_mesh import ServiceMesh, result_cache
+from services import MeetingService
+
+
+def timed(samples: int, func) -> List[float]:
+    durations = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def report(label: str, durations: List[float]) -> None:
+    print(f"{label:<44} p50 {percentile(durations, 50) * 1000:8.1f} ms  p95 {percentile(durations, 95) * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=5000)
+    parser.add_argument("--attendees", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = use_database(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        owner_id = seed_tenant(engine, meetings=args.meetings, attendees=args.attendees)
+        headers = {"X-User-Id": str(owner_id)}
+
+        with TestClient(app) as client:
+            def get_meetings():
+                result_cache.clear()
+                client.get("/meetings/", headers=headers).raise_for_status()
+
+            get_meetings()
+            report("GET /meetings/ end to end", timed(args.requests, get_meetings))
+
+        adapter = TypeAdapter(List[schemas.Meeting])
+        with database.SessionLocal() as db:
+            service = ServiceMesh(user=db.get(models.User, owner_id), db=db).get_service(MeetingService)
+            entities = list(service.iter_meetings())
+            rows = service._project(service._list_meetings_query(None, None), models.Meeting, schemas.Meeting, None)
+
+            def response_model_path():
+                validated = adapter.validate_python(entities, from_attributes=True)
+                json.dumps(adapter.dump_python(validated, mode="json"), separators=(",", ":")).encode()
+
+            def row_path():
+                orjson.dumps(rows)
+
+            report("encode: response_model + stdlib json", timed(args.requests, response_model_path))
+            report("encode: rows + orjson", timed(args.requests, row_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Encodings we can produce with zlib, in order of preference on equal
+# quality, with the zlib window bits selecting their container.
+ENCODINGS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+# Bodies below this size go out as they are: below about one packet the
+# saving does not pay for the compression.
+MINIMUM_SIZE = 1024
+# zlib's default; higher levels cost much more CPU on large lists for a few
+# percent less output.
+COMPRESSION_LEVEL = 6
+# Streamed bodies are flushed to the client once this much input has been
+# compressed, so the first rows leave without waiting for the whole body and
+# small NDJSON rows are not flushed one by one.
+FLUSH_SIZE = 16 * 1024
+# Server-Sent Events must reach the client as soon as they are written.
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the encoding of ``ENCODINGS`` the client prefers in its
+    ``Accept-Encoding`` header, or None to send the body as is.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    default = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = qualities.get(encoding, default)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies with gzip or deflate, as negotiated through
+    ``Accept-Encoding``.
+
+    Bodies under ``minimum_size`` bytes, already encoded bodies and event
+    streams are left alone. Streamed bodies are compressed chunk by chunk and
+    flushed every ``FLUSH_SIZE`` bytes of input, so they stay streamed. Entity
+    tags of compressed responses become weak, since the bytes no longer match
+    the identity representation; If-None-Match compares them weakly.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = MINIMUM_SIZE, level: int = COMPRESSION_LEVEL) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        await _CompressingResponder(self.app, encoding, self.minimum_size, self.level)(scope, receive, send)
+
+
+class _CompressingResponder:
+    """
+    Per-request state of ``CompressionMiddleware``: holds back the response
+    start until the first body chunk shows whether to compress.
+    """
+
+    def __init__(self, app: ASGIApp, encoding: Optional[str], minimum_size: int, level: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.level = level
+        self.send: Optional[Send] = None
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.compressor = None
+        self.pending = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.start = message
+            self.passthrough = (
+                "content-encoding" in headers
+                or headers.get("content-type", "").startswith(EXCLUDED_CONTENT_TYPES)
+            )
+            return
+        if message["type"] != "http.response.body":
+            await self._send_start()
+            await self.send(message)
+            return
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+            else:
+                self._begin()
+        if self.compressor is not None:
+            message["body"] = self._compress(body, more_body)
+            if self.start is not None and not more_body:
+                # The whole body was in this message, so its length is known.
+                MutableHeaders(raw=self.start["headers"])["Content-Length"] = str(len(message["body"]))
+        await self._send_start()
+        await self.send(message)
+
+    async def _send_start(self) -> None:
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self.send(start)
+
+    def _begin(self) -> None:
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers.add_vary_header("Accept-Encoding")
+        if self.encoding is None:
+            self.passthrough = True
+            return
+        self.compressor = zlib.compressobj(self.level, zlib.DEFLATED, ENCODINGS[self.encoding])
+        headers["Content-Encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    def _compress(self, body: bytes, more_body: bool) -> bytes:
+        compressed = self.compressor.compress(body)
+        self.pending += len(body)
+        if not more_body:
+            return compressed + self.compressor.flush()
+        if self.pending >= FLUSH_SIZE:
+            self.pending = 0
+            return compressed + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+        return compressed
@@ -0,0 +1,45 @@
+from typing import Callable, Optional
+
+from fastapi import Request, Response
+
+ETAG_HEADER = "ETag"
+# Clients may store responses but must revalidate them with If-None-Match.
+CACHE_CONTROL = "private, no-cache"
+
+
+def entity_tag(kind: str, row_id: int, version: int) -> str:
+    """
+    Entity tag of a row at ``version``.
+    """
+    return f'"{kind}-{row_id}-v{version}"'
+
+
+def _matches(header: str, etag: str) -> bool:
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def not_modified_response(
+        request: Request, kind: str, row_id: int, current_version: Callable[[], int]
+) -> Optional[Response]:
+    """
+    Return a 304 response when ``If-None-Match`` holds the row's current tag.
+
+    ``current_version`` is only called when the header is present, so
+    unconditional requests cost nothing extra.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    etag = entity_tag(kind, row_id, current_version())
+    if not _matches(header, etag):
+        return None
+    return Response(status_code=304, headers={ETAG_HEADER: etag, "Cache-Control": CACHE_CONTROL})
+
+
+def set_entity_tag(response: Response, kind: str, row_id: int, version: int) -> None:
+    """
+    Tag a response with the version of the row it was built from.
+    """
+    response.headers[ETAG_HEADER] = entity_tag(kind, row_id, version)
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -1,17 +1,98 @@
-from sqlalchemy import create_engine
+import os
+from typing import Any, Dict
+
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from models import Base
 
-# Database configuration
-SQLALCHEMY_DATABASE_URL = "sqlite:///./meetings.db"
+# Database configuration. DATABASE_URL is the primary that takes every write;
+# DATABASE_REPLICA_URL, when set, serves the read-only service tools.
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./meetings.db")
+SQLALCHEMY_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+
+# Engine profiles, selected with the DATABASE_PROFILE environment variable.
+#
+# Route handlers run in the server threadpool. A request keeps its session's
+# connection while it waits for a worker (dependencies, handler and response
+# validation each take one), so the pool keeps a worker's worth of connections
+# warm and allows generous overflow before capping in-flight requests. Past
+# pool_size + max_overflow connections a checkout waits POOL_TIMEOUT seconds
+# and then fails, rather than opening connections without bound. Pool sizing
+# only applies to QueuePool engines (file SQLite, PostgreSQL); in-memory
+# SQLite keeps one connection per thread.
+POOL_TIMEOUT = 30
+ENGINE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "development": {
+        "pragmas": {},
+        "pool_size": 40,
+        "max_overflow": 60,
+    },
+    # WAL lets readers run alongside the single writer, and writers wait on
+    # the busy timeout instead of failing with "database is locked".
+    "production": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": 10000,
+            "cache_size": -65536,
+            "mmap_size": 268435456,
+            "temp_store": "MEMORY",
+        },
+        "pool_size": 40,
+        "max_overflow": 60,
+    },
+}
+DATABASE_PROFILE = os.getenv("DATABASE_PROFILE", "development")
+
+
+def create_engine_for_profile(url: str, profile: str = DATABASE_PROFILE) -> Engine:
+    """
+    Create an engine configured with the pool and SQLite pragmas of ``profile``.
+
+    Pragmas only apply to SQLite URLs, and pool settings only to pooled
+    (QueuePool) URLs.
+    """
+    settings = ENGINE_PROFILES[profile]
+    parsed_url = make_url(url)
+    is_sqlite = parsed_url.get_backend_name() == "sqlite"
+    pool_options = {}
+    if issubclass(parsed_url.get_dialect().get_pool_class(parsed_url), QueuePool):
+        pool_options = {
+            "pool_size": settings["pool_size"],
+            "max_overflow": settings["max_overflow"],
+            "pool_timeout": POOL_TIMEOUT,
+        }
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if is_sqlite else {},
+        pool_pre_ping=not is_sqlite,
+        **pool_options,
+    )
+    pragmas = settings["pragmas"] if is_sqlite else {}
+    if pragmas:
+        @event.listens_for(engine, "connect")
+        def apply_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    return engine
+
 
 # Create engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+engine = create_engine_for_profile(SQLALCHEMY_DATABASE_URL)
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory. Writes are committed once per unit of work, after
+# which the flushed objects are serialized as-is instead of being reloaded.
+SESSION_OPTIONS = {"autocommit": False, "autoflush": False, "expire_on_commit": False}
+SessionLocal = sessionmaker(bind=engine, **SESSION_OPTIONS)
+
+replica_engine = create_engine_for_profile(SQLALCHEMY_REPLICA_URL) if SQLALCHEMY_REPLICA_URL else None
+ReadSessionLocal = sessionmaker(bind=replica_engine, **SESSION_OPTIONS) if replica_engine is not None else None
 
 
 def create_tables():
@@ -21,12 +102,29 @@ def create_tables():
     Base.metadata.create_all(bind=engine)
 
 
-def get_db():
+async def get_db():
     """
     Dependency to get database session.
+
+    Opening a session does no I/O, so it happens on the event loop; closing
+    it may return a connection to the pool and runs in the threadpool.
     """
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        await run_in_threadpool(db.close)
+
+
+async def get_read_db():
+    """
+    Dependency to get a read replica session, or None when no replica is configured.
+    """
+    if ReadSessionLocal is None:
+        yield None
+        return
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        await run_in_threadpool(db.close)
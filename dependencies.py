@@ -1,20 +1,58 @@
-from fastapi import Depends
+import os
+from typing import Optional
+
+from fastapi import Depends, Request
 from sqlalchemy.orm import Session
 
+import services  # noqa: F401  registers the service classes
 from auth import get_current_user, get_optional_user
-from database import get_db
-from service_mesh import ServiceMesh
+from database import get_db, get_read_db
+from remote_transport import RemoteServiceTransport
+from service_mesh import (
+    CompositeServiceTransport,
+    LocalServiceTransport,
+    ServiceMesh,
+    ServiceMeshFactory,
+    ServiceTransport,
+    default_transport,
+    get_service_class,
+)
+
+# Services served by another instance of the API, e.g.
+# REMOTE_SERVICES_URL=http://tasks.internal:8000 REMOTE_SERVICES=tasks
+REMOTE_SERVICES_URL = os.getenv("REMOTE_SERVICES_URL")
+REMOTE_SERVICES = [name.strip() for name in os.getenv("REMOTE_SERVICES", "").split(",") if name.strip()]
+
+
+def build_service_transport() -> ServiceTransport:
+    """
+    Build the transport chain configured by the environment.
+    """
+    if not (REMOTE_SERVICES_URL and REMOTE_SERVICES):
+        return default_transport
+    remote = RemoteServiceTransport(REMOTE_SERVICES_URL, services=[get_service_class(name) for name in REMOTE_SERVICES])
+    return CompositeServiceTransport([remote, LocalServiceTransport()])
+
+
+def get_mesh_factory(request: Request) -> ServiceMeshFactory:
+    return request.app.state.mesh_factory
 
 
-def get_service_mesh(
+# Building a mesh does no I/O, so these run on the event loop instead of
+# taking a threadpool worker per request.
+async def get_service_mesh(
         current_user=Depends(get_current_user),
         db: Session = Depends(get_db),
+        read_db: Optional[Session] = Depends(get_read_db),
+        mesh_factory: ServiceMeshFactory = Depends(get_mesh_factory),
 ) -> ServiceMesh:
-    return ServiceMesh(user=current_user, db=db)
+    return mesh_factory(current_user, db, read_db)
 
 
-def get_optional_service_mesh(
+async def get_optional_service_mesh(
         current_user=Depends(get_optional_user),
         db: Session = Depends(get_db),
+        read_db: Optional[Session] = Depends(get_read_db),
+        mesh_factory: ServiceMeshFactory = Depends(get_mesh_factory),
 ) -> ServiceMesh:
-    return ServiceMesh(user=current_user, db=db)
\ No newline at end of file
+    return mesh_factory(current_user, db, read_db)
@@ -1,30 +1,52 @@
 from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 
+from compression import CompressionMiddleware
 from database import create_tables
-from routers import meetings_router, notes_router, tasks_router, users_router
-
-app = FastAPI(
-    title="Meeting Notes API",
-    description="API for managing meetings, notes, and tasks",
-    version="1.0.0"
+from dependencies import build_service_transport
+from routers import (
+    changes_router,
+    meetings_router,
+    metrics_router,
+    notes_router,
+    search_router,
+    tasks_router,
+    tools_router,
+    users_router,
 )
+from service_mesh import ServiceMeshFactory
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # startup
     create_tables()
+    app.state.mesh_factory = ServiceMeshFactory(build_service_transport())
     yield
     # shutdown
+    app.state.mesh_factory.close()
+
+
+app = FastAPI(
+    title="Meeting Notes API",
+    description="API for managing meetings, notes, and tasks",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+app.add_middleware(CompressionMiddleware)
 
 
 app.include_router(users_router)
 app.include_router(meetings_router)
 app.include_router(notes_router)
 app.include_router(tasks_router)
+app.include_router(metrics_router)
+app.include_router(tools_router)
+app.include_router(search_router)
+app.include_router(changes_router)
 
 
 @app.get("/", response_class=HTMLResponse, include_in_schema=False)
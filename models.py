@@ -1,25 +1,43 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy import DDL, Column, Integer, String, Text, DateTime, ForeignKey, Index, Table, event, func, or_, select, text
+from sqlalchemy.orm import Session, declarative_base, relationship
 from datetime import datetime, timezone
+from typing import List
 
 Base = declarative_base()
 
+
+def version_column() -> Column:
+    """
+    Row version, bumped by every UPDATE of the row (ORM or Core) that does
+    not set it; exposed to clients as an ETag. Models using it set
+    ``eager_defaults`` so ORM updates return the new version instead of
+    reloading it.
+    """
+    return Column(Integer, nullable=False, default=1, server_default='1', onupdate=text('version + 1'))
+
 # Association table for many-to-many relationship between meetings and users
 meeting_users = Table(
     'meeting_users',
     Base.metadata,
     Column('meeting_id', Integer, ForeignKey('meetings.id'), primary_key=True),
-    Column('user_id', Integer, ForeignKey('users.id'), primary_key=True)
+    Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
+    # The primary key covers meeting -> users; this covers user -> meetings.
+    Index('ix_meeting_users_user_id_meeting_id', 'user_id', 'meeting_id'),
 )
 
 
 class User(Base):
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_owner_id_id', 'owner_id', 'id'),
+    )
+    __mapper_args__ = {'eager_defaults': True}
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False, index=True)
-    owner_id = Column(Integer, ForeignKey('users.id'), index=True, nullable=True)
+    owner_id = Column(Integer, ForeignKey('users.id'), nullable=True)
+    version = version_column()
     
     # Relationships
     meetings = relationship('Meeting', secondary=meeting_users, back_populates='attendees')
@@ -28,6 +46,11 @@ class User(Base):
 
 class Meeting(Base):
     __tablename__ = 'meetings'
+    __table_args__ = (
+        # Time-window queries (calendar views, from/to filters).
+        Index('ix_meetings_owner_id_scheduled_time', 'owner_id', 'scheduled_time'),
+    )
+    __mapper_args__ = {'eager_defaults': True}
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -35,21 +58,36 @@ class Meeting(Base):
     scheduled_time = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     owner_id = Column(Integer, ForeignKey('users.id'), index=True, nullable=False)
+    # Denormalized counters, kept current by the note and task services with
+    # atomic increments; repair_meeting_counters recomputes them.
+    notes_count = Column(Integer, nullable=False, default=0, server_default='0')
+    tasks_count = Column(Integer, nullable=False, default=0, server_default='0')
+    pending_tasks_count = Column(Integer, nullable=False, default=0, server_default='0')
+    completed_tasks_count = Column(Integer, nullable=False, default=0, server_default='0')
+    cancelled_tasks_count = Column(Integer, nullable=False, default=0, server_default='0')
+    # Also bumped when its notes, tasks or attendees change, so it versions
+    # the whole meeting aggregate.
+    version = version_column()
     
     # Relationships
     attendees = relationship('User', secondary=meeting_users, back_populates='meetings')
-    notes = relationship('Note', back_populates='meeting', cascade='all, delete-orphan')
-    tasks = relationship('Task', back_populates='due_meeting', foreign_keys='Task.due_meeting_id')
+    notes = relationship('Note', back_populates='meeting', cascade='all, delete-orphan', order_by='Note.id')
+    tasks = relationship('Task', back_populates='due_meeting', foreign_keys='Task.due_meeting_id', order_by='Task.id')
 
 
 class Note(Base):
     __tablename__ = 'notes'
+    __table_args__ = (
+        Index('ix_notes_owner_id_meeting_id', 'owner_id', 'meeting_id'),
+    )
+    __mapper_args__ = {'eager_defaults': True}
     
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    meeting_id = Column(Integer, ForeignKey('meetings.id'), nullable=False)
-    owner_id = Column(Integer, ForeignKey('users.id'), index=True, nullable=False)
+    meeting_id = Column(Integer, ForeignKey('meetings.id'), index=True, nullable=False)
+    owner_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    version = version_column()
     
     # Relationships
     meeting = relationship('Meeting', back_populates='notes')
@@ -57,14 +95,176 @@ class Note(Base):
 
 class Task(Base):
     __tablename__ = 'tasks'
+    __table_args__ = (
+        Index('ix_tasks_owner_id_due_meeting_id_status', 'owner_id', 'due_meeting_id', 'status'),
+    )
+    __mapper_args__ = {'eager_defaults': True}
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(Text)
     status = Column(String, default='pending')  # pending, completed, cancelled
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    due_meeting_id = Column(Integer, ForeignKey('meetings.id'), nullable=False)
-    owner_id = Column(Integer, ForeignKey('users.id'), index=True, nullable=False)
+    due_meeting_id = Column(Integer, ForeignKey('meetings.id'), index=True, nullable=False)
+    owner_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    version = version_column()
     
     # Relationships
     due_meeting = relationship('Meeting', back_populates='tasks', foreign_keys=[due_meeting_id])
+
+
+class Change(Base):
+    """
+    Per-owner change log of meetings, notes and tasks. The id of the last
+    change a client has seen is its cursor into the feed.
+
+    This assumes a single writer, as with SQLite: changes then commit in id
+    order, so no change can appear behind a cursor later. With concurrent
+    writers (e.g. PostgreSQL) a transaction may commit a lower id after a
+    reader has moved past a higher one, and the feed skips that change.
+    """
+    __tablename__ = 'changes'
+    __table_args__ = (
+        Index('ix_changes_owner_id_id', 'owner_id', 'id'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    owner_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    entity = Column(String, nullable=False)  # meeting, note, task
+    entity_id = Column(Integer, nullable=False)
+    action = Column(String, nullable=False)  # created, updated, deleted
+    changed_at = Column(DateTime, nullable=False)
+
+
+# Changes recorded during a transaction, keyed by (owner_id, entity, entity_id)
+# in session.info and written in one INSERT when it commits.
+_PENDING_CHANGES = 'pending_changes'
+
+
+def record_change(session, owner_id: int, entity: str, entity_id: int, action: str) -> None:
+    """
+    Add a change to the log when ``session`` commits. Repeated changes of the
+    same row in one transaction collapse into one; an update never hides
+    that the row was created in the same transaction.
+    """
+    pending = session.info.setdefault(_PENDING_CHANGES, {})
+    key = (owner_id, entity, entity_id)
+    if action == 'updated' and key in pending:
+        return
+    pending.pop(key, None)
+    pending[key] = action
+
+
+@event.listens_for(Session, 'before_commit')
+def _write_pending_changes(session) -> None:
+    pending = session.info.pop(_PENDING_CHANGES, None)
+    if pending:
+        changed_at = datetime.utcnow()
+        session.execute(
+            Change.__table__.insert(),
+            [
+                {'owner_id': owner_id, 'entity': entity, 'entity_id': entity_id, 'action': action,
+                 'changed_at': changed_at}
+                for (owner_id, entity, entity_id), action in pending.items()
+            ],
+        )
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_pending_changes(session, previous_transaction) -> None:
+    session.info.pop(_PENDING_CHANGES, None)
+
+
+# Meeting counter column per task status; tasks in other statuses only count
+# towards tasks_count.
+TASK_STATUS_COUNTERS = {
+    'pending': 'pending_tasks_count',
+    'completed': 'completed_tasks_count',
+    'cancelled': 'cancelled_tasks_count',
+}
+MEETING_COUNTERS = ('notes_count', 'tasks_count', *TASK_STATUS_COUNTERS.values())
+
+
+def repair_meeting_counters(connection, owner_id=None) -> List[int]:
+    """
+    Recompute the counters of every meeting (or every meeting of ``owner_id``)
+    from the notes and tasks tables and return the ids of those that were wrong.
+    """
+    def count(table, meeting_column, *criteria):
+        return (
+            select(func.count())
+            .select_from(table)
+            .where(meeting_column == Meeting.id, *criteria)
+            .correlate(Meeting.__table__)
+            .scalar_subquery()
+        )
+
+    expected = {
+        'notes_count': count(Note.__table__, Note.meeting_id),
+        'tasks_count': count(Task.__table__, Task.due_meeting_id),
+        **{
+            column: count(Task.__table__, Task.due_meeting_id, Task.status == task_status)
+            for task_status, column in TASK_STATUS_COUNTERS.items()
+        },
+    }
+    statement = (
+        Meeting.__table__.update()
+        .where(or_(*(Meeting.__table__.c[column] != value for column, value in expected.items())))
+        .values(**expected)
+        .returning(Meeting.id)
+    )
+    if owner_id is not None:
+        statement = statement.where(Meeting.owner_id == owner_id)
+    return list(connection.execute(statement).scalars())
+
+
+# Full-text index over meeting titles/descriptions, note contents and task
+# titles/descriptions (SQLite FTS5). Triggers keep it in sync with every write,
+# including bulk inserts. Rows are keyed by ``id * 4 + kind`` so a trigger can
+# find its row by rowid. Only title and body are tokenized; the other columns
+# are stored for filtering and for building results.
+SEARCH_KINDS = {1: 'meeting', 2: 'note', 3: 'task'}
+
+_SEARCH_SOURCES = {
+    # kind: (table, title expression, body expression, meeting id expression, watched columns)
+    1: ('meetings', "NEW.title", "COALESCE(NEW.description, '')", "NEW.id", "title, description"),
+    2: ('notes', "''", "NEW.content", "NEW.meeting_id", "content, meeting_id"),
+    3: ('tasks', "NEW.title", "COALESCE(NEW.description, '')", "NEW.due_meeting_id",
+        "title, description, due_meeting_id"),
+}
+
+SEARCH_INDEX_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+    "title, body, owner_id UNINDEXED, kind UNINDEXED, ref_id UNINDEXED, meeting_id UNINDEXED, "
+    "tokenize = 'unicode61 remove_diacritics 2')",
+]
+for _kind, (_table, _title, _body, _meeting_id, _columns) in _SEARCH_SOURCES.items():
+    _insert = (
+        "INSERT INTO search_index (rowid, title, body, owner_id, kind, ref_id, meeting_id) "
+        f"VALUES (NEW.id * 4 + {_kind}, {_title}, {_body}, NEW.owner_id, {_kind}, NEW.id, {_meeting_id});"
+    )
+    _delete = f"DELETE FROM search_index WHERE rowid = OLD.id * 4 + {_kind};"
+    SEARCH_INDEX_DDL += [
+        f"CREATE TRIGGER IF NOT EXISTS {_table}_search_insert AFTER INSERT ON {_table} BEGIN {_insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {_table}_search_update AFTER UPDATE OF {_columns} ON {_table} "
+        f"BEGIN {_delete} {_insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {_table}_search_delete AFTER DELETE ON {_table} BEGIN {_delete} END",
+    ]
+
+for _statement in SEARCH_INDEX_DDL:
+    event.listen(Base.metadata, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+event.listen(Base.metadata, 'before_drop', DDL("DROP TABLE IF EXISTS search_index").execute_if(dialect='sqlite'))
+
+
+def rebuild_search_index(connection) -> None:
+    """
+    Re-index every meeting, note and task, e.g. for a database created before
+    the search index existed.
+    """
+    connection.exec_driver_sql("DELETE FROM search_index")
+    for kind, (table, title, body, meeting_id, _) in _SEARCH_SOURCES.items():
+        title, body, meeting_id = (expression.replace("NEW.", "") for expression in (title, body, meeting_id))
+        connection.exec_driver_sql(
+            "INSERT INTO search_index (rowid, title, body, owner_id, kind, ref_id, meeting_id) "
+            f"SELECT id * 4 + {kind}, {title}, {body}, owner_id, {kind}, id, {meeting_id} FROM {table}"
+        )
@@ -0,0 +1,109 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
+
+import orjson
+from fastapi import Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+# Upper bound for a single page; larger exports should use the NDJSON stream.
+MAX_PAGE_SIZE = 1000
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Ranked results (search) page by offset instead of by id.
+NEXT_OFFSET_HEADER = "X-Next-Offset"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# JSON arrays longer than this are sent in chunks of this many rows, so the
+# first rows (and, with compression, the first compressed bytes) leave before
+# the rest is encoded.
+JSON_CHUNK_ROWS = 500
+
+
+class PageParams:
+    """
+    Keyset pagination and streaming query parameters shared by list endpoints.
+    """
+
+    def __init__(
+            self,
+            after_id: Optional[int] = Query(None, ge=0, description="Return rows with an id greater than this cursor."),
+            limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of rows to return."),
+            stream: bool = Query(False, description="Stream rows as newline-delimited JSON."),
+            fields: Optional[str] = Query(
+                None, description="Comma-separated response fields to return; id is always included.",
+            ),
+    ) -> None:
+        self.after_id = after_id
+        self.limit = limit
+        self.stream = stream
+        self.fields = [name.strip() for name in fields.split(",") if name.strip()] if fields is not None else None
+
+
+def streams_entities(page: PageParams, service: Any, service_cls: Type[Any]) -> bool:
+    """
+    Whether to stream a list through ``service``'s ``iter_*`` method: only
+    for full rows from a local service, since remote service proxies expose
+    tools alone. Other streams are encoded from the ``list_*_fields`` tool.
+    """
+    return page.stream and page.fields is None and isinstance(service, service_cls)
+
+
+def set_next_cursor(response: Response, rows: List[Any], limit: Optional[int]) -> List[Any]:
+    """
+    Advertise the cursor of the next page when the current page is full.
+    """
+    if limit is not None and len(rows) == limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = str(last["id"] if isinstance(last, dict) else last.id)
+    return rows
+
+
+def ndjson_response(rows: Iterable[Any], schema: Type[BaseModel]) -> StreamingResponse:
+    """
+    Stream ORM rows as newline-delimited JSON, one validated schema per line.
+    """
+
+    def encode() -> Iterator[bytes]:
+        for row in rows:
+            yield schema.model_validate(row).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(encode(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def json_array_chunks(rows: List[Any], chunk_rows: int) -> Iterator[bytes]:
+    """
+    Encode ``rows`` as one JSON array, ``chunk_rows`` rows per chunk.
+    """
+    for start in range(0, len(rows), chunk_rows):
+        chunk = orjson.dumps(rows[start:start + chunk_rows])
+        if start:
+            chunk = b"," + chunk[1:]
+        if start + chunk_rows < len(rows):
+            chunk = chunk[:-1]
+        yield chunk
+
+
+def projection_response(rows: List[Dict[str, Any]], page: PageParams) -> Response:
+    """
+    Encode rows built by the services' projections (plain dicts in the list
+    schema's shape) with orjson as one JSON array, or as NDJSON when
+    streaming. Returning a response skips ``response_model`` validation,
+    which would only repeat work for rows read straight from columns.
+
+    Arrays of more than ``JSON_CHUNK_ROWS`` rows are streamed in chunks.
+    """
+    if page.stream:
+        return StreamingResponse((orjson.dumps(row) + b"\n" for row in rows), media_type=NDJSON_MEDIA_TYPE)
+    if len(rows) > JSON_CHUNK_ROWS:
+        response = StreamingResponse(json_array_chunks(rows, JSON_CHUNK_ROWS), media_type="application/json")
+    else:
+        response = ORJSONResponse(rows)
+    set_next_cursor(response, rows, page.limit)
+    return response
+
+
+def model_response(model: BaseModel) -> Response:
+    """
+    Encode a response schema instance in one pass, instead of FastAPI
+    re-validating it against ``response_model`` and dumping it to Python first.
+    """
+    return Response(model.model_dump_json(), media_type="application/json")
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+import httpx
+import orjson
+from fastapi import HTTPException
+
+from service_mesh import CircuitBreaker, ServiceMesh, ServiceType, ToolSpec, get_service_tool_specs
+
+BATCH_PATH = "/tools/batch"
+# Matches the per-request limit of the batch endpoint.
+MAX_BATCH_CALLS = 100
+
+
+class _PendingCall:
+    __slots__ = ("tool", "arguments", "event", "done", "result", "error", "invalidated")
+
+    def __init__(self, tool: str, arguments: Dict[str, Any]) -> None:
+        self.tool = tool
+        self.arguments = arguments
+        self.event = threading.Event()
+        self.done = False
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.invalidated: List[str] = []
+
+    def resolve(
+            self, result: Any = None, error: Optional[BaseException] = None, invalidated: Iterable[str] = ()
+    ) -> None:
+        self.result = result
+        self.error = error
+        self.invalidated = list(invalidated)
+        self.done = True
+        self.event.set()
+
+
+class RemoteServiceTransport:
+    """
+    Serve the tools of ``services`` from another process through its
+    ``POST /tools/batch`` endpoint.
+
+    Requests go through one pooled ``httpx.Client`` with keep-alive
+    connections and orjson-encoded bodies. Calls made by concurrent requests
+    of the same user while a round trip is in flight are coalesced into the
+    next batch. Every batch commits on its own on the remote side, so remote
+    tools never join the caller's unit of work, and only service tools (not
+    helper methods such as ``iter_*``) are available on the proxies.
+
+    Services whose ``local_helpers`` other services call in-process are
+    rejected with ``ValueError``, since those calls could not be forwarded.
+    Other service classes raise ``LookupError``, so the transport composes
+    with a local fallback in ``CompositeServiceTransport``. Each round trip is
+    recorded in ``breaker``: connection errors and 5xx responses count as
+    failures, and the composite stops routing here while the circuit is open.
+    """
+
+    def __init__(
+            self,
+            base_url: str = "",
+            services: Iterable[Type[Any]] = (),
+            client: Optional[httpx.Client] = None,
+            max_batch_calls: int = MAX_BATCH_CALLS,
+            timeout: float = 10.0,
+            breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        self._services = set(services)
+        for service_cls in self._services:
+            helpers = getattr(service_cls, "local_helpers", ())
+            if helpers:
+                raise ValueError(
+                    f"{service_cls.__name__} cannot be served remotely: other services call "
+                    f"{', '.join(helpers)} in-process"
+                )
+        self.breaker = breaker or CircuitBreaker()
+        self._client = client or httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+        self.max_batch_calls = max_batch_calls
+        self.round_trips = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._pending: Dict[Any, List[_PendingCall]] = {}
+        self._in_flight: set = set()
+
+    def get_service(self, service_cls: Type[ServiceType], mesh: ServiceMesh) -> ServiceType:
+        if service_cls not in self._services:
+            raise LookupError(f"{service_cls.__name__} is not served remotely")
+        return RemoteServiceProxy(self, service_cls, mesh)
+
+    def close(self) -> None:
+        self._client.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"calls": self.calls, "round_trips": self.round_trips}
+
+    def call(
+            self,
+            user_key: Any,
+            tool: str,
+            arguments: Dict[str, Any],
+            invalidate: Optional[Callable[..., None]] = None,
+    ) -> Any:
+        """
+        Run one tool call, sharing a round trip with concurrent calls of the same user.
+
+        ``invalidate`` is called with the cache tags the remote batch
+        invalidated, so the caller can drop its own cached results under them.
+        """
+        pending = _PendingCall(tool, arguments)
+        with self._lock:
+            self.calls += 1
+            self._pending.setdefault(user_key, []).append(pending)
+            lead = user_key not in self._in_flight
+            if lead:
+                self._in_flight.add(user_key)
+        if not lead:
+            # Woken either with a result or to lead the next batch.
+            pending.event.wait()
+        if not pending.done:
+            self._flush(user_key)
+        if pending.error is not None:
+            raise pending.error
+        if invalidate is not None and pending.invalidated:
+            invalidate(*pending.invalidated)
+        return pending.result
+
+    def _flush(self, user_key: Any) -> None:
+        with self._lock:
+            queue = self._pending[user_key]
+            batch, rest = queue[:self.max_batch_calls], queue[self.max_batch_calls:]
+            if rest:
+                self._pending[user_key] = rest
+            else:
+                del self._pending[user_key]
+        try:
+            self._send(user_key, batch)
+        except BaseException as exc:
+            for pending in batch:
+                if not pending.done:
+                    pending.resolve(error=exc)
+        with self._lock:
+            queue = self._pending.get(user_key)
+            if queue:
+                # Hand the next batch to the oldest waiting caller.
+                queue[0].event.set()
+            else:
+                self._in_flight.discard(user_key)
+
+    def _send(self, user_key: Any, batch: List[_PendingCall]) -> None:
+        status_code, body = self._post(user_key, batch)
+        if status_code == 200:
+            # Tags are reported per batch; coalesced calls share a user, so
+            # each of them drops the whole batch's tags.
+            invalidated = body.get("invalidated", [])
+            for pending, result in zip(batch, body["results"]):
+                pending.resolve(result, invalidated=invalidated)
+            return
+        detail = body.get("detail") if isinstance(body, dict) else body
+        if len(batch) == 1 or not (isinstance(detail, dict) and "index" in detail):
+            error_detail = detail["detail"] if isinstance(detail, dict) and "index" in detail else detail
+            for pending in batch:
+                pending.resolve(error=HTTPException(status_code=status_code, detail=error_detail))
+            return
+        # The batch rolled back as a whole; coalesced calls are independent,
+        # so each one is retried on its own.
+        for pending in batch:
+            self._send(user_key, [pending])
+
+    def _post(self, user_key: Any, batch: List[_PendingCall]) -> Tuple[int, Any]:
+        payload = {"calls": [{"tool": pending.tool, "arguments": pending.arguments} for pending in batch]}
+        headers = {"Content-Type": "application/json"}
+        if user_key is not None:
+            headers["X-User-Id"] = str(user_key)
+        started = time.perf_counter()
+        try:
+            response = self._client.post(BATCH_PATH, content=orjson.dumps(payload), headers=headers)
+        except httpx.TransportError:
+            self.breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success(time.perf_counter() - started)
+        with self._lock:
+            self.round_trips += 1
+        return response.status_code, orjson.loads(response.content)
+
+
+class RemoteServiceProxy:
+    """
+    Stand-in for a service instance whose tool methods run remotely.
+
+    The remote process only invalidates its own result cache, so after each
+    successful call the tool's ``invalidates`` tags, and any tags the remote
+    batch reports, are invalidated in this process through the mesh.
+    """
+
+    def __init__(self, transport: RemoteServiceTransport, service_cls: Type[Any], mesh: ServiceMesh) -> None:
+        self._transport = transport
+        self._mesh = mesh
+        self._specs = get_service_tool_specs(service_cls)
+        self.service_cls = service_cls
+
+    def __getattr__(self, attr_name: str) -> Callable[..., Any]:
+        spec = self.__dict__["_specs"].get(attr_name)
+        if spec is None:
+            raise AttributeError(f"{self.service_cls.__name__}.{attr_name} is not a remote service tool")
+        method = self._bind(spec)
+        setattr(self, attr_name, method)
+        return method
+
+    def _bind(self, spec: ToolSpec) -> Callable[..., Any]:
+        transport, mesh = self._transport, self._mesh
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            bound = spec.signature.bind(*args, **kwargs)
+            arguments = spec.arguments_model.model_validate(bound.arguments).model_dump(mode="json", exclude_unset=True)
+            result = transport.call(mesh.user_key, spec.name, arguments, invalidate=mesh.invalidate)
+            if spec.invalidates:
+                bound.apply_defaults()
+                mesh.invalidate(*(tag.format(**bound.arguments) for tag in spec.invalidates))
+            if spec.result_adapter is None:
+                return None
+            return spec.result_adapter.validate_python(result)
+
+        call.__name__ = spec.attr_name
+        call.__doc__ = spec.description
+        return call
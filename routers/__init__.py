@@ -1,6 +1,10 @@
+from routers.changes import router as changes_router
 from routers.meetings import router as meetings_router
+from routers.metrics import router as metrics_router
 from routers.notes import router as notes_router
+from routers.search import router as search_router
 from routers.tasks import router as tasks_router
+from routers.tools import router as tools_router
 from routers.users import router as users_router
 
 __all__ = [
@@ -8,4 +12,8 @@ __all__ = [
     "meetings_router",
     "notes_router",
     "tasks_router",
+    "metrics_router",
+    "tools_router",
+    "search_router",
+    "changes_router",
 ]
\ No newline at end of file
@@ -0,0 +1,76 @@
+import asyncio
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+import schemas
+from dependencies import get_service_mesh
+from pagination import set_next_cursor
+from service_mesh import ServiceMesh
+from services import CHANGE_PAGE_SIZE, ChangeService
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+# The stream polls the change log every CHANGE_POLL_INTERVAL seconds, sends a
+# comment when idle for KEEPALIVE_INTERVAL seconds so proxies keep it open,
+# and ends after `duration` seconds; EventSource clients then reconnect with
+# Last-Event-ID after RECONNECT_DELAY_MS.
+CHANGE_POLL_INTERVAL = 1.0
+KEEPALIVE_INTERVAL = 15.0
+MAX_STREAM_SECONDS = 300
+RECONNECT_DELAY_MS = 1000
+
+
+@router.get("/", response_model=List[schemas.Change])
+def list_changes(
+        response: Response,
+        since: int = Query(0, ge=0, description="Cursor: id of the last change already seen."),
+        limit: int = Query(CHANGE_PAGE_SIZE, ge=1, le=CHANGE_PAGE_SIZE, description="Maximum number of changes to return."),
+        mesh: ServiceMesh = Depends(get_service_mesh),
+):
+    """
+    Meetings, notes and tasks changed after `since`, each with its latest change and current data.
+    """
+    return set_next_cursor(response, mesh.get_service(ChangeService).list_changes(since=since, limit=limit), limit)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_changes(
+        request: Request,
+        since: int = Query(0, ge=0, description="Cursor: id of the last change already seen."),
+        duration: float = Query(60, ge=0, le=MAX_STREAM_SECONDS, description="Seconds to keep the stream open."),
+        last_event_id: Optional[int] = Header(None, description="Cursor sent by reconnecting EventSource clients."),
+        mesh: ServiceMesh = Depends(get_service_mesh),
+):
+    """
+    Server-Sent Events stream of changes after `since` (or `Last-Event-ID`), one `change` event per row.
+    """
+    service = mesh.get_service(ChangeService)
+    cursor = last_event_id if last_event_id is not None else since
+
+    async def events():
+        position = cursor
+        loop = asyncio.get_running_loop()
+        last_sent = loop.time()
+        deadline = last_sent + duration
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        while True:
+            changes = await run_in_threadpool(service.list_changes, since=position)
+            for change in changes:
+                position = change["id"]
+                yield f"id: {position}\nevent: change\ndata: {schemas.Change.model_validate(change).model_dump_json()}\n\n"
+            if len(changes) == CHANGE_PAGE_SIZE:
+                continue
+            now = loop.time()
+            if changes:
+                last_sent = now
+            elif now - last_sent >= KEEPALIVE_INTERVAL:
+                yield ": keepalive\n\n"
+                last_sent = now
+            if now >= deadline or await request.is_disconnected():
+                return
+            await asyncio.sleep(min(CHANGE_POLL_INTERVAL, deadline - now))
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
@@ -1,9 +1,12 @@
-from typing import List
+from datetime import date, datetime
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 
 import schemas
+from conditional import not_modified_response, set_entity_tag
 from dependencies import get_service_mesh
+from pagination import PageParams, model_response, ndjson_response, projection_response, streams_entities
 from service_mesh import ServiceMesh
 from services import MeetingService
 
@@ -11,7 +14,7 @@ router = APIRouter(prefix="/meetings", tags=["meetings"])
 
 
 @router.post("/", response_model=schemas.Meeting, status_code=201)
-async def create_meeting(meeting: schemas.MeetingCreate, mesh: ServiceMesh = Depends(get_service_mesh)):
+def create_meeting(meeting: schemas.MeetingCreate, mesh: ServiceMesh = Depends(get_service_mesh)):
     """
     Create a new meeting with attendees.
     """
@@ -19,23 +22,55 @@ async def create_meeting(meeting: schemas.MeetingCreate, mesh: ServiceMesh = Dep
 
 
 @router.get("/", response_model=List[schemas.Meeting])
-async def list_meetings(mesh: ServiceMesh = Depends(get_service_mesh)):
+def list_meetings(
+        scheduled_from: Optional[datetime] = Query(None, alias="from", description="Only meetings scheduled at or after this time."),
+        scheduled_to: Optional[datetime] = Query(None, alias="to", description="Only meetings scheduled before this time."),
+        attendee_id: Optional[int] = Query(None, description="Only meetings this user attends."),
+        page: PageParams = Depends(),
+        mesh: ServiceMesh = Depends(get_service_mesh),
+):
     """
-    List all meetings.
+    List meetings, optionally filtered by time window and attendee, paginated by id cursor or streamed as NDJSON.
     """
-    return mesh.get_service(MeetingService).list_meetings()
+    service = mesh.get_service(MeetingService)
+    filters = {"scheduled_from": scheduled_from, "scheduled_to": scheduled_to, "attendee_id": attendee_id}
+    if streams_entities(page, service, MeetingService):
+        return ndjson_response(service.iter_meetings(after_id=page.after_id, limit=page.limit, **filters), schemas.Meeting)
+    rows = service.list_meeting_fields(page.fields, after_id=page.after_id, limit=page.limit, **filters)
+    return projection_response(rows, page)
+
+
+@router.get("/calendar", response_model=schemas.Calendar)
+def get_calendar(
+        anchor: date = Query(..., alias="date", description="Any day in the week or month to show."),
+        view: Literal["week", "month"] = Query("week", description="Calendar window."),
+        mesh: ServiceMesh = Depends(get_service_mesh),
+):
+    """
+    Compact calendar of the meetings in a week (Monday to Sunday) or month.
+    """
+    return mesh.get_service(MeetingService).calendar(anchor, view)
 
 
 @router.get("/{meeting_id}", response_model=schemas.MeetingWithDetails)
-async def get_meeting(meeting_id: int, mesh: ServiceMesh = Depends(get_service_mesh)):
+def get_meeting(meeting_id: int, request: Request, mesh: ServiceMesh = Depends(get_service_mesh)):
     """
     Get a specific meeting with all details (attendees, notes, tasks).
+
+    Answers 304 after a version check alone when `If-None-Match` holds the current ETag.
     """
-    return mesh.get_service(MeetingService).get_meeting(meeting_id)
+    service = mesh.get_service(MeetingService)
+    not_modified = not_modified_response(request, "meeting", meeting_id, lambda: service.get_meeting_version(meeting_id))
+    if not_modified is not None:
+        return not_modified
+    meeting = service.get_meeting(meeting_id)
+    response = model_response(meeting)
+    set_entity_tag(response, "meeting", meeting_id, meeting.version)
+    return response
 
 
 @router.put("/{meeting_id}", response_model=schemas.Meeting)
-async def update_meeting(
+def update_meeting(
         meeting_id: int,
         meeting: schemas.MeetingUpdate,
         mesh: ServiceMesh = Depends(get_service_mesh),
@@ -47,7 +82,7 @@ async def update_meeting(
 
 
 @router.delete("/{meeting_id}", status_code=204)
-async def delete_meeting(meeting_id: int, mesh: ServiceMesh = Depends(get_service_mesh)):
+def delete_meeting(meeting_id: int, mesh: ServiceMesh = Depends(get_service_mesh)):
     """
     Delete a meeting.
     """
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Request
+
+from auth import principal_cache
+from service_mesh import result_cache
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/")
+def get_metrics(request: Request):
+    """
+    Runtime counters for the in-process caches and service transport routing.
+    """
+    return {
+        "auth_cache": principal_cache.stats(),
+        "result_cache": result_cache.stats(),
+        "transport": request.app.state.mesh_factory.transport.stats(),
+    }
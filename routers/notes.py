@@ -1,9 +1,11 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 import schemas
+from conditional import not_modified_response, set_entity_tag
 from dependencies import get_service_mesh
+from pagination import PageParams, ndjson_response, projection_response, streams_entities
 from service_mesh import ServiceMesh
 from services import NoteService
 
@@ -11,27 +13,47 @@ router = APIRouter(prefix="/notes", tags=["notes"])
 
 
 @router.post("/", response_model=schemas.Note, status_code=201)
-async def create_note(note: schemas.NoteCreate, mesh: ServiceMesh = Depends(get_service_mesh)):
+def create_note(note: schemas.NoteCreate, mesh: ServiceMesh = Depends(get_service_mesh)):
     """
     Create a new note for a meeting.
     """
     return mesh.get_service(NoteService).create_note(note)
 
 
+@router.post("/bulk", response_model=List[schemas.Note], status_code=201)
+def create_notes(notes: List[schemas.NoteCreate], mesh: ServiceMesh = Depends(get_service_mesh)):
+    """
+    Create many notes in a single transaction.
+    """
+    return mesh.get_service(NoteService).create_notes(notes)
+
+
 @router.get("/", response_model=List[schemas.Note])
-async def list_notes(
+def list_notes(
         meeting_id: Optional[int] = Query(None),
+        page: PageParams = Depends(),
         mesh: ServiceMesh = Depends(get_service_mesh),
 ):
     """
-    List all notes, optionally filtered by meeting_id.
+    List notes, optionally filtered by meeting_id, paginated by id cursor or streamed as NDJSON.
     """
-    return mesh.get_service(NoteService).list_notes(meeting_id=meeting_id)
+    service = mesh.get_service(NoteService)
+    if streams_entities(page, service, NoteService):
+        rows = service.iter_notes(meeting_id=meeting_id, after_id=page.after_id, limit=page.limit)
+        return ndjson_response(rows, schemas.Note)
+    rows = service.list_note_fields(page.fields, meeting_id=meeting_id, after_id=page.after_id, limit=page.limit)
+    return projection_response(rows, page)
 
 
 @router.get("/{note_id}", response_model=schemas.Note)
-async def get_note(note_id: int, mesh: ServiceMesh = Depends(get_service_mesh)):
+def get_note(note_id: int, request: Request, response: Response, mesh: ServiceMesh = Depends(get_service_mesh)):
     """
-    Get a specific note by ID.
+    Get a specific note by ID; answers 304 when `If-None-Match` holds the current ETag.
     """
-    return mesh.get_service(NoteService).get_note(note_id)
\ No newline at end of file
+    service = mesh.get_service(NoteService)
+    not_modified = not_modified_response(request, "note", note_id, lambda: service.get_note_version(note_id))
+    if not_modified is not None:
+        return not_modified
+    note = service.get_note(note_id)
+    set_entity_tag(response, "note", note_id, note.version)
+    return note
\ No newline at end of file
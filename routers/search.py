@@ -0,0 +1,30 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, Response
+
+import schemas
+from dependencies import get_service_mesh
+from pagination import NEXT_OFFSET_HEADER
+from service_mesh import ServiceMesh
+from services import SearchService
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+MAX_SEARCH_PAGE_SIZE = 100
+
+
+@router.get("/", response_model=List[schemas.SearchResult])
+def search(
+        response: Response,
+        q: str = Query(..., min_length=1, max_length=256, description="Words that must all appear in a result."),
+        offset: int = Query(0, ge=0, description="Number of ranked results to skip."),
+        limit: int = Query(20, ge=1, le=MAX_SEARCH_PAGE_SIZE, description="Maximum number of results to return."),
+        mesh: ServiceMesh = Depends(get_service_mesh),
+):
+    """
+    Search meetings, notes and tasks; results are ranked by relevance and paginated by offset.
+    """
+    results = mesh.get_service(SearchService).search(q, offset=offset, limit=limit)
+    if len(results) == limit:
+        response.headers[NEXT_OFFSET_HEADER] = str(offset + limit)
+    return results
@@ -1,9 +1,11 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 import schemas
+from conditional import not_modified_response, set_entity_tag
 from dependencies import get_service_mesh
+from pagination import PageParams, ndjson_response, projection_response, streams_entities
 from service_mesh import ServiceMesh
 from services import TaskService
 
@@ -11,35 +13,62 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
 @router.post("/", response_model=schemas.Task, status_code=201)
-async def create_task(task: schemas.TaskCreate, mesh: ServiceMesh = Depends(get_service_mesh)):
+def create_task(task: schemas.TaskCreate, mesh: ServiceMesh = Depends(get_service_mesh)):
     """
     Create a new task that is due at a specific meeting.
     """
     return mesh.get_service(TaskService).create_task(task)
 
 
+@router.post("/bulk", response_model=List[schemas.Task], status_code=201)
+def create_tasks(tasks: List[schemas.TaskCreate], mesh: ServiceMesh = Depends(get_service_mesh)):
+    """
+    Create many tasks in a single transaction.
+    """
+    return mesh.get_service(TaskService).create_tasks(tasks)
+
+
+@router.put("/bulk/status", response_model=List[schemas.Task])
+def update_task_statuses(update: schemas.TaskStatusBulkUpdate, mesh: ServiceMesh = Depends(get_service_mesh)):
+    """
+    Set the status of many tasks at once.
+    """
+    return mesh.get_service(TaskService).update_task_statuses(update.task_ids, update.status)
+
+
 @router.get("/", response_model=List[schemas.Task])
-async def list_tasks(
+def list_tasks(
         meeting_id: Optional[int] = Query(None),
         status: Optional[str] = Query(None),
+        page: PageParams = Depends(),
         mesh: ServiceMesh = Depends(get_service_mesh),
 ):
     """
-    List all tasks, optionally filtered by meeting_id or status.
+    List tasks, optionally filtered by meeting_id or status, paginated by id cursor or streamed as NDJSON.
     """
-    return mesh.get_service(TaskService).list_tasks(meeting_id=meeting_id, status_filter=status)
+    service = mesh.get_service(TaskService)
+    filters = dict(meeting_id=meeting_id, status_filter=status, after_id=page.after_id, limit=page.limit)
+    if streams_entities(page, service, TaskService):
+        return ndjson_response(service.iter_tasks(**filters), schemas.Task)
+    return projection_response(service.list_task_fields(page.fields, **filters), page)
 
 
 @router.get("/{task_id}", response_model=schemas.Task)
-async def get_task(task_id: int, mesh: ServiceMesh = Depends(get_service_mesh)):
+def get_task(task_id: int, request: Request, response: Response, mesh: ServiceMesh = Depends(get_service_mesh)):
     """
-    Get a specific task by ID.
+    Get a specific task by ID; answers 304 when `If-None-Match` holds the current ETag.
     """
-    return mesh.get_service(TaskService).get_task(task_id)
+    service = mesh.get_service(TaskService)
+    not_modified = not_modified_response(request, "task", task_id, lambda: service.get_task_version(task_id))
+    if not_modified is not None:
+        return not_modified
+    task = service.get_task(task_id)
+    set_entity_tag(response, "task", task_id, task.version)
+    return task
 
 
 @router.put("/{task_id}", response_model=schemas.Task)
-async def update_task(
+def update_task(
         task_id: int,
         task: schemas.TaskUpdate,
         mesh: ServiceMesh = Depends(get_service_mesh),
@@ -51,7 +80,7 @@ async def update_task(
 
 
 @router.delete("/{task_id}", status_code=204)
-async def delete_task(task_id: int, mesh: ServiceMesh = Depends(get_service_mesh)):
+def delete_task(task_id: int, mesh: ServiceMesh = Depends(get_service_mesh)):
     """
     Delete a task.
     """
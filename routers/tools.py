@@ -0,0 +1,32 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException
+
+import schemas
+from dependencies import get_service_mesh
+from service_mesh import ServiceMesh, ToolBatchError
+
+router = APIRouter(prefix="/tools", tags=["tools"])
+
+
+@router.get("/", response_model=List[schemas.ToolDefinition])
+def list_tools():
+    """
+    List the service tools with the JSON schemas of their arguments and results.
+    """
+    return [tool.to_schema() for tool in ServiceMesh(user=None, db=None).get_tools()]
+
+
+@router.post("/batch", response_model=schemas.ToolBatchResponse)
+def execute_batch(batch: schemas.ToolBatchRequest, mesh: ServiceMesh = Depends(get_service_mesh)):
+    """
+    Run many tool calls in one transaction; if any call fails, none of them is applied.
+    """
+    try:
+        results = mesh.execute_batch([(call.tool, call.arguments) for call in batch.calls])
+    except ToolBatchError as exc:
+        raise HTTPException(
+            status_code=exc.status_code,
+            detail={"index": exc.index, "tool": exc.tool, "detail": exc.detail},
+        )
+    return {"results": results, "invalidated": mesh.invalidated_tags}
@@ -1,9 +1,11 @@
 from typing import List
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
 import schemas
+from conditional import not_modified_response, set_entity_tag
 from dependencies import get_optional_service_mesh, get_service_mesh
+from pagination import PageParams, ndjson_response, projection_response, streams_entities
 from service_mesh import ServiceMesh
 from services import UserService
 
@@ -11,24 +13,44 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.post("/", response_model=schemas.User, status_code=201)
-async def create_user(user: schemas.UserCreate, mesh: ServiceMesh = Depends(get_optional_service_mesh)):
+def create_user(user: schemas.UserCreate, mesh: ServiceMesh = Depends(get_optional_service_mesh)):
     """
     Create a new user.
     """
     return mesh.get_service(UserService).create_user(user)
 
 
+@router.post("/bulk", response_model=List[schemas.User], status_code=201)
+def create_users(users: List[schemas.UserCreate], mesh: ServiceMesh = Depends(get_service_mesh)):
+    """
+    Create many users in a single transaction.
+    """
+    return mesh.get_service(UserService).create_users(users)
+
+
 @router.get("/", response_model=List[schemas.User])
-async def list_users(mesh: ServiceMesh = Depends(get_service_mesh)):
+def list_users(
+        page: PageParams = Depends(),
+        mesh: ServiceMesh = Depends(get_service_mesh),
+):
     """
-    List all users.
+    List users, paginated by id cursor or streamed as NDJSON.
     """
-    return mesh.get_service(UserService).list_users()
+    service = mesh.get_service(UserService)
+    if streams_entities(page, service, UserService):
+        return ndjson_response(service.iter_users(after_id=page.after_id, limit=page.limit), schemas.User)
+    return projection_response(service.list_user_fields(page.fields, after_id=page.after_id, limit=page.limit), page)
 
 
 @router.get("/{user_id}", response_model=schemas.User)
-async def get_user(user_id: int, mesh: ServiceMesh = Depends(get_service_mesh)):
+def get_user(user_id: int, request: Request, response: Response, mesh: ServiceMesh = Depends(get_service_mesh)):
     """
-    Get a specific user by ID.
+    Get a specific user by ID; answers 304 when `If-None-Match` holds the current ETag.
     """
-    return mesh.get_service(UserService).get_user(user_id)
\ No newline at end of file
+    service = mesh.get_service(UserService)
+    not_modified = not_modified_response(request, "user", user_id, lambda: service.get_user_version(user_id))
+    if not_modified is not None:
+        return not_modified
+    user = service.get_user(user_id)
+    set_entity_tag(response, "user", user_id, user.version)
+    return user
\ No newline at end of file
@@ -1,6 +1,17 @@
-from schemas.meetings import Meeting, MeetingBase, MeetingCreate, MeetingUpdate, MeetingWithDetails
+from schemas.changes import Change
+from schemas.meetings import (
+    Calendar,
+    CalendarEntry,
+    Meeting,
+    MeetingBase,
+    MeetingCreate,
+    MeetingUpdate,
+    MeetingWithDetails,
+)
 from schemas.notes import Note, NoteBase, NoteCreate
-from schemas.tasks import Task, TaskBase, TaskCreate, TaskUpdate
+from schemas.search import SearchResult
+from schemas.tasks import Task, TaskBase, TaskCreate, TaskStatusBulkUpdate, TaskUpdate
+from schemas.tools import ToolBatchRequest, ToolBatchResponse, ToolCall, ToolDefinition
 from schemas.users import User, UserBase, UserCreate
 
 __all__ = [
@@ -12,11 +23,20 @@ __all__ = [
     "MeetingUpdate",
     "Meeting",
     "MeetingWithDetails",
+    "CalendarEntry",
+    "Calendar",
     "NoteBase",
     "NoteCreate",
     "Note",
     "TaskBase",
     "TaskCreate",
     "TaskUpdate",
+    "TaskStatusBulkUpdate",
     "Task",
+    "SearchResult",
+    "Change",
+    "ToolDefinition",
+    "ToolCall",
+    "ToolBatchRequest",
+    "ToolBatchResponse",
 ]
\ No newline at end of file
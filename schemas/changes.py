@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class Change(BaseModel):
+    id: int = Field(..., description="Change cursor; pass the last one seen as `since`.", examples=[42])
+    entity: Literal["meeting", "note", "task"] = Field(..., description="Kind of the changed row.", examples=["task"])
+    entity_id: int = Field(..., description="Identifier of the changed row.", examples=[5])
+    action: Literal["created", "updated", "deleted"] = Field(..., description="What happened to the row.", examples=["updated"])
+    changed_at: datetime = Field(..., description="Time of the change.", examples=["2024-01-15T10:00:00Z"])
+    data: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Current state of the row in its list schema; null when it was deleted.",
+        examples=[{"id": 5, "title": "Ship it", "status": "completed", "due_meeting_id": 1}],
+    )
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -29,6 +29,14 @@ class Meeting(MeetingBase):
     id: int = Field(..., description="Meeting identifier.", examples=[3])
     created_at: datetime = Field(..., description="Meeting creation time.", examples=["2024-01-10T09:00:00Z"])
     attendees: List[User] = Field(default_factory=list, description="List of attendees.")
+    notes_count: int = Field(0, description="Number of notes.", examples=[2])
+    tasks_count: int = Field(0, description="Number of tasks.", examples=[5])
+    pending_tasks_count: int = Field(0, description="Number of pending tasks.", examples=[3])
+    completed_tasks_count: int = Field(0, description="Number of completed tasks.", examples=[1])
+    cancelled_tasks_count: int = Field(0, description="Number of cancelled tasks.", examples=[1])
+    version: int = Field(
+        1, description="Version of the meeting with its attendees, notes and tasks; changes with any of them.", examples=[4],
+    )
 
     class Config:
         from_attributes = True
@@ -39,4 +47,21 @@ class MeetingWithDetails(Meeting):
     tasks: List[Task] = Field(default_factory=list, description="Tasks associated with the meeting.")
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class CalendarEntry(BaseModel):
+    id: int = Field(..., description="Meeting identifier.", examples=[3])
+    title: str = Field(..., description="Meeting title.", examples=["Sprint Planning"])
+    scheduled_time: datetime = Field(..., description="Scheduled date and time.", examples=["2024-01-15T10:00:00Z"])
+    attendee_count: int = Field(..., description="Number of attendees.", examples=[4])
+
+    class Config:
+        from_attributes = True
+
+
+class Calendar(BaseModel):
+    view: Literal["week", "month"] = Field(..., description="Calendar window.", examples=["week"])
+    start: date = Field(..., description="First day of the window.", examples=["2024-01-15"])
+    end: date = Field(..., description="First day after the window.", examples=["2024-01-22"])
+    meetings: List[CalendarEntry] = Field(default_factory=list, description="Meetings in the window, by time.")
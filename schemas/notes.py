@@ -15,6 +15,7 @@ class Note(NoteBase):
     id: int = Field(..., description="Note identifier.", examples=[10])
     meeting_id: int = Field(..., description="ID of the meeting associated with the note.", examples=[1])
     created_at: datetime = Field(..., description="Note creation time.", examples=["2024-01-15T10:00:00Z"])
+    version: int = Field(1, description="Row version; changes on every update.", examples=[1])
 
     class Config:
         from_attributes = True
\ No newline at end of file
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+
+
+class SearchResult(BaseModel):
+    kind: str = Field(..., description="Kind of the matching record (meeting, note, task).", examples=["note"])
+    id: int = Field(..., description="Identifier of the matching record.", examples=[10])
+    meeting_id: int = Field(..., description="ID of the meeting the record belongs to.", examples=[1])
+    title: str = Field(..., description="Meeting or task title; empty for notes.", examples=[""])
+    snippet: str = Field(
+        ...,
+        description="Excerpt of the matching text with the matched terms wrapped in <mark> tags.",
+        examples=["We agreed on the Q3 <mark>budget</mark> and…"],
+    )
+    rank: float = Field(..., description="BM25 relevance; lower is a better match.", examples=[-4.2])
+
+    class Config:
+        from_attributes = True
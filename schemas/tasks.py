@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -21,10 +21,16 @@ class TaskUpdate(BaseModel):
     due_meeting_id: Optional[int] = Field(None, description="ID of the meeting the task is due at.", examples=[2])
 
 
+class TaskStatusBulkUpdate(BaseModel):
+    task_ids: List[int] = Field(..., description="IDs of the tasks to update.", examples=[[5, 6]])
+    status: str = Field(..., description="New task status (pending, completed, cancelled).", examples=["completed"])
+
+
 class Task(TaskBase):
     id: int = Field(..., description="Task identifier.", examples=[5])
     due_meeting_id: int = Field(..., description="ID of the meeting the task is due at.", examples=[1])
     created_at: datetime = Field(..., description="Task creation time.", examples=["2024-01-15T10:00:00Z"])
+    version: int = Field(1, description="Row version; changes on every update.", examples=[2])
 
     class Config:
         from_attributes = True
\ No newline at end of file
@@ -0,0 +1,31 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+# Upper bound for the calls of a single batch request.
+MAX_BATCH_CALLS = 100
+
+
+class ToolDefinition(BaseModel):
+    name: str = Field(..., description="Tool name, namespaced by service.", examples=["notes.create_note"])
+    description: str = Field(..., description="What the tool does.", examples=["Create a note for a meeting."])
+    parameters: Dict[str, Any] = Field(..., description="JSON schema of the tool's arguments.")
+    returns: Optional[Dict[str, Any]] = Field(None, description="JSON schema of the tool's result, if it returns one.")
+    read_only: bool = Field(..., description="Whether the tool only reads data.", examples=[True])
+
+
+class ToolCall(BaseModel):
+    tool: str = Field(..., description="Name of the tool to call.", examples=["meetings.get_meeting"])
+    arguments: Dict[str, Any] = Field(default_factory=dict, description="Tool arguments by name.", examples=[{"meeting_id": 1}])
+
+
+class ToolBatchRequest(BaseModel):
+    calls: List[ToolCall] = Field(..., min_length=1, max_length=MAX_BATCH_CALLS, description="Tool calls, run in order.")
+
+
+class ToolBatchResponse(BaseModel):
+    results: List[Any] = Field(..., description="Result of each call, in call order.")
+    invalidated: List[str] = Field(
+        default_factory=list,
+        description="Cache tags the calls invalidated, for callers that cache tool results themselves.",
+    )
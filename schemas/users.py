@@ -11,7 +11,10 @@ class UserCreate(UserBase):
 
 
 class User(UserBase):
+    # Validated as EmailStr on input; not re-validated on every response.
+    email: str = Field(..., description="User email.", examples=["maria@example.com"])
     id: int = Field(..., description="User identifier.", examples=[1])
+    version: int = Field(1, description="Row version; changes on every update.", examples=[1])
 
     class Config:
         from_attributes = True
\ No newline at end of file
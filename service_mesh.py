@@ -1,7 +1,32 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Protocol, Type, TypeVar
+import functools
+import inspect
+import threading
+import time
+import typing
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from fastapi import HTTPException
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
 
 
 ServiceType = TypeVar("ServiceType")
@@ -17,32 +42,305 @@ class LocalServiceTransport:
         return service_cls(mesh=mesh, db=mesh.db, user=mesh.user)
 
 
+class CircuitBreaker:
+    """
+    Health of one transport: consecutive failures open the circuit, and after
+    ``reset_timeout`` seconds a single probe call decides whether it closes again.
+
+    Also keeps an exponentially weighted moving average of call latency.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+            self,
+            failure_threshold: int = 5,
+            reset_timeout: float = 10.0,
+            latency_alpha: float = 0.2,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.latency_alpha = latency_alpha
+        self._clock = clock
+        self.state = self.CLOSED
+        self.successes = 0
+        self.failures = 0
+        self.trips = 0
+        self.latency: Optional[float] = None
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go through; in the open state only one probe per
+        ``reset_timeout`` is let through.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = self._clock()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._opened_at = now
+            return True
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            self.successes += 1
+            self._consecutive_failures = 0
+            self.state = self.CLOSED
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += self.latency_alpha * (latency - self.latency)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.trips += 1
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "successes": self.successes,
+                "failures": self.failures,
+                "trips": self.trips,
+                "latency_ms": round(self.latency * 1000, 3) if self.latency is not None else None,
+            }
+
+
 class CompositeServiceTransport:
-    def __init__(self, transports: List[ServiceTransport]):
+    """
+    Route each service class to the first healthy transport that hosts it.
+
+    A transport raising ``LookupError`` does not host the service and is never
+    asked for it again. Any other error counts against the transport's
+    ``CircuitBreaker``; while its circuit is open the transport is skipped, so
+    a failing backend costs one check instead of one failed attempt per call.
+    Transports that observe their own call-time health expose it as a
+    ``breaker`` attribute, which is used instead of a private one.
+    """
+
+    def __init__(self, transports: List[ServiceTransport], **breaker_options: Any):
         self._transports = transports
+        self._self_reporting = [getattr(transport, "breaker", None) is not None for transport in transports]
+        self._breakers = [
+            getattr(transport, "breaker", None) or CircuitBreaker(**breaker_options) for transport in transports
+        ]
+        # Indices of the transports that may host each service class, in priority order.
+        self._routes: Dict[Type[Any], List[int]] = {}
+        self._lock = threading.Lock()
+        self.failovers = 0
+        self.skips = 0
 
     def get_service(self, service_cls: Type[ServiceType], mesh: "ServiceMesh") -> ServiceType:
+        route = self._routes.get(service_cls)
+        if route is None:
+            route = list(range(len(self._transports)))
         last_error: Optional[Exception] = None
-        for transport in self._transports:
+        failed_over = False
+        for index in route:
+            breaker = self._breakers[index]
+            if not breaker.allow():
+                with self._lock:
+                    self.skips += 1
+                failed_over = True
+                continue
+            started = time.perf_counter()
             try:
-                return transport.get_service(service_cls, mesh)
+                service = self._transports[index].get_service(service_cls, mesh)
+            except LookupError as exc:
+                self._drop_route(service_cls, index)
+                last_error = exc
+                continue
             except Exception as exc:
+                breaker.record_failure()
+                failed_over = True
                 last_error = exc
+                continue
+            if not self._self_reporting[index]:
+                breaker.record_success(time.perf_counter() - started)
+            if failed_over:
+                with self._lock:
+                    self.failovers += 1
+            return service
         if last_error is not None:
             raise last_error
-        raise RuntimeError("No service transports configured")
+        raise RuntimeError(f"No healthy service transport for {service_cls.__name__}")
+
+    def close(self) -> None:
+        for transport in self._transports:
+            close = getattr(transport, "close", None)
+            if close is not None:
+                close()
 
+    def _drop_route(self, service_cls: Type[Any], index: int) -> None:
+        with self._lock:
+            route = self._routes.get(service_cls, range(len(self._transports)))
+            self._routes[service_cls] = [candidate for candidate in route if candidate != index]
 
-class CachedServiceTransport:
-    def __init__(self, inner: ServiceTransport):
-        self._inner = inner
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {"failovers": self.failovers, "skips": self.skips}
+        return {
+            **counters,
+            "transports": [
+                {"transport": type(transport).__name__, **breaker.stats()}
+                for transport, breaker in zip(self._transports, self._breakers)
+            ],
+        }
 
-    def get_service(self, service_cls: Type[ServiceType], mesh: "ServiceMesh") -> ServiceType:
-        if service_cls in mesh._cache:
-            return mesh._cache[service_cls]
-        service = self._inner.get_service(service_cls, mesh)
-        mesh._cache[service_cls] = service
-        return service
+
+CacheKey = Tuple[Any, str, Hashable]
+
+# For this many seconds after a user's write, their reads go to the primary
+# instead of the replica, so a lagging replica can neither answer with (nor
+# cache) results older than the write.
+READ_YOUR_WRITES_SECONDS = 5.0
+
+
+class ResultCache:
+    """
+    Process-wide LRU of tool results keyed by user, tool and arguments.
+
+    Entries are grouped under per-user tags; invalidating a tag drops every
+    entry filed under it. Each user also carries a generation so a result
+    computed while one of that user's writes invalidated tags is not stored,
+    and the time of their last write, for ``written_since``.
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, int, Tuple[Tuple[Any, str], ...]]]" = OrderedDict()
+        self._tagged: Dict[Tuple[Any, str], Set[CacheKey]] = {}
+        self._generations: Dict[Any, int] = {}
+        self._written_at: Dict[Any, float] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def generation(self, user_key: Any) -> int:
+        with self._lock:
+            return self._generations.get(user_key, 0)
+
+    def written_since(self, user_key: Any, seconds: float) -> bool:
+        """
+        Whether the user invalidated any of their results in the last ``seconds``.
+        """
+        with self._lock:
+            written_at = self._written_at.get(user_key)
+        return written_at is not None and time.monotonic() - written_at < seconds
+
+    def put(self, key: CacheKey, value: Any, size: int, tags: Sequence[str], generation: int) -> None:
+        user_key = key[0]
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if self._generations.get(user_key, 0) != generation:
+                return
+            self._discard(key)
+            tag_keys = tuple((user_key, tag) for tag in tags)
+            self._entries[key] = (value, size, tag_keys)
+            self._bytes += size
+            for tag_key in tag_keys:
+                self._tagged.setdefault(tag_key, set()).add(key)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, user_key: Any, tags: Iterable[str]) -> None:
+        with self._lock:
+            self._generations[user_key] = self._generations.get(user_key, 0) + 1
+            self._written_at[user_key] = time.monotonic()
+            for tag in tags:
+                tag_key = (user_key, tag)
+                for key in list(self._tagged.pop(tag_key, ())):
+                    self._discard(key)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tagged.clear()
+            self._generations.clear()
+            self._written_at.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _discard(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry[1]
+        for tag_key in entry[2]:
+            keys = self._tagged.get(tag_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[tag_key]
+
+
+result_cache = ResultCache()
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    if hasattr(value, "model_dump"):
+        return _freeze(value.model_dump())
+    hash(value)
+    return value
+
+
+class ToolBatchError(Exception):
+    """
+    A call in ``ServiceMesh.execute_batch`` failed; the whole batch was rolled back.
+    """
+
+    def __init__(self, index: int, tool: str, status_code: int, detail: Any) -> None:
+        super().__init__(f"Tool call {index} ({tool}) failed with status {status_code}")
+        self.index = index
+        self.tool = tool
+        self.status_code = status_code
+        self.detail = detail
 
 
 @dataclass
@@ -50,54 +348,421 @@ class ServiceTool:
     name: str
     description: str
     callable: Callable[..., Any]
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    returns: Optional[Dict[str, Any]] = None
+    read_only: bool = False
+
+    def to_schema(self) -> Dict[str, Any]:
+        """
+        JSON-serializable definition of the tool, as handed to an agent.
+        """
+        return {
+            "name": self.name,
+            "description": self.description,
+            "parameters": self.parameters,
+            "returns": self.returns,
+            "read_only": self.read_only,
+        }
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """
+    Tool metadata computed once when its service class is registered.
+    """
+
+    name: str
+    description: str
+    service_cls: Type[Any]
+    attr_name: str
+    signature: inspect.Signature
+    arguments_model: Type[BaseModel]
+    parameters: Dict[str, Any]
+    read_only: bool
+    response_model: Any
+    result_adapter: Optional[TypeAdapter]
+    returns: Optional[Dict[str, Any]]
+    invalidates: Tuple[str, ...] = ()
+
+    def dump_result(self, result: Any) -> Any:
+        """
+        Convert a tool result to JSON-compatible data through its response model.
+        """
+        if self.result_adapter is None:
+            return None
+        value = self.result_adapter.validate_python(result, from_attributes=True)
+        return self.result_adapter.dump_python(value, mode="json")
+
+    def bind(self, mesh: "ServiceMesh") -> Callable[..., Any]:
+        """
+        Return a callable that resolves the service through ``mesh`` on first use.
+        """
+        service_cls, attr_name = self.service_cls, self.attr_name
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return getattr(mesh.get_service(service_cls), attr_name)(*args, **kwargs)
+
+        call.__name__ = attr_name
+        call.__qualname__ = self.name
+        call.__doc__ = self.description
+        call.__signature__ = self.signature
+        return call
 
 
 _SERVICE_REGISTRY: List[Type[Any]] = []
+_TOOL_REGISTRY: Dict[str, ToolSpec] = {}
+
+
+def _build_tool_spec(service_cls: Type[Any], attr_name: str, func: Callable[..., Any]) -> ToolSpec:
+    try:
+        hints = typing.get_type_hints(func)
+    except Exception:
+        hints = {}
+    signature = inspect.signature(func)
+    parameters = [parameter for parameter in signature.parameters.values() if parameter.name != "self"]
+    fields = {
+        parameter.name: (
+            hints.get(parameter.name, Any),
+            ... if parameter.default is inspect.Parameter.empty else parameter.default,
+        )
+        for parameter in parameters
+    }
+    model_name = "".join(part.title() for part in f"{service_cls.service_name}_{func._tool_name}".split("_"))
+    arguments_model = create_model(f"{model_name}Arguments", **fields)
+    response_model = func._response_model
+    result_adapter = TypeAdapter(response_model) if response_model is not None else None
+    return ToolSpec(
+        name=f"{service_cls.service_name}.{func._tool_name}",
+        description=func._tool_description,
+        service_cls=service_cls,
+        attr_name=attr_name,
+        signature=signature.replace(parameters=parameters),
+        arguments_model=arguments_model,
+        parameters=arguments_model.model_json_schema(),
+        read_only=func._read_only,
+        response_model=response_model,
+        result_adapter=result_adapter,
+        returns=result_adapter.json_schema() if result_adapter is not None else None,
+        invalidates=func._invalidates,
+    )
 
 
 def service_class(name: Optional[str] = None) -> Callable[[Type[ServiceType]], Type[ServiceType]]:
     def decorator(cls: Type[ServiceType]) -> Type[ServiceType]:
         cls.service_name = name or cls.__name__
         _SERVICE_REGISTRY.append(cls)
+        for attr_name in sorted(dir(cls)):
+            attr = getattr(cls, attr_name, None)
+            if callable(attr) and getattr(attr, "_is_service_tool", False):
+                spec = _build_tool_spec(cls, attr_name, attr)
+                _TOOL_REGISTRY[spec.name] = spec
         return cls
 
     return decorator
 
 
-def service_tool(name: Optional[str] = None, description: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+def get_service_class(name: str) -> Type[Any]:
+    for service_cls in _SERVICE_REGISTRY:
+        if service_cls.service_name == name:
+            return service_cls
+    raise LookupError(f"Unknown service: {name}")
+
+
+def get_tool_spec(name: str) -> ToolSpec:
+    try:
+        return _TOOL_REGISTRY[name]
+    except KeyError:
+        raise LookupError(f"Unknown service tool: {name}") from None
+
+
+def get_service_tool_specs(service_cls: Type[Any]) -> Dict[str, ToolSpec]:
+    """
+    Tool specs of ``service_cls`` keyed by the name of the method implementing them.
+    """
+    return {spec.attr_name: spec for spec in _TOOL_REGISTRY.values() if spec.service_cls is service_cls}
+
+
+def service_tool(
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        response_model: Any = None,
+        read_only: bool = False,
+        cache: bool = False,
+        cache_tags: Sequence[str] = (),
+        invalidates: Sequence[str] = (),
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Mark a service method as a tool exposed through ``ServiceMesh.get_tools``.
+
+    Every call runs inside the mesh's unit of work, so a request's writes are
+    committed once when the outermost tool returns. ``read_only`` tools run on
+    the mesh's read replica session when one is configured.
+    ``cache=True`` serves repeated calls with the same user and arguments from
+    ``result_cache``; results are converted to ``response_model`` so cached
+    values never hold session-bound ORM objects. ``cache_tags`` and
+    ``invalidates`` are ``str.format`` templates over the tool's arguments
+    (e.g. ``"meeting:{note_in.meeting_id}"``): a successful call of a tool
+    invalidates the cached results filed under its ``invalidates`` tags.
+    """
+    if cache and response_model is None:
+        raise ValueError("Cached service tools must declare a response_model")
+
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        func._is_service_tool = True
-        func._tool_name = name or func.__name__
-        func._tool_description = description or (func.__doc__ or "").strip()
-        return func
+        signature = inspect.signature(func)
+        adapter = TypeAdapter(response_model) if cache else None
+
+        def bind_arguments(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("self", None)
+            return arguments
+
+        def call_cached(self: Any, mesh: "ServiceMesh", args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+            arguments = bind_arguments((self,) + args, kwargs)
+            user_key = mesh.user_key
+            key = (user_key, func.__qualname__, _freeze(arguments))
+            found, value = result_cache.get(key)
+            if found:
+                return value
+            tags = [tag.format(**arguments) for tag in cache_tags]
+            generation = result_cache.generation(user_key)
+            value = adapter.validate_python(func(self, *args, **kwargs), from_attributes=True)
+            result_cache.put(key, value, len(adapter.dump_json(value)), tags, generation)
+            return value
+
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            mesh = self.mesh
+            with mesh.unit_of_work(read_only=read_only):
+                # Once this unit of work has written, reads must see its
+                # uncommitted changes and must not publish them to the cache.
+                if cache and not mesh.has_pending_writes:
+                    return call_cached(self, mesh, args, kwargs)
+                result = func(self, *args, **kwargs)
+                if invalidates:
+                    arguments = bind_arguments((self,) + args, kwargs)
+                    mesh.invalidate(*(tag.format(**arguments) for tag in invalidates))
+                if cache:
+                    result = adapter.validate_python(result, from_attributes=True)
+                return result
+
+        wrapper._is_service_tool = True
+        wrapper._tool_name = name or func.__name__
+        wrapper._tool_description = description or (func.__doc__ or "").strip()
+        wrapper._response_model = response_model
+        wrapper._read_only = read_only
+        wrapper._invalidates = tuple(invalidates)
+        return wrapper
 
     return decorator
 
 
+# Shared by every mesh without an explicit transport, so route and health
+# state persist across requests.
+default_transport = CompositeServiceTransport([LocalServiceTransport()])
+
+
+class ServiceMeshFactory:
+    """
+    Create per-request meshes over one transport chain built at startup.
+
+    Meshes only hold request state; transports, routes and circuit breakers
+    are shared by every mesh the factory creates.
+    """
+
+    __slots__ = ("transport",)
+
+    def __init__(self, transport: Optional[ServiceTransport] = None) -> None:
+        self.transport = transport or default_transport
+
+    def __call__(self, user: Any, db: Any, read_db: Any = None) -> "ServiceMesh":
+        return ServiceMesh(user, db, self.transport, read_db)
+
+    def close(self) -> None:
+        close = getattr(self.transport, "close", None)
+        if close is not None:
+            close()
+
+
 class ServiceMesh:
-    def __init__(self, user: Any, db: Any, transport: Optional[ServiceTransport] = None) -> None:
+    __slots__ = (
+        "user",
+        "db",
+        "read_db",
+        "_read_only_scopes",
+        "_cache",
+        "_authorized",
+        "_uow_depth",
+        "_pending_invalidations",
+        "_invalidated_tags",
+        "_transport",
+    )
+
+    def __init__(
+            self,
+            user: Any,
+            db: Any,
+            transport: Optional[ServiceTransport] = None,
+            read_db: Any = None,
+    ) -> None:
         self.user = user
         self.db = db
+        self.read_db = read_db
+        self._read_only_scopes: List[bool] = []
         self._cache: Dict[Type[Any], Any] = {}
-        base_transport: ServiceTransport = transport or CompositeServiceTransport([LocalServiceTransport()])
-        self._transport = CachedServiceTransport(base_transport)
+        self._authorized: Dict[Tuple[int, Type[Any], Any], Any] = {}
+        self._uow_depth = 0
+        self._pending_invalidations: List[str] = []
+        self._invalidated_tags: Dict[str, None] = {}
+        self._transport = transport or default_transport
 
     def get_service(self, service_cls: Type[ServiceType]) -> ServiceType:
-        return self._transport.get_service(service_cls, self)
+        service = self._cache.get(service_cls)
+        if service is None:
+            service = self._cache[service_cls] = self._transport.get_service(service_cls, self)
+        return service
+
+    @property
+    def user_key(self) -> Any:
+        return getattr(self.user, "id", None)
+
+    @property
+    def session(self) -> Any:
+        """
+        Session for the current call chain: the replica while only read-only
+        tools are active, the primary as soon as any tool in the chain writes,
+        and for ``READ_YOUR_WRITES_SECONDS`` after the user last wrote.
+        """
+        if (
+                self.read_db is not None
+                and self._read_only_scopes
+                and all(self._read_only_scopes)
+                and not result_cache.written_since(self.user_key, READ_YOUR_WRITES_SECONDS)
+        ):
+            return self.read_db
+        return self.db
+
+    @property
+    def has_pending_writes(self) -> bool:
+        return bool(self._pending_invalidations)
+
+    @property
+    def invalidated_tags(self) -> List[str]:
+        """
+        Every tag this mesh invalidated, in order, so a batch can report them
+        to a caller whose result cache lives in another process.
+        """
+        return list(self._invalidated_tags)
+
+    def invalidate(self, *tags: str) -> None:
+        """
+        Drop this user's cached tool results filed under ``tags``.
+
+        Inside a unit of work the tags are invalidated again after the commit,
+        dropping anything a concurrent reader cached before it became visible.
+        """
+        result_cache.invalidate(self.user_key, tags)
+        self._invalidated_tags.update(dict.fromkeys(tags))
+        if self._uow_depth:
+            self._pending_invalidations.extend(tags)
+
+    @contextmanager
+    def unit_of_work(self, read_only: bool = False) -> Iterator["ServiceMesh"]:
+        """
+        Run tool calls in one transaction: services only flush, and the
+        outermost scope commits once on success or rolls back on error.
+        """
+        self._uow_depth += 1
+        self._read_only_scopes.append(read_only)
+        try:
+            yield self
+        except BaseException:
+            self._uow_depth -= 1
+            self._read_only_scopes.pop()
+            if self._uow_depth == 0:
+                self._rollback()
+            raise
+        self._uow_depth -= 1
+        self._read_only_scopes.pop()
+        if self._uow_depth == 0:
+            try:
+                self.db.commit()
+                if self.read_db is not None:
+                    self.read_db.commit()
+            except BaseException:
+                self._rollback()
+                raise
+            pending, self._pending_invalidations = self._pending_invalidations, []
+            if pending:
+                result_cache.invalidate(self.user_key, pending)
+
+    def _rollback(self) -> None:
+        self._pending_invalidations = []
+        self._authorized.clear()
+        self.db.rollback()
+        if self.read_db is not None:
+            self.read_db.rollback()
+
+    def get_authorized(self, model: Type[Any], key: Any) -> Optional[Any]:
+        """
+        Return a resource already authorized for this mesh's user in the
+        current session, if any.
+        """
+        return self._authorized.get((id(self.session), model, key))
+
+    def remember_authorized(self, model: Type[Any], key: Any, resource: Any) -> None:
+        self._authorized[(id(self.session), model, key)] = resource
+
+    def forget_authorized(self, model: Type[Any], key: Any) -> None:
+        for session in (self.db, self.read_db):
+            self._authorized.pop((id(session), model, key), None)
 
     def get_tools(self) -> List[ServiceTool]:
-        tools: List[ServiceTool] = []
-        for service_cls in _SERVICE_REGISTRY:
-            service = self.get_service(service_cls)
-            for attr_name in dir(service):
-                attr = getattr(service, attr_name)
-                if callable(attr) and getattr(attr, "_is_service_tool", False):
-                    tool_name = f"{service_cls.service_name}.{attr._tool_name}"
-                    tools.append(
-                        ServiceTool(
-                            name=tool_name,
-                            description=attr._tool_description,
-                            callable=attr,
-                        )
-                    )
-        return tools
\ No newline at end of file
+        """
+        Bind the precompiled tool registry to this mesh; services are only
+        resolved when a tool is actually called.
+        """
+        return [
+            ServiceTool(
+                name=spec.name,
+                description=spec.description,
+                callable=spec.bind(self),
+                parameters=spec.parameters,
+                returns=spec.returns,
+                read_only=spec.read_only,
+            )
+            for spec in _TOOL_REGISTRY.values()
+        ]
+
+    def execute_batch(self, calls: Sequence[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Run ``(tool name, arguments)`` calls in order inside one unit of work
+        and return their JSON-compatible results.
+
+        The calls share this mesh's session, services and authorization
+        context, and commit once at the end. The first failing call raises
+        ``ToolBatchError`` and rolls back every call before it.
+        """
+        specs = []
+        for index, (tool_name, _) in enumerate(calls):
+            try:
+                specs.append(get_tool_spec(tool_name))
+            except LookupError as exc:
+                raise ToolBatchError(index, tool_name, 404, str(exc)) from None
+        results: List[Any] = []
+        with self.unit_of_work(read_only=all(spec.read_only for spec in specs)):
+            for index, (spec, (_, arguments)) in enumerate(zip(specs, calls)):
+                try:
+                    bound = spec.arguments_model.model_validate(arguments or {})
+                except ValidationError as exc:
+                    raise ToolBatchError(
+                        index, spec.name, 422, exc.errors(include_url=False, include_context=False)
+                    ) from None
+                kwargs = {name: getattr(bound, name) for name in spec.arguments_model.model_fields}
+                try:
+                    result = getattr(self.get_service(spec.service_cls), spec.attr_name)(**kwargs)
+                except HTTPException as exc:
+                    raise ToolBatchError(index, spec.name, exc.status_code, exc.detail) from exc
+                results.append(spec.dump_result(result))
+        return results
\ No newline at end of file
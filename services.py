@@ -1,60 +1,317 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import List, Optional
+import re
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Type
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, bindparam, delete, func, insert, select, text, update
+from sqlalchemy.orm import Query, Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.compiler import InsertmanyvaluesSentinelOpts
 
 import models
 import schemas
 from service_mesh import service_class, service_tool
 
+# Rows fetched per round trip when a list is streamed instead of materialized.
+STREAM_BATCH_SIZE = 500
+
+# Default and maximum number of changes returned by one change feed call.
+CHANGE_PAGE_SIZE = 1000
+
+# Full-text search. Ranking by relevance scores every match, so queries whose
+# words appear in more than SEARCH_RANK_LIMIT of the user's records (found by
+# a bounded probe) are ordered by index rowid instead, which FTS5 streams. The
+# rowid is ``id * 4 + kind``, so that order is by descending record id: newest
+# first within meetings, notes and tasks, but not by time across them.
+SEARCH_RANK_LIMIT = 5000
+_SEARCH_SELECT = """
+    SELECT kind, ref_id AS id, meeting_id, title,
+           CASE WHEN body = '' THEN snippet(search_index, 0, '<mark>', '</mark>', '…', 16)
+                ELSE snippet(search_index, 1, '<mark>', '</mark>', '…', 16) END AS snippet,
+           bm25(search_index, 4.0, 1.0) AS rank
+    FROM search_index
+    WHERE search_index MATCH :match AND owner_id = :owner_id
+"""
+SEARCH_PROBE = text(
+    "SELECT count(*) FROM ("
+    "SELECT 1 FROM search_index WHERE search_index MATCH :match AND owner_id = :owner_id LIMIT :limit"
+    ")"
+)
+SEARCH_BY_RANK = text(_SEARCH_SELECT + "ORDER BY rank, rowid LIMIT :limit OFFSET :offset")
+SEARCH_BY_ID = text(_SEARCH_SELECT + "ORDER BY rowid DESC LIMIT :limit OFFSET :offset")
+
+
+# Attempts at a compare-and-set task update before giving up on a hot row.
+TASK_UPDATE_ATTEMPTS = 5
+
+CounterDeltas = Dict[int, Counter]
+
+
+def _count_task(deltas: CounterDeltas, meeting_id: int, task_status: str, amount: int) -> None:
+    counters = deltas[meeting_id]
+    counters["tasks_count"] += amount
+    column = models.TASK_STATUS_COUNTERS.get(task_status)
+    if column is not None:
+        counters[column] += amount
+
+
+def calendar_window(anchor: date, view: str) -> Tuple[date, date]:
+    """
+    First day of the week (Monday) or month containing ``anchor``, and the first day after it.
+    """
+    if view == "week":
+        start = anchor - timedelta(days=anchor.weekday())
+        return start, start + timedelta(days=7)
+    start = anchor.replace(day=1)
+    return start, (start + timedelta(days=32)).replace(day=1)
+
 
 class BaseService:
+    # Loader options applied per tool, so relationships the response needs are
+    # fetched in a fixed number of batched queries instead of one per row.
+    loader_plans: Dict[str, Tuple[Any, ...]] = {}
+    # Schema fields that are not columns but that ``_load_field`` can fill for
+    # ``_project``; other non-column fields cannot be selected.
+    projected_relationships: Tuple[str, ...] = ()
+    # Methods other services call in-process that are not service tools; a
+    # service with any of them cannot be served by RemoteServiceTransport.
+    local_helpers: Tuple[str, ...] = ()
+
     def __init__(self, mesh: "ServiceMesh", db: Session, user: Optional[models.User]) -> None:
         self.mesh = mesh
-        self.db = db
         self.user = user
 
+    @property
+    def db(self) -> Session:
+        """
+        The mesh's session for the current call, so read-only tools use the replica.
+        """
+        return self.mesh.session
+
+    def _query(self, model: Type[Any], plan: Optional[str] = None) -> Query:
+        query = self.db.query(model)
+        options = self.loader_plans.get(plan, ()) if plan else ()
+        if options:
+            query = query.options(*options)
+        return query
+
+    @staticmethod
+    def _paginate(query: Query, column: Any, after_id: Optional[int], limit: Optional[int]) -> Query:
+        """
+        Apply keyset pagination: rows strictly after ``after_id`` in ``column`` order.
+        """
+        if after_id is not None:
+            query = query.filter(column > after_id)
+        query = query.order_by(column)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    def _project(
+            self, query: Query, model: Type[Any], schema: Type[Any], fields: Optional[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a list ``query`` for the requested ``schema`` fields (all of them
+        when ``fields`` is None), as plain dicts ready for a JSON encoder.
+
+        Column fields are selected directly instead of loading entities;
+        relationship fields listed in ``projected_relationships`` are filled
+        for the whole page by ``_load_field``. Names missing from the schema
+        are rejected with 422, other fields the service cannot select with
+        400. ``id`` is always included, for cursors.
+        """
+        if fields is None:
+            selected = list(schema.model_fields)
+        else:
+            unknown = [name for name in fields if name not in schema.model_fields]
+            if unknown:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Unknown fields: {', '.join(unknown)}",
+                )
+            selected = list(dict.fromkeys(["id", *fields]))
+        table = model.__table__
+        unsupported = [name for name in selected if name not in table.c and name not in self.projected_relationships]
+        if unsupported:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Fields cannot be selected: {', '.join(unsupported)}",
+            )
+        columns = [table.c[name] for name in selected if name in table.c]
+        rows = [dict(row._mapping) for row in query.with_entities(*columns)]
+        ids = [row["id"] for row in rows]
+        for name in selected:
+            if name not in table.c:
+                values = self._load_field(name, ids)
+                for row in rows:
+                    row[name] = values.get(row["id"], [])
+        return rows
+
+    def _load_field(self, name: str, ids: List[int]) -> Dict[int, Any]:
+        """
+        Values of the relationship field ``name`` for rows ``ids``, by id.
+
+        Services override this for the names in ``projected_relationships``;
+        ``_project`` never calls it for other names.
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot project {name!r}")
+
+    def _get_version(self, model: Type[Any], row_id: int) -> int:
+        """
+        Current version of one of the current user's rows, without loading it.
+        """
+        current_user = self._require_user()
+        version = self.db.execute(
+            select(model.version).where(model.id == row_id, model.owner_id == current_user.id)
+        ).scalar()
+        if version is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{model.__name__} not found")
+        return version
+
+    def _touch_meetings(self, meeting_ids: Iterable[int]) -> None:
+        """
+        Bump the version of meetings whose aggregate changed without a change
+        to their own row, and log them as updated so the change feed follows
+        every version.
+        """
+        meeting_ids = set(meeting_ids)
+        table = models.Meeting.__table__
+        self.db.execute(update(table).where(table.c.id.in_(meeting_ids)).values(version=table.c.version + 1))
+        self._record_changes("meeting", "updated", meeting_ids)
+        self._expire_meetings(meeting_ids, ("version",))
+
+    def _expire_meetings(self, meeting_ids: Iterable[int], attributes: Iterable[str]) -> None:
+        """
+        Expire attributes changed by Core statements on meetings loaded in the session.
+        """
+        for meeting_id in meeting_ids:
+            meeting = self.db.identity_map.get(Session.identity_key(models.Meeting, meeting_id))
+            if meeting is not None:
+                self.db.expire(meeting, list(attributes))
+
     def _require_user(self) -> models.User:
         if not self.user:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authentication required")
         return self.user
 
+    def _insert_many(self, model: Type[Any], rows: List[Dict[str, Any]]) -> List[Row]:
+        """
+        Insert ``rows`` in batched multi-row statements and return the created rows.
+
+        Plain rows rather than ORM entities are returned, so they are not
+        tracked by the session or refreshed one by one.
+        """
+        if not rows:
+            return []
+        columns = model.__table__.columns
+        if self.db.get_bind().dialect.insertmanyvalues_implicit_sentinel & InsertmanyvaluesSentinelOpts.AUTOINCREMENT:
+            # e.g. PostgreSQL: ids need not follow parameter order, so let
+            # SQLAlchemy match RETURNING rows to parameters.
+            statement = insert(model).returning(*columns, sort_by_parameter_order=True)
+            return self.db.execute(statement, rows).all()
+        # SQLite cannot do that without falling back to one INSERT per row,
+        # but assigns the ids of a multi-row INSERT in VALUES order; only
+        # the RETURNING order is unspecified.
+        return sorted(self.db.execute(insert(model).returning(*columns), rows), key=lambda row: row.id)
+
+    def _record_changes(self, entity: str, action: str, ids: Iterable[int]) -> None:
+        """
+        Log changes of the current user's rows for the change feed; they are
+        written when the unit of work commits.
+        """
+        owner_id = self._require_user().id
+        for entity_id in ids:
+            models.record_change(self.db, owner_id, entity, entity_id, action)
+
+    def _adjust_meeting_counters(self, deltas: CounterDeltas) -> None:
+        """
+        Apply counter deltas with one ``column = column + delta`` UPDATE per
+        meeting, so concurrent writers never overwrite each other's counts.
+
+        Every meeting in ``deltas`` is updated, even with all-zero deltas
+        (e.g. a task moving between two uncounted statuses), so its version
+        and the change feed still follow the change to its tasks.
+        """
+        rows = [
+            {"counter_meeting_id": meeting_id, **{f"delta_{column}": counters[column] for column in models.MEETING_COUNTERS}}
+            for meeting_id, counters in deltas.items()
+        ]
+        if not rows:
+            return
+        table = models.Meeting.__table__
+        statement = (
+            table.update()
+            .where(table.c.id == bindparam("counter_meeting_id"))
+            .values({column: table.c[column] + bindparam(f"delta_{column}") for column in models.MEETING_COUNTERS})
+        )
+        self.db.execute(statement, rows)
+        meeting_ids = [row["counter_meeting_id"] for row in rows]
+        self._record_changes("meeting", "updated", meeting_ids)
+        self._expire_meetings(meeting_ids, (*models.MEETING_COUNTERS, "version"))
+
 
 @service_class("users")
 class UserService(BaseService):
-    @service_tool()
+    local_helpers = ("get_users_by_ids",)
+
+    @service_tool(response_model=schemas.User, invalidates=("users",))
     def create_user(self, user_in: schemas.UserCreate) -> models.User:
         if self.user:
             owner_id = self.user.id
             user = models.User(name=user_in.name, email=user_in.email, owner_id=owner_id)
             self.db.add(user)
-            self.db.commit()
-            self.db.refresh(user)
+            self.db.flush()
             return user
 
         user = models.User(name=user_in.name, email=user_in.email)
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
         user.owner_id = user.id
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
         return user
 
-    @service_tool()
-    def list_users(self) -> List[models.User]:
+    @service_tool(response_model=List[schemas.User], invalidates=("users",))
+    def create_users(self, users_in: List[schemas.UserCreate]) -> List[Row]:
+        """
+        Create many users owned by the current user in one transaction.
+        """
         current_user = self._require_user()
-        return (
-            self.db.query(models.User)
-            .filter(models.User.owner_id == current_user.id)
-            .order_by(models.User.id)
-            .all()
+        users = self._insert_many(
+            models.User,
+            [{"name": user_in.name, "email": user_in.email, "owner_id": current_user.id} for user_in in users_in],
         )
+        return users
+
+    @service_tool(response_model=List[schemas.User], read_only=True, cache=True, cache_tags=("users",))
+    def list_users(self, after_id: Optional[int] = None, limit: Optional[int] = None) -> List[models.User]:
+        return self._list_users_query(after_id, limit).all()
+
+    @service_tool(response_model=List[Dict[str, Any]], read_only=True, cache=True, cache_tags=("users",))
+    def list_user_fields(
+            self,
+            fields: Optional[List[str]] = None,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List users like list_users, returning only the given fields (id is always included; all when omitted).
+        """
+        return self._project(self._list_users_query(after_id, limit), models.User, schemas.User, fields)
+
+    def iter_users(self, after_id: Optional[int] = None, limit: Optional[int] = None) -> Iterator[models.User]:
+        with self.mesh.unit_of_work(read_only=True):
+            query = self._list_users_query(after_id, limit)
+        return query.yield_per(STREAM_BATCH_SIZE)
 
-    @service_tool()
+    def _list_users_query(self, after_id: Optional[int], limit: Optional[int]) -> Query:
+        current_user = self._require_user()
+        query = self.db.query(models.User).filter(models.User.owner_id == current_user.id)
+        return self._paginate(query, models.User.id, after_id, limit)
+
+    @service_tool(response_model=schemas.User, read_only=True)
     def get_user(self, user_id: int) -> models.User:
         current_user = self._require_user()
         user = (
@@ -66,6 +323,10 @@ class UserService(BaseService):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         return user
 
+    @service_tool(response_model=int, read_only=True)
+    def get_user_version(self, user_id: int) -> int:
+        return self._get_version(models.User, user_id)
+
     def get_users_by_ids(self, user_ids: List[int]) -> List[models.User]:
         current_user = self._require_user()
         if not user_ids:
@@ -79,7 +340,18 @@ class UserService(BaseService):
 
 @service_class("meetings")
 class MeetingService(BaseService):
-    @service_tool()
+    loader_plans = {
+        "list_meetings": (selectinload(models.Meeting.attendees),),
+        "get_meeting": (
+            selectinload(models.Meeting.attendees),
+            selectinload(models.Meeting.notes),
+            selectinload(models.Meeting.tasks),
+        ),
+    }
+    projected_relationships = ("attendees",)
+    local_helpers = ("get_meeting_model", "get_meeting_models")
+
+    @service_tool(response_model=schemas.Meeting, invalidates=("meetings",))
     def create_meeting(self, meeting_in: schemas.MeetingCreate) -> models.Meeting:
         current_user = self._require_user()
         attendees = self.mesh.get_service(UserService).get_users_by_ids(meeting_in.attendee_ids)
@@ -94,25 +366,132 @@ class MeetingService(BaseService):
             owner_id=current_user.id,
         )
         self.db.add(meeting)
-        self.db.commit()
-        self.db.refresh(meeting)
+        self.db.flush()
+        self._record_changes("meeting", "created", [meeting.id])
         return meeting
 
-    @service_tool()
-    def list_meetings(self) -> List[models.Meeting]:
+    @service_tool(response_model=List[schemas.Meeting], read_only=True, cache=True, cache_tags=("meetings",))
+    def list_meetings(
+            self,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None,
+            scheduled_from: Optional[datetime] = None,
+            scheduled_to: Optional[datetime] = None,
+            attendee_id: Optional[int] = None,
+    ) -> List[models.Meeting]:
+        """
+        List meetings by id, optionally scheduled in [scheduled_from, scheduled_to) and attended by attendee_id.
+        """
+        return self._list_meetings_query(after_id, limit, scheduled_from, scheduled_to, attendee_id).all()
+
+    @service_tool(response_model=List[Dict[str, Any]], read_only=True, cache=True, cache_tags=("meetings",))
+    def list_meeting_fields(
+            self,
+            fields: Optional[List[str]] = None,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None,
+            scheduled_from: Optional[datetime] = None,
+            scheduled_to: Optional[datetime] = None,
+            attendee_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List meetings like list_meetings, returning only the given fields (id is always included; all when omitted).
+        """
+        query = self._list_meetings_query(after_id, limit, scheduled_from, scheduled_to, attendee_id)
+        return self._project(query, models.Meeting, schemas.Meeting, fields)
+
+    def _load_field(self, name: str, ids: List[int]) -> Dict[int, Any]:
+        attendees: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        if not ids:
+            return attendees
+        users, links = models.User.__table__, models.meeting_users
+        columns = [users.c[name] for name in schemas.User.model_fields]
+        statement = (
+            select(links.c.meeting_id, *columns)
+            .join(users, users.c.id == links.c.user_id)
+            .where(links.c.meeting_id.in_(ids))
+            .order_by(links.c.meeting_id, users.c.id)
+        )
+        for meeting_id, *values in self.db.execute(statement):
+            attendees[meeting_id].append(dict(zip(schemas.User.model_fields, values)))
+        return attendees
+
+    def iter_meetings(
+            self,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None,
+            scheduled_from: Optional[datetime] = None,
+            scheduled_to: Optional[datetime] = None,
+            attendee_id: Optional[int] = None,
+    ) -> Iterator[models.Meeting]:
+        with self.mesh.unit_of_work(read_only=True):
+            query = self._list_meetings_query(after_id, limit, scheduled_from, scheduled_to, attendee_id)
+        return query.yield_per(STREAM_BATCH_SIZE)
+
+    def _list_meetings_query(
+            self,
+            after_id: Optional[int],
+            limit: Optional[int],
+            scheduled_from: Optional[datetime] = None,
+            scheduled_to: Optional[datetime] = None,
+            attendee_id: Optional[int] = None,
+    ) -> Query:
         current_user = self._require_user()
-        return (
-            self.db.query(models.Meeting)
-            .filter(models.Meeting.owner_id == current_user.id)
-            .order_by(models.Meeting.id)
-            .all()
+        query = self._query(models.Meeting, plan="list_meetings").filter(models.Meeting.owner_id == current_user.id)
+        query = self._filter_window(query, scheduled_from, scheduled_to)
+        if attendee_id is not None:
+            attended = select(models.meeting_users.c.meeting_id).where(models.meeting_users.c.user_id == attendee_id)
+            query = query.filter(models.Meeting.id.in_(attended))
+        return self._paginate(query, models.Meeting.id, after_id, limit)
+
+    @staticmethod
+    def _filter_window(query: Query, scheduled_from: Optional[datetime], scheduled_to: Optional[datetime]) -> Query:
+        if scheduled_from is not None:
+            query = query.filter(models.Meeting.scheduled_time >= scheduled_from)
+        if scheduled_to is not None:
+            query = query.filter(models.Meeting.scheduled_time < scheduled_to)
+        return query
+
+    @service_tool(response_model=schemas.Calendar, read_only=True, cache=True, cache_tags=("meetings",))
+    def calendar(self, anchor: date, view: Literal["week", "month"] = "week") -> schemas.Calendar:
+        """
+        Meetings in the week (Monday to Sunday) or month containing anchor, by scheduled time.
+        """
+        current_user = self._require_user()
+        start, end = calendar_window(anchor, view)
+        attendee_count = (
+            select(func.count())
+            .where(models.meeting_users.c.meeting_id == models.Meeting.id)
+            .correlate(models.Meeting)
+            .scalar_subquery()
+        )
+        query = self.db.query(
+            models.Meeting.id,
+            models.Meeting.title,
+            models.Meeting.scheduled_time,
+            attendee_count.label("attendee_count"),
+        ).filter(models.Meeting.owner_id == current_user.id)
+        window = (datetime.combine(start, datetime.min.time()), datetime.combine(end, datetime.min.time()))
+        query = self._filter_window(query, *window)
+        rows = query.order_by(models.Meeting.scheduled_time, models.Meeting.id).all()
+        return schemas.Calendar(
+            view=view,
+            start=start,
+            end=end,
+            meetings=[schemas.CalendarEntry.model_validate(row) for row in rows],
         )
 
-    @service_tool()
+    @service_tool(
+        response_model=schemas.MeetingWithDetails,
+        read_only=True,
+        cache=True,
+        cache_tags=("meeting:{meeting_id}",),
+    )
     def get_meeting(self, meeting_id: int) -> schemas.MeetingWithDetails:
-        meeting = self.get_meeting_model(meeting_id)
-        notes = self.mesh.get_service(NoteService).list_notes(meeting_id=meeting_id)
-        tasks = self.mesh.get_service(TaskService).list_tasks(meeting_id=meeting_id)
+        current_user = self._require_user()
+        meeting = self.get_meeting_model(meeting_id, plan="get_meeting")
+        notes = [note for note in meeting.notes if note.owner_id == current_user.id]
+        tasks = [task for task in meeting.tasks if task.owner_id == current_user.id]
         return schemas.MeetingWithDetails(
             id=meeting.id,
             title=meeting.title,
@@ -120,11 +499,20 @@ class MeetingService(BaseService):
             scheduled_time=meeting.scheduled_time,
             created_at=meeting.created_at,
             attendees=meeting.attendees,
+            **{column: getattr(meeting, column) for column in models.MEETING_COUNTERS},
+            version=meeting.version,
             notes=notes,
             tasks=tasks,
         )
 
-    @service_tool()
+    @service_tool(response_model=int, read_only=True)
+    def get_meeting_version(self, meeting_id: int) -> int:
+        """
+        Version of the meeting aggregate (the meeting, its attendees, notes and tasks).
+        """
+        return self._get_version(models.Meeting, meeting_id)
+
+    @service_tool(response_model=schemas.Meeting, invalidates=("meetings", "meeting:{meeting_id}"))
     def update_meeting(self, meeting_id: int, meeting_in: schemas.MeetingUpdate) -> models.Meeting:
         meeting = self.get_meeting_model(meeting_id)
         if meeting_in.title is not None:
@@ -138,31 +526,85 @@ class MeetingService(BaseService):
             if len(attendees) != len(set(meeting_in.attendee_ids)):
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid attendee IDs")
             meeting.attendees = attendees
-        self.db.commit()
-        self.db.refresh(meeting)
+            # Attendees live in meeting_users; bump the meeting row explicitly.
+            meeting.version = models.Meeting.version + 1
+        self.db.flush()
+        self._record_changes("meeting", "updated", [meeting.id])
         return meeting
 
-    @service_tool()
+    @service_tool(invalidates=("meetings", "meeting:{meeting_id}", "notes", "tasks"))
     def delete_meeting(self, meeting_id: int) -> None:
         meeting = self.get_meeting_model(meeting_id)
+        # Notes are deleted with their meeting.
+        self._record_changes("note", "deleted", [note.id for note in meeting.notes])
+        self._record_changes("meeting", "deleted", [meeting_id])
         self.db.delete(meeting)
-        self.db.commit()
+        self.db.flush()
+        self.mesh.forget_authorized(models.Meeting, meeting_id)
+
+    @service_tool(response_model=int, invalidates=("meetings",))
+    def repair_counters(self) -> int:
+        """
+        Recompute the note and task counters of the current user's meetings and
+        return how many meetings had drifted.
+        """
+        current_user = self._require_user()
+        repaired = models.repair_meeting_counters(self.db.connection(), current_user.id)
+        self.db.expire_all()
+        if repaired:
+            self._record_changes("meeting", "updated", repaired)
+            self.mesh.invalidate(*(f"meeting:{meeting_id}" for meeting_id in repaired))
+        return len(repaired)
 
-    def get_meeting_model(self, meeting_id: int) -> models.Meeting:
+    def get_meeting_models(self, meeting_ids: Iterable[int]) -> Dict[int, models.Meeting]:
+        """
+        Authorize many meetings with a single query, raising 404 if any is not owned.
+        """
+        current_user = self._require_user()
+        meetings: Dict[int, models.Meeting] = {}
+        missing = []
+        for meeting_id in set(meeting_ids):
+            meeting = self.mesh.get_authorized(models.Meeting, meeting_id)
+            if meeting is None:
+                missing.append(meeting_id)
+            else:
+                meetings[meeting_id] = meeting
+        if missing:
+            loaded = (
+                self.db.query(models.Meeting)
+                .filter(models.Meeting.id.in_(missing), models.Meeting.owner_id == current_user.id)
+                .all()
+            )
+            if len(loaded) != len(missing):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
+            for meeting in loaded:
+                self.mesh.remember_authorized(models.Meeting, meeting.id, meeting)
+                meetings[meeting.id] = meeting
+        return meetings
+
+    def get_meeting_model(self, meeting_id: int, plan: Optional[str] = None) -> models.Meeting:
+        """
+        Load a meeting owned by the current user, reusing an ownership check
+        already made earlier in this mesh's call chain.
+        """
+        meeting = self.mesh.get_authorized(models.Meeting, meeting_id)
+        if meeting is not None:
+            return meeting
         current_user = self._require_user()
         meeting = (
-            self.db.query(models.Meeting)
+            self._query(models.Meeting, plan=plan)
             .filter(models.Meeting.id == meeting_id, models.Meeting.owner_id == current_user.id)
             .first()
         )
         if not meeting:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
+        self.mesh.remember_authorized(models.Meeting, meeting_id, meeting)
         return meeting
 
 
 @service_class("notes")
 class NoteService(BaseService):
-    @service_tool()
+    @service_tool(response_model=schemas.Note, invalidates=("notes", "meetings", "meeting:{note_in.meeting_id}"))
     def create_note(self, note_in: schemas.NoteCreate) -> models.Note:
         current_user = self._require_user()
         self.mesh.get_service(MeetingService).get_meeting_model(note_in.meeting_id)
@@ -173,20 +615,80 @@ class NoteService(BaseService):
             owner_id=current_user.id,
         )
         self.db.add(note)
-        self.db.commit()
-        self.db.refresh(note)
+        self.db.flush()
+        self._record_changes("note", "created", [note.id])
+        self._adjust_meeting_counters({note.meeting_id: Counter(notes_count=1)})
         return note
 
-    @service_tool()
-    def list_notes(self, meeting_id: Optional[int] = None) -> List[models.Note]:
+    @service_tool(response_model=List[schemas.Note], invalidates=("notes", "meetings"))
+    def create_notes(self, notes_in: List[schemas.NoteCreate]) -> List[Row]:
+        """
+        Create many notes in one transaction, authorizing each meeting once.
+        """
+        current_user = self._require_user()
+        meetings = self.mesh.get_service(MeetingService).get_meeting_models(note_in.meeting_id for note_in in notes_in)
+        created_at = datetime.utcnow()
+        notes = self._insert_many(
+            models.Note,
+            [
+                {
+                    "content": note_in.content,
+                    "meeting_id": note_in.meeting_id,
+                    "created_at": created_at,
+                    "owner_id": current_user.id,
+                }
+                for note_in in notes_in
+            ],
+        )
+        self._record_changes("note", "created", (note.id for note in notes))
+        deltas: CounterDeltas = defaultdict(Counter)
+        for note in notes:
+            deltas[note.meeting_id]["notes_count"] += 1
+        self._adjust_meeting_counters(deltas)
+        self.mesh.invalidate(*(f"meeting:{meeting_id}" for meeting_id in meetings))
+        return notes
+
+    @service_tool(response_model=List[schemas.Note], read_only=True, cache=True, cache_tags=("notes",))
+    def list_notes(
+            self,
+            meeting_id: Optional[int] = None,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> List[models.Note]:
+        return self._list_notes_query(meeting_id, after_id, limit).all()
+
+    @service_tool(response_model=List[Dict[str, Any]], read_only=True, cache=True, cache_tags=("notes",))
+    def list_note_fields(
+            self,
+            fields: Optional[List[str]] = None,
+            meeting_id: Optional[int] = None,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List notes like list_notes, returning only the given fields (id is always included; all when omitted).
+        """
+        return self._project(self._list_notes_query(meeting_id, after_id, limit), models.Note, schemas.Note, fields)
+
+    def iter_notes(
+            self,
+            meeting_id: Optional[int] = None,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> Iterator[models.Note]:
+        with self.mesh.unit_of_work(read_only=True):
+            query = self._list_notes_query(meeting_id, after_id, limit)
+        return query.yield_per(STREAM_BATCH_SIZE)
+
+    def _list_notes_query(self, meeting_id: Optional[int], after_id: Optional[int], limit: Optional[int]) -> Query:
         current_user = self._require_user()
         query = self.db.query(models.Note).filter(models.Note.owner_id == current_user.id)
         if meeting_id is not None:
             self.mesh.get_service(MeetingService).get_meeting_model(meeting_id)
             query = query.filter(models.Note.meeting_id == meeting_id)
-        return query.order_by(models.Note.id).all()
+        return self._paginate(query, models.Note.id, after_id, limit)
 
-    @service_tool()
+    @service_tool(response_model=schemas.Note, read_only=True, cache=True, cache_tags=("notes",))
     def get_note(self, note_id: int) -> models.Note:
         current_user = self._require_user()
         note = (
@@ -198,10 +700,14 @@ class NoteService(BaseService):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
         return note
 
+    @service_tool(response_model=int, read_only=True)
+    def get_note_version(self, note_id: int) -> int:
+        return self._get_version(models.Note, note_id)
+
 
 @service_class("tasks")
 class TaskService(BaseService):
-    @service_tool()
+    @service_tool(response_model=schemas.Task, invalidates=("tasks", "meetings", "meeting:{task_in.due_meeting_id}"))
     def create_task(self, task_in: schemas.TaskCreate) -> models.Task:
         current_user = self._require_user()
         self.mesh.get_service(MeetingService).get_meeting_model(task_in.due_meeting_id)
@@ -214,12 +720,133 @@ class TaskService(BaseService):
             owner_id=current_user.id,
         )
         self.db.add(task)
-        self.db.commit()
-        self.db.refresh(task)
+        self.db.flush()
+        self._record_changes("task", "created", [task.id])
+        deltas: CounterDeltas = defaultdict(Counter)
+        _count_task(deltas, task.due_meeting_id, task.status, 1)
+        self._adjust_meeting_counters(deltas)
         return task
 
-    @service_tool()
-    def list_tasks(self, meeting_id: Optional[int] = None, status_filter: Optional[str] = None) -> List[models.Task]:
+    @service_tool(response_model=List[schemas.Task], invalidates=("tasks", "meetings"))
+    def create_tasks(self, tasks_in: List[schemas.TaskCreate]) -> List[Row]:
+        """
+        Create many tasks in one transaction, authorizing each meeting once.
+        """
+        current_user = self._require_user()
+        meetings = self.mesh.get_service(MeetingService).get_meeting_models(
+            task_in.due_meeting_id for task_in in tasks_in
+        )
+        created_at = datetime.utcnow()
+        tasks = self._insert_many(
+            models.Task,
+            [
+                {
+                    "title": task_in.title,
+                    "description": task_in.description,
+                    "status": task_in.status,
+                    "due_meeting_id": task_in.due_meeting_id,
+                    "created_at": created_at,
+                    "owner_id": current_user.id,
+                }
+                for task_in in tasks_in
+            ],
+        )
+        self._record_changes("task", "created", (task.id for task in tasks))
+        deltas: CounterDeltas = defaultdict(Counter)
+        for task in tasks:
+            _count_task(deltas, task.due_meeting_id, task.status, 1)
+        self._adjust_meeting_counters(deltas)
+        self.mesh.invalidate(*(f"meeting:{meeting_id}" for meeting_id in meetings))
+        return tasks
+
+    @service_tool(response_model=List[schemas.Task], invalidates=("tasks", "meetings"))
+    def update_task_statuses(self, task_ids: List[int], status_value: str) -> List[Row]:
+        """
+        Set the status of many tasks, with one conditional UPDATE per current status.
+        """
+        current_user = self._require_user()
+        remaining = set(task_ids)
+        if not remaining:
+            return []
+        table = models.Task.__table__
+        updated: Dict[int, Row] = {}
+        deltas: CounterDeltas = defaultdict(Counter)
+        for _ in range(TASK_UPDATE_ATTEMPTS):
+            current = self.db.execute(
+                select(table.c.id, table.c.status).where(table.c.owner_id == current_user.id, table.c.id.in_(remaining))
+            ).all()
+            if len(current) != len(remaining):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+            by_status: Dict[str, List[int]] = defaultdict(list)
+            for task_id, task_status in current:
+                by_status[task_status].append(task_id)
+            for old_status, ids in by_status.items():
+                # Only rows still in old_status change, so counters move exactly once per task.
+                statement = (
+                    update(table)
+                    .where(table.c.id.in_(ids), table.c.status == old_status)
+                    .values(status=status_value)
+                    .returning(*table.columns)
+                )
+                for task in self.db.execute(statement):
+                    updated[task.id] = task
+                    remaining.discard(task.id)
+                    if old_status != status_value:
+                        _count_task(deltas, task.due_meeting_id, old_status, -1)
+                        _count_task(deltas, task.due_meeting_id, status_value, 1)
+            if not remaining:
+                break
+        else:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Tasks are being updated concurrently")
+        self._adjust_meeting_counters(deltas)
+        self._record_changes("task", "updated", updated)
+        tasks = sorted(updated.values(), key=lambda task: task.id)
+        self.mesh.invalidate(*{f"meeting:{task.due_meeting_id}" for task in tasks})
+        return tasks
+
+    @service_tool(response_model=List[schemas.Task], read_only=True, cache=True, cache_tags=("tasks",))
+    def list_tasks(
+            self,
+            meeting_id: Optional[int] = None,
+            status_filter: Optional[str] = None,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> List[models.Task]:
+        return self._list_tasks_query(meeting_id, status_filter, after_id, limit).all()
+
+    @service_tool(response_model=List[Dict[str, Any]], read_only=True, cache=True, cache_tags=("tasks",))
+    def list_task_fields(
+            self,
+            fields: Optional[List[str]] = None,
+            meeting_id: Optional[int] = None,
+            status_filter: Optional[str] = None,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List tasks like list_tasks, returning only the given fields (id is always included; all when omitted).
+        """
+        query = self._list_tasks_query(meeting_id, status_filter, after_id, limit)
+        return self._project(query, models.Task, schemas.Task, fields)
+
+    def iter_tasks(
+            self,
+            meeting_id: Optional[int] = None,
+            status_filter: Optional[str] = None,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> Iterator[models.Task]:
+        with self.mesh.unit_of_work(read_only=True):
+            query = self._list_tasks_query(meeting_id, status_filter, after_id, limit)
+        return query.yield_per(STREAM_BATCH_SIZE)
+
+    def _list_tasks_query(
+            self,
+            meeting_id: Optional[int],
+            status_filter: Optional[str],
+            after_id: Optional[int],
+            limit: Optional[int],
+    ) -> Query:
         current_user = self._require_user()
         query = self.db.query(models.Task).filter(models.Task.owner_id == current_user.id)
         if meeting_id is not None:
@@ -227,9 +854,9 @@ class TaskService(BaseService):
             query = query.filter(models.Task.due_meeting_id == meeting_id)
         if status_filter is not None:
             query = query.filter(models.Task.status == status_filter)
-        return query.order_by(models.Task.id).all()
+        return self._paginate(query, models.Task.id, after_id, limit)
 
-    @service_tool()
+    @service_tool(response_model=schemas.Task, read_only=True)
     def get_task(self, task_id: int) -> models.Task:
         current_user = self._require_user()
         task = (
@@ -241,24 +868,163 @@ class TaskService(BaseService):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
         return task
 
-    @service_tool()
+    @service_tool(response_model=int, read_only=True)
+    def get_task_version(self, task_id: int) -> int:
+        return self._get_version(models.Task, task_id)
+
+    @service_tool(response_model=schemas.Task, invalidates=("tasks", "meetings"))
     def update_task(self, task_id: int, task_in: schemas.TaskUpdate) -> models.Task:
         task = self.get_task(task_id)
+        self.mesh.invalidate(f"meeting:{task.due_meeting_id}")
         if task_in.title is not None:
             task.title = task_in.title
         if task_in.description is not None:
             task.description = task_in.description
-        if task_in.status is not None:
-            task.status = task_in.status
+        if task_in.title is not None or task_in.description is not None:
+            self._touch_meetings([task.due_meeting_id])
         if task_in.due_meeting_id is not None:
             self.mesh.get_service(MeetingService).get_meeting_model(task_in.due_meeting_id)
-            task.due_meeting_id = task_in.due_meeting_id
-        self.db.commit()
-        self.db.refresh(task)
+            self.mesh.invalidate(f"meeting:{task_in.due_meeting_id}")
+        if task_in.status is not None or task_in.due_meeting_id is not None:
+            self._move_task(task, task_in.status, task_in.due_meeting_id)
+        self.db.flush()
+        self._record_changes("task", "updated", [task.id])
         return task
 
-    @service_tool()
+    def _move_task(self, task: models.Task, new_status: Optional[str], new_meeting_id: Optional[int]) -> None:
+        """
+        Change a task's status and/or meeting with a compare-and-set UPDATE
+        and move its counts between meetings accordingly.
+
+        The UPDATE only matches if the task still has the status and meeting
+        read earlier; otherwise a concurrent write won, and the task is
+        reloaded and the change retried on top of it.
+        """
+        table = models.Task.__table__
+        for _ in range(TASK_UPDATE_ATTEMPTS):
+            old_status, old_meeting_id = task.status, task.due_meeting_id
+            target_status = new_status if new_status is not None else old_status
+            target_meeting_id = new_meeting_id if new_meeting_id is not None else old_meeting_id
+            if (target_status, target_meeting_id) == (old_status, old_meeting_id):
+                return
+            version = self.db.execute(
+                update(table)
+                .where(table.c.id == task.id, table.c.status == old_status, table.c.due_meeting_id == old_meeting_id)
+                .values(status=target_status, due_meeting_id=target_meeting_id)
+                .returning(table.c.version)
+            ).scalar()
+            if version is not None:
+                set_committed_value(task, "status", target_status)
+                set_committed_value(task, "due_meeting_id", target_meeting_id)
+                set_committed_value(task, "version", version)
+                deltas: CounterDeltas = defaultdict(Counter)
+                _count_task(deltas, old_meeting_id, old_status, -1)
+                _count_task(deltas, target_meeting_id, target_status, 1)
+                self._adjust_meeting_counters(deltas)
+                return
+            current = self.db.execute(
+                select(table.c.status, table.c.due_meeting_id).where(table.c.id == task.id)
+            ).first()
+            if current is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+            set_committed_value(task, "status", current.status)
+            set_committed_value(task, "due_meeting_id", current.due_meeting_id)
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Task is being updated concurrently")
+
+    @service_tool(invalidates=("tasks", "meetings"))
     def delete_task(self, task_id: int) -> None:
-        task = self.get_task(task_id)
-        self.db.delete(task)
-        self.db.commit()
\ No newline at end of file
+        current_user = self._require_user()
+        table = models.Task.__table__
+        # Counts are taken from the row as it was deleted, not as read earlier.
+        deleted = self.db.execute(
+            delete(table)
+            .where(table.c.id == task_id, table.c.owner_id == current_user.id)
+            .returning(table.c.due_meeting_id, table.c.status)
+        ).first()
+        if deleted is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+        self._record_changes("task", "deleted", [task_id])
+        deltas: CounterDeltas = defaultdict(Counter)
+        _count_task(deltas, deleted.due_meeting_id, deleted.status, -1)
+        self._adjust_meeting_counters(deltas)
+        self.mesh.invalidate(f"meeting:{deleted.due_meeting_id}")
+
+
+@service_class("search")
+class SearchService(BaseService):
+    @staticmethod
+    def _match_expression(q: str) -> Optional[str]:
+        """
+        Build an FTS5 query matching records that contain every word of ``q``.
+
+        Words are quoted, so FTS5 operators in user input are matched literally.
+        """
+        terms = re.findall(r"\w+", q)
+        if not terms:
+            return None
+        return " ".join(f'"{term}"' for term in terms)
+
+    @service_tool(response_model=List[schemas.SearchResult], read_only=True)
+    def search(self, q: str, offset: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Full-text search over the current user's meetings, notes and tasks, best
+        matches first (highest record id first when the words are too common
+        to rank).
+        """
+        current_user = self._require_user()
+        if self.db.get_bind().dialect.name != "sqlite":
+            raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Search requires SQLite FTS5")
+        match = self._match_expression(q)
+        if match is None:
+            return []
+        matches = self.db.execute(
+            SEARCH_PROBE, {"match": match, "owner_id": current_user.id, "limit": SEARCH_RANK_LIMIT}
+        ).scalar()
+        query = SEARCH_BY_RANK if matches < SEARCH_RANK_LIMIT else SEARCH_BY_ID
+        parameters = {"match": match, "owner_id": current_user.id, "limit": limit, "offset": offset}
+        rows = self.db.execute(query, parameters).mappings()
+        return [{**row, "kind": models.SEARCH_KINDS[row["kind"]]} for row in rows]
+
+
+@service_class("changes")
+class ChangeService(BaseService):
+    # Model and list schema of each entity in the change feed.
+    entities: Dict[str, Tuple[Type[Any], Type[Any]]] = {
+        "meeting": (models.Meeting, schemas.Meeting),
+        "note": (models.Note, schemas.Note),
+        "task": (models.Task, schemas.Task),
+    }
+    loader_plans = {
+        "meeting": (selectinload(models.Meeting.attendees),),
+    }
+
+    @service_tool(response_model=List[schemas.Change], read_only=True)
+    def list_changes(self, since: int = 0, limit: int = CHANGE_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """
+        Rows of the current user changed after cursor since, each once with its latest change, in change order.
+        """
+        current_user = self._require_user()
+        table = models.Change.__table__
+        latest = (
+            select(func.max(table.c.id))
+            .where(table.c.owner_id == current_user.id, table.c.id > since)
+            .group_by(table.c.entity, table.c.entity_id)
+        )
+        statement = (
+            select(table.c.id, table.c.entity, table.c.entity_id, table.c.action, table.c.changed_at)
+            .where(table.c.id.in_(latest))
+            .order_by(table.c.id)
+            .limit(min(limit, CHANGE_PAGE_SIZE))
+        )
+        changes = self.db.execute(statement).mappings().all()
+        changed_ids: Dict[str, List[int]] = defaultdict(list)
+        for change in changes:
+            if change["action"] != "deleted":
+                changed_ids[change["entity"]].append(change["entity_id"])
+        data: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        for entity, ids in changed_ids.items():
+            model, schema = self.entities[entity]
+            rows = self._query(model, plan=entity).filter(model.owner_id == current_user.id, model.id.in_(ids))
+            for row in rows:
+                data[entity, row.id] = schema.model_validate(row).model_dump(mode="json")
+        return [{**change, "data": data.get((change["entity"], change["entity_id"]))} for change in changes]
@@ -1,11 +1,13 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 import database
 import models
+from auth import principal_cache
+from service_mesh import result_cache
 from main import app
 
 
@@ -20,7 +22,7 @@ def engine():
 
 @pytest.fixture(scope="session")
 def SessionLocal(engine):
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return sessionmaker(bind=engine, **database.SESSION_OPTIONS)
 
 
 @pytest.fixture(autouse=True)
@@ -28,6 +30,8 @@ def _db_setup(engine, SessionLocal, monkeypatch):
     monkeypatch.setattr(database, "engine", engine)
     monkeypatch.setattr(database, "SessionLocal", SessionLocal)
     models.Base.metadata.create_all(bind=engine)
+    principal_cache.clear()
+    result_cache.clear()
     yield
     models.Base.metadata.drop_all(bind=engine)
 
@@ -47,6 +51,18 @@ def client(SessionLocal):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture()
+def query_counter(engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture()
 def user(client):
     response = client.post(
@@ -0,0 +1,92 @@
+import json
+
+
+def _changes(client, user_headers, since=0, **params):
+    response = client.get("/changes/", params={"since": since, **params}, headers=user_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_change_feed_returns_latest_change_per_row_since_cursor(client, user_headers, meeting_id):
+    cursor = _changes(client, user_headers)[-1]["id"]
+    note = client.post("/notes/", json={"content": "Decision", "meeting_id": meeting_id}, headers=user_headers).json()
+    task = client.post("/tasks/", json={"title": "Ship it", "due_meeting_id": meeting_id}, headers=user_headers).json()
+    client.put(f"/tasks/{task['id']}", json={"status": "completed"}, headers=user_headers)
+
+    changes = _changes(client, user_headers, since=cursor)
+
+    assert [(change["entity"], change["entity_id"], change["action"]) for change in changes] == [
+        ("note", note["id"], "created"),
+        ("meeting", meeting_id, "updated"),
+        ("task", task["id"], "updated"),
+    ]
+    assert changes[1]["data"]["tasks_count"] == 1
+    assert changes[2]["data"]["status"] == "completed"
+    assert _changes(client, user_headers, since=changes[-1]["id"]) == []
+
+
+def test_change_feed_reports_deletes_and_pages(client, user_headers, meeting_id):
+    task = client.post("/tasks/", json={"title": "Ship it", "due_meeting_id": meeting_id}, headers=user_headers).json()
+    client.delete(f"/tasks/{task['id']}", headers=user_headers)
+
+    response = client.get("/changes/", params={"limit": 1}, headers=user_headers)
+    changes = {(change["entity"], change["entity_id"]): change for change in _changes(client, user_headers)}
+
+    assert response.headers["X-Next-Cursor"] == str(response.json()[0]["id"])
+    assert (changes["task", task["id"]]["action"], changes["task", task["id"]]["data"]) == ("deleted", None)
+
+
+def test_change_feed_logs_meeting_when_task_moves_between_uncounted_statuses(client, user_headers, meeting_id):
+    task = client.post(
+        "/tasks/", json={"title": "Ship it", "status": "in_progress", "due_meeting_id": meeting_id}, headers=user_headers
+    ).json()
+    cursor = _changes(client, user_headers)[-1]["id"]
+
+    client.put(f"/tasks/{task['id']}", json={"status": "blocked"}, headers=user_headers)
+
+    changes = _changes(client, user_headers, since=cursor)
+    assert [(change["entity"], change["entity_id"]) for change in changes] == [
+        ("meeting", meeting_id),
+        ("task", task["id"]),
+    ]
+    assert changes[0]["data"]["tasks_count"] == 1
+
+
+def test_change_feed_logs_meeting_when_a_task_title_changes(client, user_headers, meeting_id):
+    task = client.post("/tasks/", json={"title": "Ship it", "due_meeting_id": meeting_id}, headers=user_headers).json()
+    cursor = _changes(client, user_headers)[-1]["id"]
+
+    client.put(f"/tasks/{task['id']}", json={"title": "Ship it today"}, headers=user_headers)
+
+    changes = _changes(client, user_headers, since=cursor)
+    meeting = client.get(f"/meetings/{meeting_id}", headers=user_headers).json()
+    assert [(change["entity"], change["entity_id"]) for change in changes] == [
+        ("meeting", meeting_id),
+        ("task", task["id"]),
+    ]
+    assert changes[0]["data"]["version"] == meeting["version"]
+
+
+def test_change_feed_is_scoped_to_owner(client, user_headers, meeting_id):
+    other = client.post("/users/", json={"name": "Eva Melo", "email": "eva@example.com"}).json()
+
+    assert _changes(client, {"X-User-Id": str(other["id"])}) == []
+
+
+def test_change_stream_sends_events_after_last_event_id(client, user_headers, meeting_id):
+    first = _changes(client, user_headers)[-1]["id"]
+    note = client.post("/notes/", json={"content": "Decision", "meeting_id": meeting_id}, headers=user_headers).json()
+
+    response = client.get(
+        "/changes/stream",
+        params={"duration": 0},
+        headers={**user_headers, "Last-Event-ID": str(first)},
+    )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.splitlines() for block in response.text.strip().split("\n\n")]
+    assert events[0] == ["retry: 1000"]
+    assert [lines[1] for lines in events[1:]] == ["event: change", "event: change"]
+    payloads = [json.loads(lines[2].removeprefix("data: ")) for lines in events[1:]]
+    assert [(payload["entity"], payload["entity_id"]) for payload in payloads] == [("note", note["id"]), ("meeting", meeting_id)]
+    assert events[-1][0] == f"id: {payloads[-1]['id']}"
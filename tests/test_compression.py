@@ -0,0 +1,72 @@
+import pytest
+
+import pagination
+from compression import negotiate_encoding
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br", "gzip"),
+        ("deflate;q=1, gzip;q=0.5", "deflate"),
+        ("gzip;q=0, *", "deflate"),
+        ("br, identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding_follows_client_preferences(header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+def test_large_responses_are_compressed_as_negotiated(client, user_headers, meeting_id):
+    note = client.post("/notes/", json={"content": "Decision " * 500, "meeting_id": meeting_id}, headers=user_headers)
+    path = f"/notes/{note.json()['id']}"
+
+    identity = client.get(path, headers={**user_headers, "Accept-Encoding": "identity"})
+    gzipped = client.get(path, headers={**user_headers, "Accept-Encoding": "gzip"})
+    deflated = client.get(path, headers={**user_headers, "Accept-Encoding": "gzip;q=0, deflate"})
+    small = client.get("/meetings/", headers={**user_headers, "Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["Vary"] == "Accept-Encoding"
+    assert (gzipped.headers["Content-Encoding"], deflated.headers["Content-Encoding"]) == ("gzip", "deflate")
+    assert int(gzipped.headers["Content-Length"]) < len(identity.content) // 10
+    assert gzipped.json() == deflated.json() == identity.json()
+    assert "content-encoding" not in small.headers
+
+
+def test_compressed_responses_carry_weak_etags_that_still_validate(client, user_headers, meeting_id):
+    note = client.post("/notes/", json={"content": "Decision " * 500, "meeting_id": meeting_id}, headers=user_headers)
+    path = f"/notes/{note.json()['id']}"
+
+    etag = client.get(path, headers={**user_headers, "Accept-Encoding": "gzip"}).headers["ETag"]
+    revalidated = client.get(path, headers={**user_headers, "Accept-Encoding": "gzip", "If-None-Match": etag})
+
+    assert etag == f'W/"note-{note.json()["id"]}-v1"'
+    assert revalidated.status_code == 304
+
+
+def test_long_lists_are_streamed_in_chunks(client, user_headers, meeting_id, monkeypatch):
+    for index in range(4):
+        client.post("/notes/", json={"content": f"Note {index}", "meeting_id": meeting_id}, headers=user_headers)
+    whole = client.get("/notes/", headers=user_headers)
+    whole_page = client.get("/notes/", params={"limit": 3}, headers=user_headers)
+
+    monkeypatch.setattr(pagination, "JSON_CHUNK_ROWS", 2)
+    chunked = client.get("/notes/", headers={**user_headers, "Accept-Encoding": "identity"})
+    chunked_page = client.get("/notes/", params={"limit": 3}, headers=user_headers)
+
+    assert "content-length" not in chunked.headers
+    assert chunked.headers["Content-Type"] == "application/json"
+    assert chunked.content == whole.content
+    assert chunked_page.json() == whole_page.json()
+    assert chunked_page.headers["X-Next-Cursor"] == whole_page.headers["X-Next-Cursor"]
+
+
+def test_event_streams_are_not_compressed(client, user_headers, meeting_id):
+    client.post("/notes/", json={"content": "Decision " * 500, "meeting_id": meeting_id}, headers=user_headers)
+
+    response = client.get("/changes/stream", params={"duration": 0}, headers={**user_headers, "Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Type"].startswith("text/event-stream")
+    assert "content-encoding" not in response.headers
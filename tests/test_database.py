@@ -0,0 +1,174 @@
+import random
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import sessionmaker
+
+import database
+import models
+import schemas
+from service_mesh import ServiceMesh
+from services import MeetingService, NoteService, TaskService
+
+THREADS = 6
+OPERATIONS_PER_THREAD = 40
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _run_mixed_load(session_factory, owner_id, meeting_id):
+    latencies = {"read": [], "write": []}
+    errors = []
+    lock = threading.Lock()
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for index in range(OPERATIONS_PER_THREAD):
+            kind = "write" if rng.random() < 0.3 else "read"
+            db = session_factory()
+            started = time.perf_counter()
+            try:
+                user = db.get(models.User, owner_id)
+                notes = ServiceMesh(user=user, db=db).get_service(NoteService)
+                if kind == "write":
+                    notes.create_note(schemas.NoteCreate(content=f"load {seed}-{index}", meeting_id=meeting_id))
+                else:
+                    # Read through the database rather than the tool result cache.
+                    list(notes.iter_notes(meeting_id=meeting_id, limit=50))
+            except Exception as exc:
+                with lock:
+                    errors.append(exc)
+            finally:
+                db.close()
+            with lock:
+                latencies[kind].append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors
+
+
+@pytest.mark.parametrize("profile", sorted(database.ENGINE_PROFILES))
+def test_mixed_load_per_profile(tmp_path, capsys, profile):
+    engine = database.create_engine_for_profile(f"sqlite:///{tmp_path / 'load.db'}", profile)
+    models.Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, **database.SESSION_OPTIONS)
+    with session_factory() as db:
+        owner = models.User(name="Load Owner", email="load@example.com")
+        db.add(owner)
+        db.flush()
+        owner.owner_id = owner.id
+        meeting = models.Meeting(title="Load", scheduled_time=datetime(2024, 1, 15, 10, 0), owner_id=owner.id)
+        db.add(meeting)
+        db.commit()
+        owner_id, meeting_id = owner.id, meeting.id
+
+    latencies, errors = _run_mixed_load(session_factory, owner_id, meeting_id)
+    engine.dispose()
+
+    with capsys.disabled():
+        for kind, samples in latencies.items():
+            print(
+                f"\n[{profile}] {kind}: n={len(samples)} "
+                f"p50={_percentile(samples, 50) * 1000:.1f}ms p99={_percentile(samples, 99) * 1000:.1f}ms",
+                end="",
+            )
+    assert errors == []
+    with session_factory() as db:
+        written = db.query(models.Note).count()
+    assert written == len(latencies["write"])
+
+
+def test_meeting_counters_stay_exact_under_concurrent_task_writes(tmp_path):
+    engine = database.create_engine_for_profile(f"sqlite:///{tmp_path / 'counters.db'}", "production")
+    models.Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, **database.SESSION_OPTIONS)
+    with session_factory() as db:
+        owner = models.User(name="Counter Owner", email="counters@example.com")
+        db.add(owner)
+        db.flush()
+        owner.owner_id = owner.id
+        meetings = [
+            models.Meeting(title=f"Counters {index}", scheduled_time=datetime(2024, 1, 15, 10, 0), owner_id=owner.id)
+            for index in range(2)
+        ]
+        db.add_all(meetings)
+        db.commit()
+        owner_id, meeting_ids = owner.id, [meeting.id for meeting in meetings]
+    with session_factory() as db:
+        tasks = ServiceMesh(user=db.get(models.User, owner_id), db=db).get_service(TaskService)
+        task_ids = [
+            task.id
+            for task in tasks.create_tasks(
+                [schemas.TaskCreate(title=f"Seed {index}", due_meeting_id=meeting_ids[index % 2]) for index in range(12)]
+            )
+        ]
+    errors = []
+    lock = threading.Lock()
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for index in range(OPERATIONS_PER_THREAD):
+            db = session_factory()
+            try:
+                mesh = ServiceMesh(user=db.get(models.User, owner_id), db=db)
+                tasks = mesh.get_service(TaskService)
+                action = rng.choice(["create", "status", "move", "bulk", "delete", "note"])
+                if action == "create":
+                    tasks.create_task(schemas.TaskCreate(title=f"Task {seed}-{index}", due_meeting_id=rng.choice(meeting_ids)))
+                elif action == "status":
+                    status_value = rng.choice(["pending", "completed", "cancelled"])
+                    tasks.update_task(rng.choice(task_ids), schemas.TaskUpdate(status=status_value))
+                elif action == "move":
+                    tasks.update_task(rng.choice(task_ids), schemas.TaskUpdate(due_meeting_id=rng.choice(meeting_ids)))
+                elif action == "bulk":
+                    tasks.update_task_statuses(rng.sample(task_ids, 3), rng.choice(["pending", "completed"]))
+                elif action == "delete":
+                    tasks.delete_task(rng.choice(task_ids))
+                else:
+                    mesh.get_service(NoteService).create_note(
+                        schemas.NoteCreate(content=f"Note {seed}-{index}", meeting_id=rng.choice(meeting_ids))
+                    )
+            except HTTPException as exc:
+                # Tasks deleted by another thread are expected to be missing.
+                if exc.status_code != 404:
+                    with lock:
+                        errors.append(exc)
+            except Exception as exc:
+                with lock:
+                    errors.append(exc)
+            finally:
+                db.close()
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with session_factory() as db:
+        meetings = ServiceMesh(user=db.get(models.User, owner_id), db=db).get_service(MeetingService)
+        counted = {meeting.id: meeting.tasks_count for meeting in meetings.list_meetings()}
+        assert meetings.repair_counters() == 0
+        assert sum(counted.values()) == db.query(models.Task).count()
+    engine.dispose()
+
+
+def test_pool_sizing_only_applies_to_queue_pools(tmp_path):
+    file_engine = database.create_engine_for_profile(f"sqlite:///{tmp_path / 'pool.db'}", "production")
+    memory_engine = database.create_engine_for_profile("sqlite://", "production")
+
+    assert (file_engine.pool.size(), file_engine.pool._max_overflow) == (40, 60)
+    assert type(memory_engine.pool).__name__ == "SingletonThreadPool"
+    file_engine.dispose()
+    memory_engine.dispose()
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import event, text
+
+INDEXED_TABLES = ("users", "meetings", "notes", "tasks", "meeting_users", "changes")
+
+
+@pytest.fixture()
+def captured_selects(engine):
+    selects = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield selects
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _table_scans(engine, statement, parameters):
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    details = [row[-1] for row in plan]
+    return [
+        detail
+        for detail in details
+        if detail.startswith("SCAN ") and detail.split()[1] in INDEXED_TABLES
+    ]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/users/",
+        "/meetings/",
+        "/notes/?meeting_id={meeting_id}",
+        "/tasks/?meeting_id={meeting_id}&status=pending",
+        "/tasks/?meeting_id={meeting_id}",
+        "/meetings/{meeting_id}",
+        "/meetings/?from=2024-01-01T00:00:00&to=2024-02-01T00:00:00",
+        "/meetings/?attendee_id={second_user_id}",
+        "/meetings/calendar?date=2024-01-15&view=month",
+        "/changes/?since=1",
+    ],
+)
+def test_service_queries_use_indexes(
+        client, engine, user_headers, meeting_id, second_user_id, captured_selects, path
+):
+    client.post("/notes/", json={"content": "Indexed", "meeting_id": meeting_id}, headers=user_headers)
+    client.post("/tasks/", json={"title": "Indexed", "due_meeting_id": meeting_id}, headers=user_headers)
+    captured_selects.clear()
+
+    response = client.get(path.format(meeting_id=meeting_id, second_user_id=second_user_id), headers=user_headers)
+
+    assert response.status_code == 200
+    assert captured_selects
+    for statement, parameters in captured_selects:
+        assert _table_scans(engine, statement, parameters) == [], statement
+
+
+def test_attendee_reverse_lookup_uses_index(engine):
+    with engine.connect() as conn:
+        plan = conn.execute(text("EXPLAIN QUERY PLAN SELECT meeting_id FROM meeting_users WHERE user_id = 1")).all()
+
+    assert any("ix_meeting_users_user_id_meeting_id" in row[-1] for row in plan)
@@ -1,3 +1,15 @@
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+import models
+import schemas
+import services
+from service_mesh import result_cache
+
+
 def test_create_list_get_update_delete_meeting(client, user_headers, meeting_id):
     list_response = client.get("/meetings/", headers=user_headers)
 
@@ -28,4 +40,256 @@ def test_create_list_get_update_delete_meeting(client, user_headers, meeting_id)
     assert delete_response.status_code == 204
 
     missing_response = client.get(f"/meetings/{meeting_id}", headers=user_headers)
-    assert missing_response.status_code == 404
\ No newline at end of file
+    assert missing_response.status_code == 404
+
+
+def _create_meetings(client, user_headers, attendee_id, count):
+    for index in range(count):
+        client.post(
+            "/meetings/",
+            json={
+                "title": f"Meeting {index}",
+                "scheduled_time": "2024-01-15T10:00:00Z",
+                "attendee_ids": [attendee_id],
+            },
+            headers=user_headers,
+        )
+
+
+def test_meeting_reads_issue_constant_query_count(client, user_headers, second_user_id, meeting_id, query_counter):
+    def count_queries(path):
+        result_cache.clear()
+        query_counter.clear()
+        response = client.get(path, headers=user_headers)
+        assert response.status_code == 200
+        return len(query_counter)
+
+    list_small = count_queries("/meetings/")
+    detail_small = count_queries(f"/meetings/{meeting_id}")
+
+    _create_meetings(client, user_headers, second_user_id, 20)
+
+    assert count_queries("/meetings/") == list_small
+    assert count_queries(f"/meetings/{meeting_id}") == detail_small
+
+
+def test_get_meeting_authorizes_once_and_batches_details(client, user_headers, meeting_id, query_counter):
+    client.post("/notes/", json={"content": "Decision", "meeting_id": meeting_id}, headers=user_headers)
+    client.post("/tasks/", json={"title": "Follow up", "due_meeting_id": meeting_id}, headers=user_headers)
+
+    query_counter.clear()
+    response = client.get(f"/meetings/{meeting_id}", headers=user_headers)
+
+    assert response.status_code == 200
+    meeting = response.json()
+    assert [note["content"] for note in meeting["notes"]] == ["Decision"]
+    assert [task["title"] for task in meeting["tasks"]] == ["Follow up"]
+    meeting_lookups = [statement for statement in query_counter if "FROM meetings \nWHERE" in statement]
+    assert len(meeting_lookups) == 1
+
+
+def test_meeting_detail_is_served_from_cache_until_invalidated(client, user_headers, meeting_id, query_counter):
+    client.get(f"/meetings/{meeting_id}", headers=user_headers)
+    query_counter.clear()
+
+    cached = client.get(f"/meetings/{meeting_id}", headers=user_headers)
+
+    assert cached.status_code == 200
+    assert query_counter == []
+
+    client.post("/notes/", json={"content": "Fresh", "meeting_id": meeting_id}, headers=user_headers)
+    refreshed = client.get(f"/meetings/{meeting_id}", headers=user_headers)
+
+    assert [note["content"] for note in refreshed.json()["notes"]] == ["Fresh"]
+
+
+def test_list_meetings_filters_by_time_window_and_attendee(client, user_headers, meeting_id, second_user_id):
+    later = client.post(
+        "/meetings/",
+        json={"title": "Retro", "scheduled_time": "2024-01-19T16:00:00Z", "attendee_ids": []},
+        headers=user_headers,
+    ).json()
+
+    def ids(query):
+        return [meeting["id"] for meeting in client.get(f"/meetings/?{query}", headers=user_headers).json()]
+
+    assert ids("from=2024-01-16T00:00:00&to=2024-01-20T00:00:00") == [later["id"]]
+    assert ids("to=2024-01-15T10:00:00") == []
+    assert ids("from=2024-01-15T10:00:00") == [meeting_id, later["id"]]
+    assert ids(f"attendee_id={second_user_id}") == [meeting_id]
+
+
+def test_calendar_returns_meetings_in_the_week_or_month(client, user_headers, meeting_id):
+    client.post(
+        "/meetings/",
+        json={"title": "Planning", "scheduled_time": "2024-01-22T09:00:00Z", "attendee_ids": []},
+        headers=user_headers,
+    )
+    early = client.post(
+        "/meetings/",
+        json={"title": "Kickoff", "scheduled_time": "2024-01-15T08:00:00Z", "attendee_ids": []},
+        headers=user_headers,
+    ).json()
+
+    week = client.get("/meetings/calendar?date=2024-01-17", headers=user_headers)
+    month = client.get("/meetings/calendar?date=2024-01-17&view=month", headers=user_headers).json()
+
+    assert week.status_code == 200
+    assert week.json() == {
+        "view": "week",
+        "start": "2024-01-15",
+        "end": "2024-01-22",
+        "meetings": [
+            {"id": early["id"], "title": "Kickoff", "scheduled_time": "2024-01-15T08:00:00", "attendee_count": 0},
+            {"id": meeting_id, "title": "Sprint Planning", "scheduled_time": "2024-01-15T10:00:00", "attendee_count": 1},
+        ],
+    }
+    assert (month["start"], month["end"], len(month["meetings"])) == ("2024-01-01", "2024-02-01", 3)
+
+
+def test_meeting_list_includes_note_and_task_counters(client, user_headers, meeting_id):
+    client.post("/notes/", json={"content": "Decision", "meeting_id": meeting_id}, headers=user_headers)
+    task_ids = [
+        client.post("/tasks/", json={"title": f"Task {index}", "due_meeting_id": meeting_id}, headers=user_headers).json()["id"]
+        for index in range(3)
+    ]
+    client.put(f"/tasks/{task_ids[0]}", json={"status": "completed"}, headers=user_headers)
+    client.put(f"/tasks/{task_ids[1]}", json={"status": "cancelled"}, headers=user_headers)
+    client.delete(f"/tasks/{task_ids[2]}", headers=user_headers)
+
+    meeting = client.get("/meetings/", headers=user_headers).json()[0]
+
+    assert {key: value for key, value in meeting.items() if key.endswith("_count")} == {
+        "notes_count": 1,
+        "tasks_count": 2,
+        "pending_tasks_count": 0,
+        "completed_tasks_count": 1,
+        "cancelled_tasks_count": 1,
+    }
+
+
+def test_repair_counters_fixes_drift(client, user_headers, meeting_id, engine):
+    client.post("/tasks/", json={"title": "Follow up", "due_meeting_id": meeting_id}, headers=user_headers)
+    with engine.begin() as conn:
+        conn.execute(models.Meeting.__table__.update().values(tasks_count=7, notes_count=3))
+
+    response = client.post(
+        "/tools/batch", json={"calls": [{"tool": "meetings.repair_counters"}] * 2}, headers=user_headers
+    )
+
+    assert response.json()["results"] == [1, 0]
+    meeting = client.get("/meetings/", headers=user_headers).json()[0]
+    assert (meeting["notes_count"], meeting["tasks_count"], meeting["pending_tasks_count"]) == (0, 1, 1)
+
+
+def test_repair_counters_refreshes_cached_meeting_and_logs_the_change(client, user_headers, meeting_id, engine):
+    client.get(f"/meetings/{meeting_id}", headers=user_headers)
+    with engine.begin() as conn:
+        conn.execute(models.Meeting.__table__.update().values(notes_count=3))
+    cursor = client.get("/changes/", params={"since": 0}, headers=user_headers).json()[-1]["id"]
+
+    client.post("/tools/batch", json={"calls": [{"tool": "meetings.repair_counters"}]}, headers=user_headers)
+
+    with engine.connect() as conn:
+        version = conn.execute(
+            select(models.Meeting.version).where(models.Meeting.id == meeting_id)
+        ).scalar()
+    detail = client.get(f"/meetings/{meeting_id}", headers=user_headers)
+    assert (detail.json()["notes_count"], detail.json()["version"]) == (0, version)
+    assert detail.headers["ETag"] == f'"meeting-{meeting_id}-v{version}"'
+    changes = client.get("/changes/", params={"since": cursor}, headers=user_headers).json()
+    assert [(change["entity"], change["entity_id"], change["action"]) for change in changes] == [
+        ("meeting", meeting_id, "updated"),
+    ]
+
+
+def test_meeting_list_returns_only_selected_fields(client, user_headers, second_user_id, meeting_id, query_counter):
+    query_counter.clear()
+    response = client.get("/meetings/", params={"fields": "title,attendees", "limit": 1}, headers=user_headers)
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "id": meeting_id,
+            "title": "Sprint Planning",
+            "attendees": [{"id": second_user_id, "name": "Joao Souza", "email": "joao@example.com", "version": 1}],
+        }
+    ]
+    assert response.headers["X-Next-Cursor"] == str(meeting_id)
+    meeting_selects = [statement for statement in query_counter if "FROM meetings" in statement]
+    assert len(meeting_selects) == 1
+    assert "description" not in meeting_selects[0]
+
+
+def test_meeting_list_rejects_unknown_fields(client, user_headers, meeting_id):
+    response = client.get("/meetings/", params={"fields": "title,secret"}, headers=user_headers)
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Unknown fields: secret"
+
+
+def test_meeting_list_rejects_fields_the_service_cannot_project(client, user_headers, meeting_id, monkeypatch):
+    monkeypatch.setattr(services.MeetingService, "projected_relationships", ())
+
+    response = client.get("/meetings/", params={"fields": "title,attendees"}, headers=user_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Fields cannot be selected: attendees"
+
+
+def test_meeting_etag_answers_304_after_one_version_check(client, user_headers, second_user_id, meeting_id, query_counter):
+    first = client.get(f"/meetings/{meeting_id}", headers=user_headers)
+    etag = first.headers["ETag"]
+    query_counter.clear()
+
+    unchanged = client.get(f"/meetings/{meeting_id}", headers={**user_headers, "If-None-Match": etag})
+
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["ETag"] == etag
+    assert [statement.split("\n")[0] for statement in query_counter] == ["SELECT meetings.version "]
+
+    seen = {etag}
+    for change in (
+        lambda: client.post("/tasks/", json={"title": "Follow up", "due_meeting_id": meeting_id}, headers=user_headers),
+        lambda: client.put(f"/meetings/{meeting_id}", json={"attendee_ids": []}, headers=user_headers),
+    ):
+        change()
+        changed = client.get(f"/meetings/{meeting_id}", headers={**user_headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] not in seen
+        etag = changed.headers["ETag"]
+        seen.add(etag)
+    assert changed.json()["attendees"] == []
+
+
+def test_meeting_etag_changes_when_a_task_moves_between_uncounted_statuses(client, user_headers, meeting_id):
+    task_id = client.post(
+        "/tasks/", json={"title": "Follow up", "status": "in_progress", "due_meeting_id": meeting_id}, headers=user_headers
+    ).json()["id"]
+    etag = client.get(f"/meetings/{meeting_id}", headers=user_headers).headers["ETag"]
+
+    seen = {etag}
+    for change in (
+        lambda: client.put(f"/tasks/{task_id}", json={"status": "blocked"}, headers=user_headers),
+        lambda: client.put("/tasks/bulk/status", json={"task_ids": [task_id], "status": "review"}, headers=user_headers),
+    ):
+        change()
+        changed = client.get(f"/meetings/{meeting_id}", headers={**user_headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] not in seen
+        etag = changed.headers["ETag"]
+        seen.add(etag)
+    assert changed.json()["tasks"][0]["status"] == "review"
+
+
+def test_meeting_list_rows_match_the_response_schema(client, engine, user_headers, meeting_id):
+    client.post("/tasks/", json={"title": "Follow up", "due_meeting_id": meeting_id}, headers=user_headers)
+    listed = client.get("/meetings/", headers=user_headers).json()
+
+    with Session(engine) as db:
+        meetings = db.query(models.Meeting).order_by(models.Meeting.id).all()
+        adapter = TypeAdapter(List[schemas.Meeting])
+        expected = adapter.dump_python(adapter.validate_python(meetings, from_attributes=True), mode="json")
+
+    assert listed == expected
@@ -1,3 +1,6 @@
+import json
+
+
 def test_create_list_get_note(client, user_headers, meeting_id):
     create_response = client.post(
         "/notes/",
@@ -21,4 +24,79 @@ def test_create_list_get_note(client, user_headers, meeting_id):
     assert get_response.status_code == 200
     fetched = get_response.json()
     assert fetched["id"] == note["id"]
-    assert fetched["content"] == "Discussion notes"
\ No newline at end of file
+    assert fetched["content"] == "Discussion notes"
+
+
+def test_list_notes_keyset_pagination(client, user_headers, meeting_id):
+    note_ids = [
+        client.post(
+            "/notes/",
+            json={"content": f"Note {index}", "meeting_id": meeting_id},
+            headers=user_headers,
+        ).json()["id"]
+        for index in range(5)
+    ]
+
+    first_page = client.get("/notes/?limit=2", headers=user_headers)
+
+    assert [note["id"] for note in first_page.json()] == note_ids[:2]
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = client.get(f"/notes/?limit=2&after_id={cursor}", headers=user_headers)
+
+    assert [note["id"] for note in second_page.json()] == note_ids[2:4]
+
+    last_page = client.get(f"/notes/?limit=2&after_id={second_page.headers['X-Next-Cursor']}", headers=user_headers)
+
+    assert [note["id"] for note in last_page.json()] == note_ids[4:]
+    assert "X-Next-Cursor" not in last_page.headers
+
+
+def test_list_notes_ndjson_stream(client, user_headers, meeting_id):
+    for index in range(3):
+        client.post("/notes/", json={"content": f"Note {index}", "meeting_id": meeting_id}, headers=user_headers)
+
+    response = client.get(f"/notes/?meeting_id={meeting_id}&stream=true", headers=user_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [note["content"] for note in lines] == ["Note 0", "Note 1", "Note 2"]
+
+
+def test_bulk_create_notes(client, user_headers, meeting_id, query_counter):
+    query_counter.clear()
+    response = client.post(
+        "/notes/bulk",
+        json=[{"content": f"Line {index}", "meeting_id": meeting_id} for index in range(50)],
+        headers=user_headers,
+    )
+
+    assert response.status_code == 201
+    created = response.json()
+    assert [note["content"] for note in created] == [f"Line {index}" for index in range(50)]
+    inserts = [statement.split()[2] for statement in query_counter if statement.startswith("INSERT")]
+    assert inserts == ["notes", "changes"]
+
+    listed = client.get(f"/notes/?meeting_id={meeting_id}", headers=user_headers).json()
+    assert [note["id"] for note in listed] == [note["id"] for note in created]
+
+
+def test_bulk_create_notes_rejects_foreign_meeting(client, user_headers, meeting_id):
+    response = client.post(
+        "/notes/bulk",
+        json=[{"content": "ok", "meeting_id": meeting_id}, {"content": "nope", "meeting_id": meeting_id + 100}],
+        headers=user_headers,
+    )
+
+    assert response.status_code == 404
+    assert client.get("/notes/", headers=user_headers).json() == []
+
+
+def test_note_stream_with_selected_fields(client, user_headers, meeting_id):
+    note_id = client.post("/notes/", json={"content": "Decision", "meeting_id": meeting_id}, headers=user_headers).json()["id"]
+
+    response = client.get("/notes/", params={"fields": "meeting_id", "stream": "true"}, headers=user_headers)
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == [{"id": note_id, "meeting_id": meeting_id}]
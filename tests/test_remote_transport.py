@@ -0,0 +1,229 @@
+import json
+import threading
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+import dependencies
+import models
+import schemas
+import service_mesh
+from remote_transport import RemoteServiceTransport
+from routers import tools_router
+from service_mesh import (
+    CircuitBreaker,
+    CompositeServiceTransport,
+    LocalServiceTransport,
+    ServiceMesh,
+    ServiceMeshFactory,
+    ResultCache,
+)
+from services import MeetingService, TaskService
+
+
+@pytest.fixture()
+def remote_mesh(client, user, SessionLocal):
+    transport = RemoteServiceTransport(client=client, services=[TaskService])
+    with SessionLocal() as db:
+        current_user = db.get(models.User, user["id"])
+        yield ServiceMesh(
+            user=current_user,
+            db=db,
+            transport=CompositeServiceTransport([transport, LocalServiceTransport()]),
+        ), transport
+
+
+def test_remote_tools_run_through_the_batch_endpoint(remote_mesh, meeting_id):
+    mesh, transport = remote_mesh
+    tasks = mesh.get_service(TaskService)
+
+    task = tasks.create_task(schemas.TaskCreate(title="Remote", due_meeting_id=meeting_id))
+    updated = tasks.update_task(task.id, schemas.TaskUpdate(status="completed"))
+
+    assert isinstance(task, schemas.Task)
+    assert updated.title == "Remote"
+    assert updated.status == "completed"
+    assert transport.stats() == {"calls": 2, "round_trips": 2}
+    # Services the transport does not host fall back to the local transport.
+    assert isinstance(mesh.get_service(MeetingService), MeetingService)
+
+
+def test_remote_errors_surface_as_http_exceptions(remote_mesh):
+    mesh, _ = remote_mesh
+
+    with pytest.raises(HTTPException) as exc_info:
+        mesh.get_service(TaskService).get_task(999)
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "Task not found"
+
+
+class GatedClient:
+    """
+    Holds the first request until the others have queued behind it.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def post(self, *args, **kwargs):
+        if not self.started.is_set():
+            self.started.set()
+            self.release.wait(5)
+        return self.client.post(*args, **kwargs)
+
+
+def test_concurrent_calls_are_coalesced_and_failures_isolated(client, user_headers, meeting_id):
+    user_id = int(user_headers["X-User-Id"])
+    gate = GatedClient(client)
+    transport = RemoteServiceTransport(client=gate, services=[TaskService])
+    results = {}
+
+    def call(index, arguments, tool="tasks.create_task"):
+        try:
+            results[index] = transport.call(user_id, tool, arguments)
+        except HTTPException as exc:
+            results[index] = exc.status_code
+
+    threads = [threading.Thread(target=call, args=(0, {"task_in": {"title": "Lead", "due_meeting_id": meeting_id}}))]
+    threads += [
+        threading.Thread(target=call, args=(index, {"task_in": {"title": f"Task {index}", "due_meeting_id": meeting_id}}))
+        for index in range(1, 4)
+    ]
+    threads.append(threading.Thread(target=call, args=(4, {"task_id": 999}, "tasks.get_task")))
+    threads[0].start()
+    gate.started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    try:
+        deadline = time.monotonic() + 5
+        while len(transport._pending.get(user_id, [])) < 4:
+            assert time.monotonic() < deadline, "calls did not queue behind the lead call"
+            time.sleep(0.001)
+    finally:
+        gate.release.set()
+        for thread in threads:
+            thread.join(5)
+
+    assert [results[index]["title"] for index in range(4)] == ["Lead", "Task 1", "Task 2", "Task 3"]
+    assert results[4] == 404
+    # One round trip for the lead call, one for the coalesced batch that
+    # failed, then one retry per coalesced call.
+    assert transport.stats() == {"calls": 5, "round_trips": 6}
+    assert len(client.get("/tasks/", headers=user_headers).json()) == 4
+
+
+class UnreachableClient:
+    def __init__(self):
+        self.attempts = 0
+
+    def post(self, *args, **kwargs):
+        self.attempts += 1
+        raise httpx.ConnectError("connection refused")
+
+
+def test_unreachable_remote_is_bypassed_once_its_circuit_opens(user, SessionLocal):
+    unreachable = UnreachableClient()
+    transport = RemoteServiceTransport(
+        client=unreachable,
+        services=[TaskService],
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+    )
+    composite = CompositeServiceTransport([transport, LocalServiceTransport()])
+
+    with SessionLocal() as db:
+        current_user = db.get(models.User, user["id"])
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                ServiceMesh(user=current_user, db=db, transport=composite).get_service(TaskService).list_tasks()
+        tasks = ServiceMesh(user=current_user, db=db, transport=composite).get_service(TaskService).list_tasks()
+
+    assert tasks == []
+    assert unreachable.attempts == 2
+    assert composite.stats()["failovers"] == 1
+
+
+def _remote_app(client):
+    """
+    Another instance of the API over the same database, serving its tools locally.
+    """
+    remote_app = FastAPI()
+    remote_app.include_router(tools_router)
+    remote_app.state.mesh_factory = ServiceMeshFactory()
+    remote_app.dependency_overrides = client.app.dependency_overrides
+    return remote_app
+
+
+class SeparateCacheClient:
+    """
+    Runs each remote request against its own result cache, as a separate process would.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.cache = ResultCache()
+
+    def post(self, *args, **kwargs):
+        local_cache, service_mesh.result_cache = service_mesh.result_cache, self.cache
+        try:
+            return self.client.post(*args, **kwargs)
+        finally:
+            service_mesh.result_cache = local_cache
+
+    def close(self):
+        self.client.close()
+
+
+def test_task_stream_works_when_tasks_are_remote(client, user_headers, meeting_id, monkeypatch):
+    client.post("/tasks/", json={"title": "Follow up", "due_meeting_id": meeting_id}, headers=user_headers)
+    transport = RemoteServiceTransport(client=TestClient(_remote_app(client)), services=[TaskService])
+    monkeypatch.setattr(
+        client.app.state,
+        "mesh_factory",
+        ServiceMeshFactory(CompositeServiceTransport([transport, LocalServiceTransport()])),
+    )
+
+    response = client.get("/tasks/", params={"stream": "true"}, headers=user_headers)
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert [json.loads(line)["title"] for line in response.text.splitlines()] == ["Follow up"]
+    assert transport.stats() == {"calls": 1, "round_trips": 1}
+
+
+@pytest.mark.parametrize("service_name", ["meetings", "users"])
+def test_services_other_services_call_in_process_cannot_be_remote(service_name, monkeypatch):
+    monkeypatch.setattr(dependencies, "REMOTE_SERVICES_URL", "http://meetings.internal:8000")
+    monkeypatch.setattr(dependencies, "REMOTE_SERVICES", [service_name])
+
+    with pytest.raises(ValueError, match="cannot be served remotely"):
+        dependencies.build_service_transport()
+
+
+def test_remote_writes_invalidate_the_callers_cache(client, user_headers, meeting_id, monkeypatch):
+    transport = RemoteServiceTransport(
+        client=SeparateCacheClient(TestClient(_remote_app(client))), services=[TaskService]
+    )
+    monkeypatch.setattr(
+        client.app.state,
+        "mesh_factory",
+        ServiceMeshFactory(CompositeServiceTransport([transport, LocalServiceTransport()])),
+    )
+
+    def counts():
+        meeting = client.get(f"/meetings/{meeting_id}", headers=user_headers).json()
+        return meeting["tasks_count"], meeting["completed_tasks_count"]
+
+    assert counts() == (0, 0)
+    task = client.post("/tasks/", json={"title": "Follow up", "due_meeting_id": meeting_id}, headers=user_headers)
+    assert counts() == (1, 0)
+    # update_task invalidates the meeting's tag from the task row, not from
+    # its arguments, so only the remote side knows it.
+    client.put(f"/tasks/{task.json()['id']}", json={"status": "completed"}, headers=user_headers)
+    assert counts() == (1, 1)
+    assert transport.stats()["calls"] == 2
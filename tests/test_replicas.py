@@ -0,0 +1,105 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+import database
+import models
+import service_mesh
+from main import app
+
+
+@pytest.fixture()
+def replica(tmp_path, client):
+    replica_engine = database.create_engine_for_profile(f"sqlite:///{tmp_path / 'replica.db'}")
+    models.Base.metadata.create_all(bind=replica_engine)
+    ReplicaSession = sessionmaker(bind=replica_engine, **database.SESSION_OPTIONS)
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(replica_engine, "before_cursor_execute", before_cursor_execute)
+
+    def override_get_read_db():
+        db = ReplicaSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[database.get_read_db] = override_get_read_db
+    yield ReplicaSession, statements
+    replica_engine.dispose()
+
+
+def _replicate(ReplicaSession, *rows):
+    with ReplicaSession() as db:
+        for row in rows:
+            db.merge(row)
+        db.commit()
+
+
+def test_reads_route_to_replica_and_writes_to_primary(client, user, user_headers, replica, query_counter):
+    ReplicaSession, replica_statements = replica
+    owner_id = user["id"]
+    _replicate(
+        ReplicaSession,
+        models.User(id=owner_id, name=user["name"], email=user["email"], owner_id=owner_id),
+        models.Meeting(id=1, title="Replicated", scheduled_time=datetime(2024, 1, 15, 10), owner_id=owner_id),
+    )
+    replica_statements.clear()
+    query_counter.clear()
+
+    listed = client.get("/meetings/", headers=user_headers)
+
+    assert [meeting["title"] for meeting in listed.json()] == ["Replicated"]
+    assert any("FROM meetings" in statement for statement in replica_statements)
+    assert not any("FROM meetings" in statement for statement in query_counter)
+
+    replica_statements.clear()
+    query_counter.clear()
+    created = client.post(
+        "/meetings/",
+        json={"title": "Primary only", "scheduled_time": "2024-01-16T10:00:00Z"},
+        headers=user_headers,
+    )
+
+    assert created.status_code == 201
+    assert replica_statements == []
+    assert any(statement.startswith("INSERT INTO meetings") for statement in query_counter)
+
+
+def test_reads_stay_on_primary_right_after_a_write(client, user, user_headers, replica, monkeypatch):
+    ReplicaSession, replica_statements = replica
+    owner_id = user["id"]
+    _replicate(
+        ReplicaSession, models.User(id=owner_id, name=user["name"], email=user["email"], owner_id=owner_id)
+    )
+    client.post(
+        "/meetings/", json={"title": "Not replicated", "scheduled_time": "2024-01-16T10:00:00Z"}, headers=user_headers
+    )
+    replica_statements.clear()
+
+    fresh = client.get("/meetings/", headers=user_headers)
+
+    assert [meeting["title"] for meeting in fresh.json()] == ["Not replicated"]
+    assert replica_statements == []
+
+    monkeypatch.setattr(service_mesh, "READ_YOUR_WRITES_SECONDS", 0)
+    cached = client.get("/meetings/", headers=user_headers)
+    lagging = client.get("/meetings/?limit=10", headers=user_headers)
+
+    assert [meeting["title"] for meeting in cached.json()] == ["Not replicated"]
+    assert lagging.json() == []
+
+
+def test_write_tool_reads_its_own_rows_from_primary(client, user_headers, meeting_id, replica):
+    _, replica_statements = replica
+    replica_statements.clear()
+
+    response = client.post("/notes/", json={"content": "On primary", "meeting_id": meeting_id}, headers=user_headers)
+
+    assert response.status_code == 201
+    assert replica_statements == []
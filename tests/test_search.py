@@ -0,0 +1,101 @@
+import services
+
+
+def test_search_ranks_matches_across_meetings_notes_and_tasks(client, user_headers, meeting_id):
+    note = client.post(
+        "/notes/", json={"content": "We agreed on the quarterly budget.", "meeting_id": meeting_id}, headers=user_headers
+    ).json()
+    task = client.post(
+        "/tasks/", json={"title": "Budget review", "due_meeting_id": meeting_id}, headers=user_headers
+    ).json()
+    client.post("/notes/", json={"content": "Unrelated", "meeting_id": meeting_id}, headers=user_headers)
+
+    response = client.get("/search/?q=budget", headers=user_headers)
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [(result["kind"], result["id"]) for result in results] == [("task", task["id"]), ("note", note["id"])]
+    assert results[1]["snippet"] == "We agreed on the quarterly <mark>budget</mark>."
+    assert all(result["meeting_id"] == meeting_id for result in results)
+
+
+def test_search_index_follows_updates_and_deletes(client, user_headers, meeting_id):
+    task = client.post(
+        "/tasks/", json={"title": "Draft roadmap", "due_meeting_id": meeting_id}, headers=user_headers
+    ).json()
+
+    client.put(f"/tasks/{task['id']}", json={"title": "Draft hiring plan"}, headers=user_headers)
+
+    assert client.get("/search/?q=roadmap", headers=user_headers).json() == []
+    assert [result["id"] for result in client.get("/search/?q=hiring", headers=user_headers).json()] == [task["id"]]
+
+    client.delete(f"/tasks/{task['id']}", headers=user_headers)
+
+    assert client.get("/search/?q=hiring", headers=user_headers).json() == []
+
+
+def test_search_is_owner_scoped_and_paginated(client, user_headers, meeting_id):
+    client.post(
+        "/notes/bulk",
+        json=[{"content": f"Retro item {index}", "meeting_id": meeting_id} for index in range(3)],
+        headers=user_headers,
+    )
+    other = client.post("/users/", json={"name": "Other", "email": "other@example.com"}).json()
+
+    first = client.get("/search/?q=retro&limit=2", headers=user_headers)
+    second = client.get(
+        f"/search/?q=retro&limit=2&offset={first.headers['X-Next-Offset']}", headers=user_headers
+    )
+
+    assert len(first.json()) == 2
+    assert len(second.json()) == 1
+    assert "X-Next-Offset" not in second.headers
+    assert client.get("/search/?q=retro", headers={"X-User-Id": str(other["id"])}).json() == []
+
+
+def test_search_treats_query_syntax_as_words(client, user_headers, meeting_id):
+    client.post("/notes/", json={"content": "NEAR term OR other", "meeting_id": meeting_id}, headers=user_headers)
+
+    response = client.get('/search/?q=NEAR("term" OR', headers=user_headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+def test_search_orders_unselective_queries_by_descending_id(client, user_headers, meeting_id, monkeypatch):
+    monkeypatch.setattr(services, "SEARCH_RANK_LIMIT", 2)
+    notes = client.post(
+        "/notes/bulk",
+        json=[{"content": "status update " * (index + 1), "meeting_id": meeting_id} for index in range(3)],
+        headers=user_headers,
+    ).json()
+
+    results = client.get("/search/?q=status", headers=user_headers).json()
+
+    assert [result["id"] for result in results] == [note["id"] for note in reversed(notes)]
+
+
+def test_search_ranks_when_only_other_owners_match_often(client, user_headers, meeting_id, monkeypatch):
+    monkeypatch.setattr(services, "SEARCH_RANK_LIMIT", 3)
+    other = client.post("/users/", json={"name": "Other", "email": "other@example.com"}).json()
+    other_headers = {"X-User-Id": str(other["id"])}
+    other_meeting = client.post(
+        "/meetings/",
+        json={"title": "Other", "scheduled_time": "2024-01-15T10:00:00Z", "attendee_ids": []},
+        headers=other_headers,
+    ).json()
+    client.post(
+        "/notes/bulk",
+        json=[{"content": "status", "meeting_id": other_meeting["id"]} for _ in range(3)],
+        headers=other_headers,
+    )
+    best = client.post(
+        "/notes/", json={"content": "status status status", "meeting_id": meeting_id}, headers=user_headers
+    ).json()
+    client.post(
+        "/notes/", json={"content": "status update for the weekly sync", "meeting_id": meeting_id}, headers=user_headers
+    )
+
+    results = client.get("/search/?q=status", headers=user_headers).json()
+
+    assert results[0]["id"] == best["id"]
@@ -0,0 +1,156 @@
+import models
+from service_mesh import (
+    CircuitBreaker,
+    CompositeServiceTransport,
+    LocalServiceTransport,
+    ResultCache,
+    ServiceMesh,
+    ServiceMeshFactory,
+)
+from services import NoteService
+
+
+def test_result_cache_evicts_least_recently_used_entries():
+    cache = ResultCache(max_entries=2)
+    cache.put((1, "tool", "a"), "A", 1, ["tag"], cache.generation(1))
+    cache.put((1, "tool", "b"), "B", 1, ["tag"], cache.generation(1))
+    cache.get((1, "tool", "a"))
+
+    cache.put((1, "tool", "c"), "C", 1, ["tag"], cache.generation(1))
+
+    assert cache.get((1, "tool", "a")) == (True, "A")
+    assert cache.get((1, "tool", "b")) == (False, None)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_result_cache_respects_memory_bound():
+    cache = ResultCache(max_bytes=10)
+    cache.put((1, "tool", "a"), "A", 6, [], cache.generation(1))
+    cache.put((1, "tool", "b"), "B", 6, [], cache.generation(1))
+
+    assert cache.stats()["bytes"] == 6
+    assert cache.get((1, "tool", "b")) == (True, "B")
+
+
+def test_result_cache_invalidates_only_matching_user_and_tag():
+    cache = ResultCache()
+    cache.put((1, "tool", "a"), "A", 1, ["meeting:1"], cache.generation(1))
+    cache.put((1, "tool", "b"), "B", 1, ["meeting:2"], cache.generation(1))
+    cache.put((2, "tool", "a"), "A2", 1, ["meeting:1"], cache.generation(2))
+
+    cache.invalidate(1, ["meeting:1"])
+
+    assert cache.get((1, "tool", "a")) == (False, None)
+    assert cache.get((1, "tool", "b")) == (True, "B")
+    assert cache.get((2, "tool", "a")) == (True, "A2")
+
+
+def test_result_cache_skips_results_computed_across_an_invalidation():
+    cache = ResultCache()
+    generation = cache.generation(1)
+    cache.invalidate(1, ["tasks"])
+
+    cache.put((1, "tool", "a"), "stale", 1, ["tasks"], generation)
+
+    assert cache.get((1, "tool", "a")) == (False, None)
+
+
+def test_get_tools_binds_registry_without_resolving_services():
+    resolved = []
+
+    class RecordingTransport:
+        def get_service(self, service_cls, mesh):
+            resolved.append(service_cls)
+            return LocalServiceTransport().get_service(service_cls, mesh)
+
+    tools = {tool.name: tool for tool in ServiceMesh(user=None, db=None, transport=RecordingTransport()).get_tools()}
+
+    assert resolved == []
+    assert "notes.create_note" in tools
+    assert tools["notes.create_note"].parameters["required"] == ["note_in"]
+    assert tools["notes.create_note"].parameters["$defs"]["NoteCreate"]["required"] == ["content", "meeting_id"]
+    assert tools["tasks.list_tasks"].parameters["properties"]["status_filter"]["default"] is None
+
+
+def test_bound_tool_calls_through_the_mesh(client, user, SessionLocal):
+    with SessionLocal() as db:
+        current_user = db.get(models.User, user["id"])
+        tools = {tool.name: tool for tool in ServiceMesh(user=current_user, db=db).get_tools()}
+
+        users = tools["users.list_users"].callable()
+
+    assert [listed.id for listed in users] == [user["id"]]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_breaker_opens_and_recovers_after_a_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=5, clock=clock)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    clock.now = 5
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success(0.01)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()["trips"] == 1
+
+
+class FailingTransport:
+    def __init__(self):
+        self.attempts = 0
+
+    def get_service(self, service_cls, mesh):
+        self.attempts += 1
+        raise ConnectionError("backend down")
+
+
+class NotHostingTransport:
+    def __init__(self):
+        self.attempts = 0
+
+    def get_service(self, service_cls, mesh):
+        self.attempts += 1
+        raise LookupError(service_cls.__name__)
+
+
+def test_composite_transport_skips_open_circuits_and_non_hosting_transports():
+    failing, not_hosting = FailingTransport(), NotHostingTransport()
+    composite = CompositeServiceTransport(
+        [not_hosting, failing, LocalServiceTransport()], failure_threshold=2, reset_timeout=60
+    )
+
+    for _ in range(5):
+        service = composite.get_service(NoteService, ServiceMesh(user=None, db=None))
+
+    assert isinstance(service, NoteService)
+    assert not_hosting.attempts == 1
+    assert failing.attempts == 2
+    stats = composite.stats()
+    assert stats["failovers"] == 5
+    assert stats["skips"] == 3
+    assert [transport["state"] for transport in stats["transports"]] == ["closed", "open", "closed"]
+
+
+def test_mesh_factory_shares_one_transport_chain():
+    transport = CompositeServiceTransport([LocalServiceTransport()])
+    factory = ServiceMeshFactory(transport)
+
+    first, second = factory(None, None), factory(None, None)
+
+    assert first._transport is second._transport is transport
+    assert not hasattr(first, "__dict__")
+    assert first.get_service(NoteService) is first.get_service(NoteService)
+    assert first.get_service(NoteService) is not second.get_service(NoteService)
@@ -35,4 +35,64 @@ def test_create_list_update_delete_task(client, user_headers, meeting_id):
     assert delete_response.status_code == 204
 
     missing_response = client.get(f"/tasks/{task['id']}", headers=user_headers)
-    assert missing_response.status_code == 404
\ No newline at end of file
+    assert missing_response.status_code == 404
+
+
+def test_task_update_invalidates_cached_status_filter(client, user_headers, meeting_id):
+    task = client.post(
+        "/tasks/",
+        json={"title": "Review", "due_meeting_id": meeting_id},
+        headers=user_headers,
+    ).json()
+    assert [item["id"] for item in client.get("/tasks/?status=pending", headers=user_headers).json()] == [task["id"]]
+
+    client.put(f"/tasks/{task['id']}", json={"status": "completed"}, headers=user_headers)
+
+    assert client.get("/tasks/?status=pending", headers=user_headers).json() == []
+    assert client.get(f"/meetings/{meeting_id}", headers=user_headers).json()["tasks"][0]["status"] == "completed"
+
+
+def test_bulk_create_and_update_task_statuses(client, user_headers, meeting_id):
+    created = client.post(
+        "/tasks/bulk",
+        json=[{"title": f"Task {index}", "due_meeting_id": meeting_id} for index in range(3)],
+        headers=user_headers,
+    )
+
+    assert created.status_code == 201
+    task_ids = [task["id"] for task in created.json()]
+
+    updated = client.put(
+        "/tasks/bulk/status",
+        json={"task_ids": task_ids[:2], "status": "completed"},
+        headers=user_headers,
+    )
+
+    assert updated.status_code == 200
+    assert [task["status"] for task in updated.json()] == ["completed", "completed"]
+    pending = client.get("/tasks/?status=pending", headers=user_headers).json()
+    assert [task["id"] for task in pending] == task_ids[2:]
+
+    missing = client.put(
+        "/tasks/bulk/status",
+        json={"task_ids": [task_ids[2], 9999], "status": "cancelled"},
+        headers=user_headers,
+    )
+
+    assert missing.status_code == 404
+    assert client.get(f"/tasks/{task_ids[2]}", headers=user_headers).json()["status"] == "pending"
+
+
+def test_task_etag_changes_with_every_update(client, user_headers, meeting_id):
+    task_id = client.post("/tasks/", json={"title": "Draft", "due_meeting_id": meeting_id}, headers=user_headers).json()["id"]
+    etag = client.get(f"/tasks/{task_id}", headers=user_headers).headers["ETag"]
+
+    assert client.get(f"/tasks/{task_id}", headers={**user_headers, "If-None-Match": f"W/{etag}"}).status_code == 304
+
+    for update in ({"title": "Final"}, {"status": "completed"}):
+        updated = client.put(f"/tasks/{task_id}", json=update, headers=user_headers).json()
+        response = client.get(f"/tasks/{task_id}", headers={**user_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["version"] == updated["version"]
+        assert response.headers["ETag"] != etag
+        etag = response.headers["ETag"]
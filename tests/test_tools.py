@@ -0,0 +1,65 @@
+def test_list_tools_exposes_argument_and_result_schemas(client):
+    response = client.get("/tools/")
+
+    assert response.status_code == 200
+    tools = {tool["name"]: tool for tool in response.json()}
+    assert tools["notes.create_note"]["parameters"]["required"] == ["note_in"]
+    assert tools["notes.create_note"]["returns"]["title"] == "Note"
+    assert tools["notes.create_note"]["read_only"] is False
+    assert tools["meetings.get_meeting"]["read_only"] is True
+    assert tools["meetings.delete_meeting"]["returns"] is None
+
+
+def test_batch_runs_calls_in_one_transaction(client, user_headers, meeting_id, query_counter):
+    response = client.post(
+        "/tools/batch",
+        json={
+            "calls": [
+                {"tool": "notes.create_note", "arguments": {"note_in": {"content": "Agenda", "meeting_id": meeting_id}}},
+                {"tool": "tasks.create_task", "arguments": {"task_in": {"title": "Follow up", "due_meeting_id": meeting_id}}},
+                {"tool": "meetings.get_meeting", "arguments": {"meeting_id": meeting_id}},
+            ]
+        },
+        headers=user_headers,
+    )
+
+    assert response.status_code == 200
+    note, task, meeting = response.json()["results"]
+    assert note["content"] == "Agenda"
+    assert task["status"] == "pending"
+    assert [n["id"] for n in meeting["notes"]] == [note["id"]]
+    assert [t["id"] for t in meeting["tasks"]] == [task["id"]]
+    # The meeting is authorized (loaded with its owner) once for the whole batch.
+    assert sum("meetings.owner_id AS" in statement for statement in query_counter) == 1
+    assert meeting["notes_count"] == 1 and meeting["tasks_count"] == 1
+
+
+def test_batch_failure_rolls_back_every_call(client, user_headers, meeting_id):
+    response = client.post(
+        "/tools/batch",
+        json={
+            "calls": [
+                {"tool": "notes.create_note", "arguments": {"note_in": {"content": "Lost", "meeting_id": meeting_id}}},
+                {"tool": "notes.get_note", "arguments": {"note_id": 999}},
+            ]
+        },
+        headers=user_headers,
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == {"index": 1, "tool": "notes.get_note", "detail": "Note not found"}
+    assert client.get(f"/notes/?meeting_id={meeting_id}", headers=user_headers).json() == []
+
+
+def test_batch_reports_unknown_tools_and_invalid_arguments(client, user_headers):
+    unknown = client.post("/tools/batch", json={"calls": [{"tool": "notes.drop_all"}]}, headers=user_headers)
+    invalid = client.post(
+        "/tools/batch",
+        json={"calls": [{"tool": "notes.get_note", "arguments": {"note_id": "abc"}}]},
+        headers=user_headers,
+    )
+
+    assert unknown.status_code == 404
+    assert unknown.json()["detail"]["tool"] == "notes.drop_all"
+    assert invalid.status_code == 422
+    assert invalid.json()["detail"]["detail"][0]["loc"] == ["note_id"]
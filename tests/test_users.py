@@ -30,4 +30,36 @@ def test_list_and_get_user(client, user, user_headers):
     assert get_response.status_code == 200
     fetched = get_response.json()
     assert fetched["id"] == user["id"]
-    assert fetched["email"] == user["email"]
\ No newline at end of file
+    assert fetched["email"] == user["email"]
+
+
+def test_unknown_user_is_rejected(client):
+    response = client.get("/users/", headers={"X-User-Id": "999"})
+
+    assert response.status_code == 401
+
+
+def test_authenticated_principal_is_cached(client, user, user_headers, query_counter):
+    client.get("/users/", headers=user_headers)
+    query_counter.clear()
+
+    response = client.get(f"/users/{user['id']}", headers=user_headers)
+
+    assert response.status_code == 200
+    assert response.json()["id"] == user["id"]
+    assert len(query_counter) == 1
+    metrics = client.get("/metrics/").json()["auth_cache"]
+    assert metrics["hits"] >= 1
+    assert metrics["misses"] >= 1
+
+
+def test_bulk_create_users(client, user, user_headers):
+    response = client.post(
+        "/users/bulk",
+        json=[{"name": f"User {index}", "email": f"user{index}@example.com"} for index in range(3)],
+        headers=user_headers,
+    )
+
+    assert response.status_code == 201
+    assert [created["email"] for created in response.json()] == [f"user{index}@example.com" for index in range(3)]
+    assert len(client.get("/users/", headers=user_headers).json()) == 4
@@ -0,0 +1,56 @@
+import pytest
+
+
+@pytest.fixture()
+def task_id(client, user_headers, meeting_id):
+    response = client.post("/tasks/", json={"title": "Follow up", "due_meeting_id": meeting_id}, headers=user_headers)
+    return response.json()["id"]
+
+
+def _statements(query_counter):
+    return [statement.split()[0] for statement in query_counter]
+
+
+def test_self_registration_inserts_then_sets_owner_in_one_transaction(client, query_counter):
+    response = client.post("/users/", json={"name": "Ana Lima", "email": "ana@example.com"})
+
+    assert response.status_code == 201
+    assert response.json()["id"]
+    assert _statements(query_counter) == ["INSERT", "UPDATE"]
+
+
+@pytest.mark.parametrize(
+    "method, path, body, expected",
+    [
+        ("POST", "/users/", {"name": "Ana Lima", "email": "ana@example.com"}, ["INSERT"]),
+        (
+            "POST",
+            "/meetings/",
+            {"title": "Retro", "scheduled_time": "2024-01-15T10:00:00Z", "attendee_ids": ["{second_user_id}"]},
+            ["SELECT", "INSERT", "INSERT", "INSERT"],
+        ),
+        ("POST", "/notes/", {"content": "Decision", "meeting_id": "{meeting_id}"}, ["SELECT", "INSERT", "UPDATE", "INSERT"]),
+        ("POST", "/tasks/", {"title": "Ship it", "due_meeting_id": "{meeting_id}"}, ["SELECT", "INSERT", "UPDATE", "INSERT"]),
+        ("PUT", "/tasks/{task_id}", {"status": "completed"}, ["SELECT", "UPDATE", "UPDATE", "INSERT"]),
+        ("DELETE", "/tasks/{task_id}", None, ["DELETE", "UPDATE", "INSERT"]),
+    ],
+)
+def test_write_endpoint_statement_counts(
+        client, user_headers, second_user_id, meeting_id, task_id, query_counter, method, path, body, expected
+):
+    ids = {"second_user_id": second_user_id, "meeting_id": meeting_id, "task_id": task_id}
+
+    def fill(value):
+        if isinstance(value, dict):
+            return {key: fill(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [fill(item) for item in value]
+        if isinstance(value, str) and value.startswith("{"):
+            return int(value.format(**ids))
+        return value
+
+    query_counter.clear()
+    response = client.request(method, path.format(**ids), json=fill(body), headers=user_headers)
+
+    assert response.status_code < 300
+    assert _statements(query_counter) == expected